@@ -0,0 +1,96 @@
+import numpy as np
+
+
+def barycentric_weights(x, chunk_size=1024):
+    """
+    Menghitung bobot barycentric untuk node sembarang x (O(n^2), tervektorisasi):
+        w_j = 1 / prod_{k != j} (x_j - x_k)
+
+    Produk dihitung dalam bentuk log |.| ditambah tanda agar tidak overflow/underflow
+    untuk n besar, lalu semua bobot diskalakan dengan faktor yang sama
+    (rumus barycentric bentuk kedua tidak berubah oleh skala bersama).
+    Baris matriks selisih diproses per chunk sebanyak chunk_size baris
+    sehingga memori kerja O(chunk_size * n), bukan O(n^2).
+    """
+    x = np.asarray(x, dtype=float).ravel()
+    n = x.size
+    log_w = np.empty(n, dtype=float)        # -sum log|x_j - x_k|
+    negative = np.empty(n, dtype=bool)      # Tanda produk (True jika negatif)
+    for start in range(0, n, max(1, int(chunk_size))):
+        stop = min(start + max(1, int(chunk_size)), n)
+        D = x[start:stop, None] - x[None, :]  # Selisih x_j - x_k untuk chunk baris ini
+        rows = np.arange(stop - start)
+        D[rows, rows + start] = 1.0         # Abaikan suku k = j
+        if np.any(D == 0):
+            raise ValueError("Duplicate nodes.")
+        log_w[start:stop] = -np.sum(np.log(np.abs(D)), axis=1)
+        negative[start:stop] = np.count_nonzero(D < 0, axis=1) % 2 == 1
+    w = np.exp(log_w - log_w.max())         # Skala bersama: bobot terbesar = 1
+    w[negative] *= -1.0
+    return w
+
+
+def chebyshev_weights(n, kind=1):
+    """
+    Bobot barycentric bentuk tertutup (O(1) per bobot) untuk node Chebyshev.
+    - kind=1 : node Chebyshev jenis pertama x_j = cos((2j+1)π / (2n)), j = 0..n-1
+               (node "chebyshev" di eksperimen), w_j = (-1)^j sin((2j+1)π / (2n))
+    - kind=2 : titik ekstrem Chebyshev x_j = cos(jπ / (n-1)), j = 0..n-1,
+               w_j = (-1)^j, dengan w_0 dan w_{n-1} dikali 1/2
+    """
+    j = np.arange(n)
+    sign = np.where(j % 2 == 0, 1.0, -1.0)  # (-1)^j
+    if kind == 1:
+        return sign * np.sin((2 * j + 1) * np.pi / (2 * n))
+    if kind == 2:
+        w = sign.copy()
+        w[[0, -1]] *= 0.5
+        return w
+    raise ValueError("kind must be 1 or 2.")
+
+
+def _as_trailing(v, f):
+    """Ubah penyebut (k,) agar bisa di-broadcast terhadap hasil (k,) atau (k, m)."""
+    return v.reshape((-1,) + (1,) * (f.ndim - 1))
+
+
+class BarycentricInterpolant:
+    """
+    Interpolasi polinomial dengan rumus barycentric bentuk kedua:
+        p(t) = sum_j (w_j f_j / (t - x_j)) / sum_j (w_j / (t - x_j))
+
+    Tidak ada sistem Vandermonde yang diselesaikan: setelah bobot diketahui,
+    evaluasi hanya O(n) per titik dan stabil untuk n besar (misalnya n=1000+
+    pada node Chebyshev). Evaluasi dilakukan per batch titik sebagai
+    perkalian matriks-vektor. f boleh berupa (n,) atau (n, m) untuk
+    beberapa fungsi pada node yang sama.
+
+    Cara pakai:
+        p = BarycentricInterpolant(x, f)                          # bobot O(n^2)
+        p = BarycentricInterpolant(x, f, w=chebyshev_weights(n))  # bobot bentuk tertutup
+        y = p(t)
+    """
+
+    def __init__(self, x, f, w=None, max_block_elems=1 << 20):
+        self.x = np.asarray(x, dtype=float).ravel()
+        self.f = np.asarray(f, dtype=float)
+        if self.f.shape[0] != self.x.size:
+            raise ValueError("Values must have one row per node.")
+        self.w = barycentric_weights(self.x) if w is None else np.asarray(w, dtype=float).ravel()
+        self.max_block_elems = max(1, int(max_block_elems))  # Batas ukuran blok (titik × node)
+
+    def __call__(self, t):
+        t = np.asarray(t, dtype=float)
+        t_flat = t.reshape(-1)
+        out = np.empty((t_flat.size,) + self.f.shape[1:], dtype=float)
+        step = max(1, self.max_block_elems // max(1, self.x.size))  # Titik per blok
+        for start in range(0, t_flat.size, step):
+            tc = t_flat[start:start + step]
+            D = tc[:, None] - self.x[None, :]   # Selisih t - x_j untuk blok ini
+            hit_rows, hit_cols = np.nonzero(D == 0)  # Titik yang tepat sama dengan node
+            D[hit_rows, hit_cols] = 1.0
+            C = self.w / D                      # w_j / (t - x_j)
+            vals = (C @ self.f) / _as_trailing(C.sum(axis=1), self.f)
+            vals[hit_rows] = self.f[hit_cols]   # Di node: nilai data persis
+            out[start:start + tc.size] = vals
+        return out.reshape(t.shape + self.f.shape[1:])
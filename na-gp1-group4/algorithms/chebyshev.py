@@ -0,0 +1,94 @@
+import numpy as np
+
+
+def _dct2(f):
+    """
+    DCT-II sepanjang sumbu 0 lewat satu FFT berukuran n (algoritma Makhoul), O(n log n):
+        X_k = sum_j f_j cos(π k (2j+1) / (2n))
+    """
+    n = f.shape[0]
+    v = np.concatenate([f[0::2], f[1::2][::-1]], axis=0)  # Urutan genap lalu ganjil terbalik
+    V = np.fft.fft(v, axis=0)
+    phase = np.exp(-0.5j * np.pi * np.arange(n) / n)       # exp(-iπk / (2n))
+    return (phase.reshape((-1,) + (1,) * (f.ndim - 1)) * V).real
+
+
+def chebyshev_coefficients(f):
+    """
+    Menghitung koefisien basis Chebyshev dari nilai f pada node Chebyshev jenis pertama
+    x_j = cos((2j+1)π / (2n)), j = 0..n-1 (urutan yang sama dengan node "chebyshev"
+    di eksperimen), sehingga
+        p(x) = sum_k c_k T_k(x)
+    menginterpolasi f. Cukup satu DCT-II: O(n log n), tanpa sistem Vandermonde.
+    f boleh berupa (n,) atau (n, m).
+    """
+    f = np.asarray(f, dtype=float)
+    n = f.shape[0]
+    c = _dct2(f) * (2.0 / n)
+    c[0] *= 0.5                             # Suku T_0 memakai bobot 1/n
+    return c
+
+
+def clenshaw(c, t, out=None):
+    """
+    Evaluasi p(t) = sum_k c_k T_k(t) dengan rekursi Clenshaw, tervektorisasi atas semua titik t:
+        b_k = c_k + 2t b_{k+1} - b_{k+2},  p(t) = c_0 + t b_1 - b_2
+    Tiga buffer dipakai bergantian sehingga tidak ada alokasi per langkah.
+    """
+    c = np.asarray(c, dtype=float)
+    t = np.asarray(t, dtype=float)
+    shape = t.shape + c.shape[1:]
+    tt = t.reshape(t.shape + (1,) * (c.ndim - 1))  # Siap broadcast untuk c berukuran (n, m)
+    b1 = np.zeros(shape)                    # b_{k+1}
+    b2 = np.zeros(shape)                    # b_{k+2}
+    scratch = np.empty(shape)
+    two_t = 2.0 * tt
+    for k in range(c.shape[0] - 1, 0, -1):
+        np.multiply(two_t, b1, out=scratch)
+        scratch -= b2
+        scratch += c[k]                     # scratch = b_k
+        b1, b2, scratch = scratch, b1, b2   # Geser buffer: (b_k, b_{k+1})
+    if out is None:
+        out = np.empty(shape)
+    np.multiply(tt, b1, out=out)
+    out -= b2
+    out += c[0]
+    return out
+
+
+def chebyshev_to_monomial(c):
+    """Konversi koefisien Chebyshev ke koefisien monomial [c0, c1, ...] (hanya untuk perbandingan, O(n^2))."""
+    return np.polynomial.chebyshev.cheb2poly(np.asarray(c, dtype=float))
+
+
+class ChebyshevInterpolant:
+    """
+    Interpolasi pada node Chebyshev jenis pertama dalam basis Chebyshev.
+    Koefisien dihitung dengan satu DCT (O(n log n)) dan evaluasi memakai
+    Clenshaw (O(n) per titik), diproses per chunk titik agar memori terbatas.
+
+    Cara pakai:
+        p = ChebyshevInterpolant(f)   # f = nilai pada chebyshev_nodes(n)
+        y = p(t)
+        a = p.to_monomial()           # opsional, untuk dibandingkan dengan solver Vandermonde
+    """
+
+    def __init__(self, f, chunk_size=1 << 16):
+        self.coef = chebyshev_coefficients(f)
+        self.chunk_size = max(1, int(chunk_size))
+
+    @property
+    def degree(self):
+        return self.coef.shape[0] - 1       # Derajat polinomial
+
+    def __call__(self, t):
+        t = np.asarray(t, dtype=float)
+        t_flat = t.reshape(-1)
+        out = np.empty((t_flat.size,) + self.coef.shape[1:])
+        for start in range(0, t_flat.size, self.chunk_size):
+            stop = min(start + self.chunk_size, t_flat.size)
+            clenshaw(self.coef, t_flat[start:stop], out=out[start:stop])
+        return out.reshape(t.shape + self.coef.shape[1:])
+
+    def to_monomial(self):
+        return chebyshev_to_monomial(self.coef)
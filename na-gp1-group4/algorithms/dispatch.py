@@ -0,0 +1,234 @@
+import warnings
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+
+from algorithms.registry import InterpolationProblem, get_solver
+from algorithms.vandermonde import VandermondeOperator, solve_vandermonde_bjorck_pereyra
+from utils import profiling
+from utils.builders import leja_order, make_nodes
+from utils.metrics import vandermonde_inverse_bounds
+
+# Satu pintu masuk interpolasi: interpolate(x, f, tol) memilih solver tercepat yang
+# memenuhi target akurasi, lalu memverifikasinya dengan residual di node:
+#     ||p(x_i) - f_i||_inf <= tol * ||f||_inf
+# Jika pemeriksaan gagal, jalur berikutnya (lebih stabil, biasanya lebih mahal) dicoba.
+#
+# Jalur basis monomial, dari yang termurah:
+#   bjorck-pereyra       O(n^2) pada urutan node yang diberikan
+#   bjorck-pereyra-leja  O(n^2) pada urutan Leja (jauh lebih stabil untuk node tidak terurut
+#                        atau berkelompok; permutasi ikut di-cache)
+#   lu                   O(n^3), pivot parsial (backward stable), n <= max_n solver LU
+# Newton/DivDiff tidak dipakai: biayanya sama dengan Björck–Pereyra tetapi kurang stabil.
+# Subproduct tree tidak dipakai: node di sini real, dan untuk node real pohon tidak stabil
+# (fast_interpolate jatuh ke Björck–Pereyra).
+#
+# Jalur interpolant (output="interpolant"): chebyshev-dct (node Chebyshev bawaan, O(n log n))
+# lalu barycentric (stabil untuk semua node).
+#
+# Keputusan (klasifikasi node, batas kondisi, urutan jalur) di-cache per himpunan node. Urutan
+# jalur tidak diubah oleh hasil satu panggilan: residual bergantung pada f, sedangkan kunci
+# cache tidak, jadi jalur fallback ditelusuri ulang di setiap panggilan.
+
+CLUSTER_RATIO = 1e-2        # min gap / rata-rata gap di bawah ini → node dianggap berkelompok
+CACHE_SIZE = 128            # Banyaknya himpunan node yang keputusannya disimpan (LRU)
+
+
+@dataclass(frozen=True)
+class NodeProfile:
+    """
+    Klasifikasi himpunan node.
+
+    - order     : "ascending", "descending" atau "unsorted"
+    - kind      : keluarga bawaan persis di [-1, 1] ("chebyshev", "chebyshev-extrema",
+                  "equispaced"), "clustered" atau "general"
+    - builtin   : True jika x sama persis dengan make_nodes(kind, n) (termasuk urutannya)
+    - gap_ratio : jarak tetangga terkecil / rata-rata jarak
+    - inv_bounds: batas Gautschi (bawah, atas) untuk ||V⁻¹||₁
+    """
+    n: int
+    order: str
+    kind: str
+    builtin: bool
+    gap_ratio: float
+    inv_bounds: tuple
+
+
+@dataclass
+class DispatchReport:
+    """
+    Laporan keputusan interpolate().
+
+    - path     : jalur yang hasilnya dikembalikan
+    - attempts : [(jalur, residual relatif), ...] sesuai urutan percobaan
+                 (residual inf jika jalur gagal dengan ValueError)
+    - errors   : {jalur: pesan ValueError} untuk jalur yang gagal
+    - residual : residual relatif di node dari hasil yang dikembalikan
+    - met_tol  : True jika residual <= tol
+    - cached   : True jika klasifikasi dan urutan jalur diambil dari cache keputusan
+    """
+    path: str
+    profile: NodeProfile
+    residual: float
+    met_tol: bool
+    attempts: list = field(default_factory=list)
+    cached: bool = False
+    errors: dict = field(default_factory=dict)
+
+
+@dataclass
+class _Decision:
+    profile: NodeProfile
+    paths: tuple                            # Urutan jalur kandidat (tidak berubah setelah dibuat)
+    leja: Optional[np.ndarray] = None       # Permutasi Leja (dihitung saat pertama kali dipakai)
+
+
+_decisions = OrderedDict()                  # Cache keputusan: (x, tol, output) → _Decision
+
+
+def clear_dispatch_cache():
+    """Mengosongkan cache keputusan interpolate()."""
+    _decisions.clear()
+
+
+def classify_nodes(x):
+    """Klasifikasi node (urutan, keluarga, pengelompokan) dan batas kondisi, lihat NodeProfile."""
+    x = np.asarray(x, dtype=float).ravel()
+    n = x.size
+    steps = np.diff(x)
+    order = "ascending" if np.all(steps > 0) else "descending" if np.all(steps < 0) else "unsorted"
+    xs = np.sort(x)
+    gaps = np.diff(xs)
+    if n > 1 and gaps.min() == 0:
+        raise ValueError("Duplicate nodes.")
+    gap_ratio = float(gaps.min() / gaps.mean()) if n > 2 else 1.0
+
+    kind, builtin = None, False
+    for family in ("chebyshev", "chebyshev-extrema", "equispaced"):
+        ref = make_nodes(family, n)
+        if np.allclose(xs, np.sort(ref), rtol=0.0, atol=1e-13):
+            kind, builtin = family, bool(np.allclose(x, ref, rtol=0.0, atol=1e-13))
+            break
+    if kind is None:
+        kind = "clustered" if gap_ratio < CLUSTER_RATIO else "general"
+
+    closed_form = kind if kind in ("chebyshev", "chebyshev-extrema", "equispaced") else None
+    return NodeProfile(n, order, kind, builtin, gap_ratio, vandermonde_inverse_bounds(x, closed_form))
+
+
+def _candidate_paths(profile, tol, output):
+    """
+    Urutan jalur dari yang termurah. Batas atas Gautschi memperkirakan residual terburuk di
+    basis monomial (~ u ||V⁻¹||₁): hanya jika batas ini sudah <= tol jalur yang kurang stabil
+    (Björck–Pereyra pada urutan asli) dicoba lebih dulu. Untuk data yang
+    mulus residual bisa jauh di bawah perkiraan ini, jadi jalur stabil tetap selalu dicoba.
+    """
+    if output == "interpolant":
+        return (["chebyshev-dct"] if profile.kind == "chebyshev" and profile.builtin else []) + ["barycentric"]
+    safe = np.finfo(float).eps * profile.inv_bounds[1] <= tol
+    paths = []
+    if safe and profile.order != "unsorted" and profile.kind != "clustered":
+        paths.append("bjorck-pereyra")
+    paths.append("bjorck-pereyra-leja")
+    if profile.n <= get_solver("lu").max_n:
+        paths.append("lu")
+    return paths
+
+
+def _run_path(path, x, f, decision):
+    """Menjalankan satu jalur; hasilnya koefisien monomial atau interpolant (callable)."""
+    if path == "bjorck-pereyra-leja":
+        if decision.leja is None:
+            decision.leja = leja_order(x, return_index=True)
+        return solve_vandermonde_bjorck_pereyra(x[decision.leja], f[decision.leja])
+    profile = decision.profile
+    # Node bawaan (urutan persis) memakai bentuk tertutup, misalnya bobot barycentric Chebyshev
+    node_type = profile.kind if profile.builtin and profile.kind in ("chebyshev", "chebyshev-extrema") else None
+    return get_solver(path).fit(InterpolationProblem(x, f, node_type))
+
+
+def _relative_residual(result, x, f):
+    """||p(x_i) - f_i||_inf / ||f||_inf (Horner untuk koefisien monomial)."""
+    if callable(result):
+        values = result(x)
+    else:
+        values = VandermondeOperator(x, ncols=len(result)).matvec(result)
+    scale = np.max(np.abs(f))
+    err = np.max(np.abs(values - f))
+    if not np.isfinite(err):
+        return np.inf
+    return float(err / scale) if scale > 0 else float(err)
+
+
+def interpolate(x, f, tol=1e-10, output="monomial", strict=False):
+    """
+    Interpolasi polinomial p(x_i) = f_i dengan pemilihan solver otomatis.
+
+    - output="monomial"    : hasil koefisien monomial [c0, c1, ...] ((n,) atau (n, m))
+    - output="interpolant" : hasil callable p(t) (Chebyshev/DCT atau barycentric)
+    Jalur termurah yang lolos pemeriksaan residual (<= tol relatif terhadap ||f||_inf)
+    dikembalikan. Jika tidak ada yang lolos, hasil dengan residual terkecil dikembalikan
+    dengan peringatan (RuntimeWarning), atau ValueError jika strict=True; untuk node
+    yang sangat ill-conditioned gunakan output="interpolant".
+
+    Return: (hasil, DispatchReport)
+
+    Cara pakai:
+        c, report = interpolate(x, f, tol=1e-12)
+        report.path, report.residual, report.attempts
+    """
+    if output not in ("monomial", "interpolant"):
+        raise ValueError(f"Unknown output: {output}")
+    x = np.asarray(x, dtype=float).ravel()
+    f = np.asarray(f, dtype=float)
+    if x.size < 1:
+        raise ValueError("Interpolation needs at least one node.")
+    if f.ndim not in (1, 2) or f.shape[0] != x.size:
+        raise ValueError(f"Data must have shape ({x.size},) or ({x.size}, m).")
+
+    with profiling.span("dispatch", n=x.size):
+        key = (x.tobytes(), float(tol), output)
+        decision = _decisions.get(key)
+        cached = decision is not None
+        if cached:
+            _decisions.move_to_end(key)
+        else:
+            with profiling.span("classify"):
+                profile = classify_nodes(x)
+            decision = _Decision(profile, tuple(_candidate_paths(profile, tol, output)))
+            _decisions[key] = decision
+            if len(_decisions) > CACHE_SIZE:
+                _decisions.popitem(last=False)
+
+        attempts, errors, best = [], {}, None
+        for path in decision.paths:
+            try:
+                with profiling.span(f"solve[{path}]"), np.errstate(all="ignore"):
+                    result = _run_path(path, x, f, decision)
+            except ValueError as exc:   # Misalnya "Duplicate nodes." dari cek np.isclose Björck–Pereyra
+                attempts.append((path, np.inf))
+                errors[path] = str(exc)
+                continue
+            with profiling.span("residual_check"), np.errstate(all="ignore"):
+                residual = _relative_residual(result, x, f)
+            attempts.append((path, residual))
+            if best is None or residual < best[2]:
+                best = (path, result, residual)
+            if residual <= tol:
+                break
+
+    if best is None:
+        failures = "; ".join(f"{p}: {message}" for p, message in errors.items())
+        hint = "; try output='interpolant'" if output == "monomial" else ""
+        raise ValueError(f"Every {output} path failed for n={x.size} ({failures}){hint}.")
+    path, result, residual = best
+    report = DispatchReport(path, decision.profile, residual, residual <= tol, attempts, cached, errors)
+    if not report.met_tol:
+        message = (f"No {output} path met tol={tol:g} for {decision.profile.kind} nodes "
+                   f"(n={x.size}); best residual {residual:.3g} from {path}.")
+        if strict:
+            raise ValueError(message)
+        warnings.warn(message, RuntimeWarning, stacklevel=2)
+    return result, report
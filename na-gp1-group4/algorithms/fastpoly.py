@@ -0,0 +1,303 @@
+import numpy as np
+
+from algorithms.vandermonde import VandermondeOperator, solve_vandermonde_bjorck_pereyra
+
+# Evaluasi multipoint dan interpolasi cepat O(n log^2 n) lewat subproduct tree.
+# Semua polinomial disimpan sebagai koefisien naik [a_0, a_1, ..., a_d].
+#
+# Catatan numerik: di basis monomial, polinomial pohon M(x) = prod (x - x_i) untuk node
+# real di [-1, 1] punya koefisien yang tumbuh/mengecil secara eksponensial, sehingga hasil
+# float64 hanya akurat untuk n kecil–menengah (sama seperti V sendiri yang ill-conditioned).
+# Untuk node yang terkondisi baik di basis monomial (misalnya akar satuan kompleks)
+# mesin ini tetap akurat hingga n = 10^5–10^6. Karena itu multipoint_eval dan
+# fast_interpolate hanya memakai pohon untuk titik yang tersebar di lingkaran satuan;
+# node real selalu memakai Horner / Björck–Pereyra (SubproductTree sendiri tetap bisa
+# dipakai langsung).
+
+FFT_CROSSOVER = 64      # Panjang polinomial minimum untuk perkalian via FFT (di bawahnya np.convolve)
+LEAF_SIZE = 64          # Subtree dengan node sebanyak ini atau kurang dikerjakan secara kuadratik
+FAST_MIN_N = 2048       # Di bawah n ini evaluasi memakai Horner O(n^2) dan node kompleks umum solve padat
+
+
+def poly_mul(a, b):
+    """Perkalian polinomial: np.convolve untuk polinomial pendek, FFT (O(n log n)) untuk yang panjang."""
+    la, lb = a.shape[-1], b.shape[-1]
+    if min(la, lb) < FFT_CROSSOVER:
+        return np.convolve(a, b)
+    size = la + lb - 1
+    nfft = 1 << (size - 1).bit_length()     # Panjang FFT pangkat dua
+    if np.iscomplexobj(a) or np.iscomplexobj(b):
+        return np.fft.ifft(np.fft.fft(a, nfft) * np.fft.fft(b, nfft))[:size]
+    return np.fft.irfft(np.fft.rfft(a, nfft) * np.fft.rfft(b, nfft), nfft)[:size]
+
+
+def inverse_series(f, m):
+    """
+    Deret kebalikan g dengan f * g = 1 (mod x^m), iterasi Newton
+        g <- g * (2 - f * g)  (mod x^{2k})
+    sehingga presisi (jumlah suku benar) berlipat dua setiap langkah: O(M(m)).
+    f[0] harus tidak nol (polinomial pohon monic → rev(M)[0] = 1).
+    """
+    g = np.array([1.0 / f[0]], dtype=np.result_type(f, float))
+    k = 1
+    while k < m:
+        k = min(2 * k, m)
+        e = poly_mul(f[:k], g)[:k]          # f * g mod x^k
+        e = -e
+        e[0] += 2.0                         # 2 - f * g
+        g = poly_mul(g, e)[:k]
+    return g
+
+
+def poly_rem(a, b, rev_inv=None):
+    """
+    Sisa pembagian a mod b untuk b monic, via kebalikan deret (tanpa pembagian panjang O(n^2)):
+        rev(q) = rev(a) * rev(b)^{-1}  (mod x^{deg a - deg b + 1}),   r = a - q b
+    rev_inv boleh berisi rev(b)^{-1} yang sudah dihitung (cukup panjang) untuk dipakai ulang.
+    """
+    da, db = a.size - 1, b.size - 1
+    if da < db:
+        return a
+    m = da - db + 1                         # Banyaknya koefisien hasil bagi
+    if rev_inv is None or rev_inv.size < m:
+        rev_inv = inverse_series(b[::-1], m)
+    q = poly_mul(a[::-1][:m], rev_inv[:m])[:m][::-1]
+    return (a[:db] - poly_mul(q, b)[:db])
+
+
+def _horner_batched(c, x):
+    """Evaluasi baris-baris polinomial c (count, d) di titik x (count, L) sekaligus (Horner)."""
+    y = np.repeat(c[:, -1:], x.shape[1], axis=1)
+    for j in range(c.shape[1] - 2, -1, -1):
+        y *= x
+        y += c[:, j:j + 1]
+    return y
+
+
+def _leaf_polys(X):
+    """Polinomial monic prod_j (x - X[r, j]) untuk setiap baris X (count, L): hasil (count, L + 1)."""
+    count, L = X.shape
+    P = np.zeros((count, L + 1), dtype=X.dtype)
+    P[:, 0] = 1.0
+    for j in range(L):                      # Kalikan dengan (x - x_j): geser lalu kurangi
+        P[:, 1:j + 2] = P[:, :j + 1] - X[:, j:j + 1] * P[:, 1:j + 2]
+        P[:, 0] *= -X[:, j]
+    return P
+
+
+def _interleaved_order(idx):
+    """
+    Urutan node untuk pohon: rentang kiri = indeks genap, kanan = indeks ganjil (rekursif
+    sampai satu node), seperti permutasi bit-reversal pada FFT. Setiap subtree (dan setiap
+    hasil kali parsial di dalam daun) berisi node yang tersebar, bukan berkelompok, sehingga
+    koefisien M(x) tetap terkendali; untuk akar satuan berurutan setiap M menjadi x^k - ω.
+    """
+    if idx.size <= 1:
+        return idx
+    return np.concatenate([_interleaved_order(idx[0::2]), _interleaved_order(idx[1::2])])
+
+
+class _TreeNode:
+    __slots__ = ("lo", "hi", "poly", "left", "right", "rev_inv")
+
+    def __init__(self, lo, hi):
+        self.lo, self.hi = lo, hi
+        self.poly = None                    # M(x) = prod_{lo <= i < hi} (x - x_i), monic
+        self.left = self.right = None
+        self.rev_inv = None                 # Cache rev(M)^{-1} untuk poly_rem
+
+    @property
+    def is_leaf(self):
+        return self.left is None
+
+
+class SubproductTree:
+    """
+    Subproduct tree atas node x: setiap simpul menyimpan M(x) = prod (x - x_i) untuk
+    rentang node-nya, dengan anak kiri/kanan membagi rentang menjadi dua.
+
+    - evaluate(c)     : nilai polinomial c (monomial) di semua node (V @ c), O(n log^2 n)
+                        lewat pohon sisa (remainder tree): r_anak = r_induk mod M_anak
+    - interpolate(f)  : koefisien monomial p dengan p(x_i) = f_i (V^{-1} f), O(n log^2 n)
+                        lewat rumus Lagrange p = sum f_i / M'(x_i) * M(x) / (x - x_i)
+                        yang digabung dari bawah: r = r_kiri * M_kanan + r_kanan * M_kiri
+
+    Daun berisi paling banyak leaf_size node dan dikerjakan secara kuadratik,
+    dikelompokkan per ukuran sehingga semua daun diproses dengan operasi array bersama.
+    Node boleh kompleks (misalnya akar satuan). Dengan interleave=True pohon dibangun
+    di atas urutan genap/ganjil (lihat _interleaved_order); hasil selalu dikembalikan
+    dalam urutan node semula.
+    """
+
+    def __init__(self, x, leaf_size=LEAF_SIZE, interleave=True):
+        x = np.asarray(x).ravel()
+        if not np.iscomplexobj(x):
+            x = x.astype(float)
+        self.n = x.size
+        self.leaf_size = max(1, int(leaf_size))
+        idx = np.arange(self.n)
+        self.perm = _interleaved_order(idx) if interleave else idx
+        self.x = x[self.perm]               # Node dalam urutan pohon
+        self.leaves = []                    # Daun berurutan dari kiri ke kanan
+        self.root = self._split(0, self.n)
+        for nodes, idx in self._leaf_groups():
+            polys = _leaf_polys(idx)
+            for node, poly in zip(nodes, polys):
+                node.poly = poly
+        self._build(self.root)
+
+    def _split(self, lo, hi):
+        node = _TreeNode(lo, hi)
+        if hi - lo <= self.leaf_size:
+            self.leaves.append(node)
+        else:
+            mid = lo + (hi - lo + 1) // 2   # Seimbang (sama dengan pembagian genap/ganjil)
+            node.left = self._split(lo, mid)
+            node.right = self._split(mid, hi)
+        return node
+
+    def _leaf_groups(self):
+        """Kelompok daun berukuran sama: (daftar daun, node x berbentuk (count, L))."""
+        groups = {}
+        for leaf in self.leaves:
+            groups.setdefault(leaf.hi - leaf.lo, []).append(leaf)
+        for size, nodes in groups.items():
+            idx = np.array([leaf.lo for leaf in nodes])[:, None] + np.arange(size)
+            yield nodes, self.x[idx]
+
+    def _build(self, node):
+        if node.is_leaf:
+            return
+        self._build(node.left)
+        self._build(node.right)
+        node.poly = poly_mul(node.left.poly, node.right.poly)
+
+    def _rem(self, a, node):
+        """a mod M_node dengan cache kebalikan deret per simpul."""
+        m = a.size - node.poly.size + 1
+        if m <= 0:
+            return a
+        if node.rev_inv is None or node.rev_inv.size < m:
+            node.rev_inv = inverse_series(node.poly[::-1], m)
+        return poly_rem(a, node.poly, node.rev_inv)
+
+    def evaluate(self, c):
+        """Nilai polinomial dengan koefisien monomial c di semua node (setara V @ c)."""
+        values = self._evaluate(c)
+        out = np.empty_like(values)
+        out[self.perm] = values             # Kembali ke urutan node semula
+        return out
+
+    def _evaluate(self, c):
+        """Seperti evaluate, tetapi hasilnya dalam urutan pohon."""
+        c = np.asarray(c)
+        c = c.astype(np.result_type(c, self.x, float))
+        out = np.empty(self.n, dtype=np.result_type(c, self.x))
+        rems = {}
+
+        def descend(node, r):
+            r = self._rem(r, node)          # Sisa terhadap M simpul ini (nilai di node tetap sama)
+            if node.is_leaf:
+                rems[id(node)] = r
+                return
+            descend(node.left, r)
+            descend(node.right, r)
+
+        descend(self.root, c)
+        for nodes, X in self._leaf_groups():  # Evaluasi daun sekaligus per ukuran (Horner)
+            d = max(rems[id(leaf)].size for leaf in nodes)
+            C = np.zeros((len(nodes), max(d, 1)), dtype=out.dtype)
+            for row, leaf in enumerate(nodes):
+                r = rems[id(leaf)]
+                C[row, :r.size] = r
+            vals = _horner_batched(C, X)
+            for row, leaf in enumerate(nodes):
+                out[leaf.lo:leaf.hi] = vals[row]
+        return out
+
+    def interpolate(self, f):
+        """Koefisien monomial polinomial interpolasi p(x_i) = f_i (setara V^{-1} f)."""
+        f = np.asarray(f)
+        if f.shape != (self.n,):
+            raise ValueError(f"Data must have shape ({self.n},).")
+        M = self.root.poly
+        dM = M[1:] * np.arange(1, M.size)   # Turunan M'(x)
+        weights = f[self.perm] / self._evaluate(dM)  # f_i / M'(x_i) dalam urutan pohon
+
+        def combine(node):
+            if node.is_leaf:
+                return leaf_parts[id(node)]
+            return poly_mul(combine(node.left), node.right.poly) + poly_mul(combine(node.right), node.left.poly)
+
+        leaf_parts = {}
+        for nodes, X in self._leaf_groups():
+            L = X.shape[1]
+            P = np.stack([leaf.poly for leaf in nodes])           # (count, L + 1)
+            W = np.stack([weights[leaf.lo:leaf.hi] for leaf in nodes])
+            # Pembagian sintetis M_daun / (x - x_i) untuk semua i di semua daun sekaligus
+            Q = np.zeros(X.shape + (L,), dtype=np.result_type(P, X, W))
+            Q[:, :, L - 1] = P[:, None, L]
+            for k in range(L - 1, 0, -1):
+                Q[:, :, k - 1] = P[:, None, k] + X * Q[:, :, k]
+            parts = np.einsum("cl,cld->cd", W, Q)                  # sum_i w_i M_daun / (x - x_i)
+            for leaf, part in zip(nodes, parts):
+                leaf_parts[id(leaf)] = part
+
+        return combine(self.root)
+
+
+def _spread_on_unit_circle(x):
+    """
+    True jika x titik kompleks di lingkaran satuan yang tersebar hampir seragam (jarak sudut
+    antar tetangga 0.5–2 kali 2π/n), misalnya akar satuan. Hanya untuk titik seperti ini
+    polinomial pohon terkondisi baik di basis monomial; untuk node real maupun titik yang
+    berkelompok (termasuk titik acak di lingkaran) hasil pohon overflow menjadi inf/NaN.
+    """
+    if not np.iscomplexobj(x) or x.size < 2:
+        return False
+    if np.max(np.abs(np.abs(x) - 1.0)) > 1e-8:
+        return False
+    theta = np.sort(np.angle(x))
+    gaps = np.diff(np.append(theta, theta[0] + 2 * np.pi))   # Termasuk celah melingkar
+    h = 2 * np.pi / x.size
+    return bool(gaps.min() >= 0.5 * h and gaps.max() <= 2.0 * h)
+
+
+def multipoint_eval(c, x, min_n=FAST_MIN_N, leaf_size=LEAF_SIZE):
+    """
+    Nilai polinomial monomial c di titik x (V(x) @ c).
+    Subproduct tree O(n log^2 n) hanya untuk titik yang tersebar di lingkaran satuan
+    (misalnya akar satuan) dengan max(len(c), len(x)) >= min_n; selain itu, termasuk semua
+    titik real, memakai Horner O(n^2).
+    """
+    c = np.asarray(c)
+    x = np.asarray(x)
+    if max(c.size, x.size) < min_n or not _spread_on_unit_circle(x):
+        if np.iscomplexobj(c) or np.iscomplexobj(x):
+            return np.polynomial.polynomial.polyval(x, c)
+        return VandermondeOperator(x, ncols=c.size).matvec(c)
+    return SubproductTree(x, leaf_size=leaf_size).evaluate(c)
+
+
+def fast_interpolate(x, f, min_n=FAST_MIN_N, leaf_size=LEAF_SIZE):
+    """
+    Koefisien monomial interpolasi pada node x (V(x)^{-1} f).
+
+    - node real (atau kompleks dengan bagian imajiner nol): Björck–Pereyra O(n^2)
+      (data kompleks: bagian real dan imajiner diselesaikan terpisah)
+    - node tersebar di lingkaran satuan (misalnya akar satuan): subproduct tree O(n log^2 n)
+    - node kompleks lain: solve padat O(n^3) untuk n < min_n, ValueError di atasnya
+    """
+    x = np.asarray(x)
+    f = np.asarray(f)
+    if not np.iscomplexobj(x) or not np.any(x.imag != 0):
+        x = x.real
+        if np.iscomplexobj(f):
+            return solve_vandermonde_bjorck_pereyra(x, f.real) + 1j * solve_vandermonde_bjorck_pereyra(x, f.imag)
+        return solve_vandermonde_bjorck_pereyra(x, f)
+    if _spread_on_unit_circle(x):
+        return SubproductTree(x, leaf_size=leaf_size).interpolate(f)
+    if x.size < min_n:
+        return np.linalg.solve(np.vander(x, increasing=True), f)
+    raise ValueError("Fast interpolation needs complex nodes spread over the unit circle "
+                     "(e.g. roots of unity); these nodes would overflow the subproduct tree.")
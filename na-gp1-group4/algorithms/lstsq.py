@@ -0,0 +1,223 @@
+import numpy as np
+
+# Fit polinomial kuadrat terkecil pada m >> n sampel tanpa membentuk V (m×n), V^T V,
+# atau faktorisasi QR padat. Basis polinomial ortonormal diskret terhadap
+#     <u, v> = sum_i w_i u(x_i) v(x_i)
+# dibangun langsung dari node dengan rekursi tiga suku Stieltjes (bentuk Lanczos):
+#     β_{k+1} q_{k+1}(x) = (x - α_k) q_k(x) - β_k q_{k-1}(x)
+# Vektor q_k(x_i) adalah kolom Q pada QR dari diag(sqrt(w)) V, sehingga koefisien
+# ortogonal cukup d_k = <f, q_k>. Setiap derajat hanya beberapa operasi vektor
+# berukuran m: total O(m n) waktu dan O(m) memori kerja (hanya q_k dan q_{k-1} disimpan).
+
+
+def _stieltjes_batched(x, w, f, deg):
+    """
+    Inti rekursi Stieltjes untuk banyak himpunan node sekaligus.
+
+    Input:
+        x, w = array (batch, m) node dan bobot
+        f    = array (batch, m, s) nilai data (s ruas kanan per himpunan node)
+    Output:
+        alpha      = (batch, deg)       koefisien rekursi α_k
+        beta       = (batch, deg + 1)   β_0 = ||1||_w dan β_{k+1} = ||v_{k+1}||_w
+        coef       = (batch, deg + 1, s) koefisien basis ortonormal d_k = <f, q_k>
+        resid      = (batch, s)         ||f - p||_w (norma residual berbobot)
+        degenerate = (batch,)           baris dengan node (berbobot positif) kurang dari deg + 1
+    """
+    batch, m = x.shape
+    n = deg + 1
+    alpha = np.zeros((batch, deg))
+    beta = np.zeros((batch, n))
+    coef = np.zeros((batch, n, f.shape[2]))
+    fit = np.zeros_like(f)                  # p(x_i) = sum_k d_k q_k(x_i), diakumulasi per derajat
+    wf = w[:, :, None] * f
+    degenerate = np.zeros(batch, dtype=bool)
+    tol = m * np.finfo(float).eps * np.max(np.abs(x), axis=1, initial=1.0)
+
+    beta[:, 0] = np.sqrt(w.sum(axis=1))
+    degenerate |= beta[:, 0] == 0
+    with np.errstate(divide="ignore", invalid="ignore"):  # Baris degenerate ditangani lewat mask
+        q_prev = np.zeros((batch, m))
+        q = np.broadcast_to(1.0 / beta[:, :1], (batch, m)).copy()  # q_0 = 1 / ||1||_w
+        for k in range(n):
+            d = np.einsum("bm,bms->bs", q, wf)      # d_k = <f, q_k>
+            coef[:, k] = d
+            fit += q[:, :, None] * d[:, None, :]
+            if k == deg:
+                break
+            v = x * q - beta[:, k, None] * q_prev   # Bentuk Lanczos: kurangi suku q_{k-1} dulu
+            a = np.einsum("bm,bm->b", w * v, q)
+            v -= a[:, None] * q                     # lalu proyeksi ke q_k
+            b = np.sqrt(np.einsum("bm,bm->b", w * v, v))
+            alpha[:, k] = a
+            beta[:, k + 1] = b
+            degenerate |= b <= tol                  # Node berbeda kurang dari derajat + 1
+            q_prev, q = q, v / b[:, None]
+        resid = np.sqrt(np.einsum("bm,bms->bs", w, (f - fit) ** 2))
+    for arr in (alpha, beta, coef, resid):
+        arr[degenerate] = np.nan
+    return alpha, beta, coef, resid, degenerate
+
+
+def _orthogonal_to_monomial_batched(coef, alpha, beta):
+    """Versi batch dari orthogonal_to_monomial: coef (batch, n, s) → monomial (batch, n, s), O(n^2)."""
+    batch, n = beta.shape
+    P_prev = np.zeros((batch, n))           # Koefisien monomial q_{k-1}
+    P = np.zeros((batch, n))                # Koefisien monomial q_k
+    P[:, 0] = 1.0 / beta[:, 0]
+    mono = P[:, :, None] * coef[:, 0, None, :]
+    for k in range(n - 1):
+        P_next = np.zeros((batch, n))
+        P_next[:, 1:] = P[:, :-1]           # x * q_k
+        P_next -= alpha[:, k, None] * P + beta[:, k, None] * P_prev
+        P_next /= beta[:, k + 1, None]
+        P_prev, P = P, P_next
+        mono += P[:, :, None] * coef[:, k + 1, None, :]
+    return mono
+
+
+def _prepare(x, f, w):
+    """Validasi input satu himpunan node menjadi bentuk batch (1, m) dan (1, m, s)."""
+    x = np.asarray(x, dtype=float).ravel()
+    f = np.asarray(f, dtype=float)
+    if f.ndim not in (1, 2) or f.shape[0] != x.size:
+        raise ValueError(f"Data must have shape ({x.size},) or ({x.size}, s).")
+    w = np.ones_like(x) if w is None else np.asarray(w, dtype=float).ravel()
+    if w.shape != x.shape:
+        raise ValueError("Weights must have one entry per sample.")
+    if np.any(w < 0):
+        raise ValueError("Weights must be non-negative.")
+    return x[None, :], w[None, :], f.reshape(1, x.size, -1)
+
+
+def _check_degree(deg, m):
+    if deg < 0 or deg >= m:
+        raise ValueError("Degree must be non-negative and smaller than the number of samples.")
+
+
+def orthogonal_to_monomial(coef, alpha, beta):
+    """
+    Konversi koefisien basis ortonormal (coef (n,) atau (n, s)) ke koefisien monomial
+    [c0, c1, ...] memakai rekursi tiga suku pada koefisien polinomial, O(n^2).
+    Basis monomial bisa sangat ill-conditioned untuk derajat tinggi; konversi ini
+    terutama untuk perbandingan dengan solver Vandermonde.
+    """
+    coef = np.asarray(coef, dtype=float)
+    mono = _orthogonal_to_monomial_batched(
+        coef.reshape(1, coef.shape[0], -1), np.asarray(alpha, dtype=float)[None, :],
+        np.asarray(beta, dtype=float)[None, :])
+    return mono[0].reshape(coef.shape)
+
+
+def evaluate_orthogonal(coef, alpha, beta, t):
+    """
+    Evaluasi p(t) = sum_k d_k q_k(t) dengan menjalankan rekursi tiga suku maju,
+    O(n) per titik dan tervektorisasi atas semua titik t (dan kolom coef).
+    """
+    coef = np.asarray(coef, dtype=float)
+    t = np.asarray(t, dtype=float)
+    tt = t.reshape(t.shape + (1,) * (coef.ndim - 1))  # Siap broadcast untuk coef berukuran (n, s)
+    q_prev = np.zeros(tt.shape)
+    q = np.full(tt.shape, 1.0 / beta[0])
+    out = q * coef[0]
+    for k in range(coef.shape[0] - 1):
+        q_next = ((tt - alpha[k]) * q - beta[k] * q_prev) / beta[k + 1]
+        q_prev, q = q, q_next
+        out = out + q * coef[k + 1]
+    return out
+
+
+class OrthogonalPolynomialFit:
+    """
+    Fit polinomial kuadrat terkecil berderajat deg pada m sampel (x_i, f_i):
+        min_p  sum_i w_i (f_i - p(x_i))^2
+    (bobot w mengalikan kuadrat residual; w=None berarti semua 1).
+
+    Polinomial disimpan dalam basis ortonormal diskret hasil rekursi Stieltjes
+    (alpha, beta) dengan koefisien coef, sehingga fitting O(m n) dan stabil
+    tanpa membentuk V atau V^T V. f boleh berupa (m,) atau (m, s).
+
+    Cara pakai:
+        p = OrthogonalPolynomialFit(x, f, deg=10)
+        y = p(t)                  # evaluasi (rekursi tiga suku, O(n) per titik)
+        c = p.to_monomial()       # koefisien monomial [c0, c1, ...]
+        p.residual_norm           # ||f - p(x)||_w
+    """
+
+    def __init__(self, x, f, deg, w=None, chunk_size=1 << 16):
+        xb, wb, fb = _prepare(x, f, w)
+        _check_degree(deg, xb.shape[1])
+        alpha, beta, coef, resid, degenerate = _stieltjes_batched(xb, wb, fb, int(deg))
+        if degenerate[0]:
+            raise ValueError("Not enough distinct nodes with positive weight for this degree.")
+        shape = np.shape(f)[1:]
+        self.alpha = alpha[0]
+        self.beta = beta[0]
+        self.coef = coef[0].reshape((deg + 1,) + shape)
+        self.residual_norm = resid[0].reshape(shape) if shape else float(resid[0, 0])
+        self.chunk_size = max(1, int(chunk_size))
+
+    @property
+    def degree(self):
+        return self.coef.shape[0] - 1       # Derajat polinomial
+
+    def __call__(self, t):
+        t = np.asarray(t, dtype=float)
+        t_flat = t.reshape(-1)
+        out = np.empty((t_flat.size,) + self.coef.shape[1:])
+        for start in range(0, t_flat.size, self.chunk_size):
+            stop = min(start + self.chunk_size, t_flat.size)
+            out[start:stop] = evaluate_orthogonal(self.coef, self.alpha, self.beta, t_flat[start:stop])
+        return out.reshape(t.shape + self.coef.shape[1:])
+
+    def to_monomial(self):
+        return orthogonal_to_monomial(self.coef, self.alpha, self.beta)
+
+
+def polyfit_lstsq(x, f, deg, w=None, basis="monomial"):
+    """
+    Fit polinomial kuadrat terkecil (berbobot) berderajat deg pada sampel (x, f), O(m n).
+    Pasangan dari solve_lu untuk sistem Vandermonde persegi: di sini V berukuran m×(deg+1)
+    dengan m >= deg + 1, tetapi V tidak pernah dibentuk.
+
+    - basis="monomial"   : mengembalikan koefisien monomial [c0, c1, ...] ((n,) atau (n, s))
+    - basis="orthogonal" : mengembalikan OrthogonalPolynomialFit (koefisien basis ortonormal
+                           beserta rekursinya; bisa dievaluasi langsung)
+    """
+    fit = OrthogonalPolynomialFit(x, f, deg, w=w)
+    if basis == "orthogonal":
+        return fit
+    if basis == "monomial":
+        return fit.to_monomial()
+    raise ValueError(f"Unknown basis: {basis}")
+
+
+def polyfit_lstsq_batched(X, F, deg, W=None, basis="monomial"):
+    """
+    Versi batch dari polyfit_lstsq: banyak himpunan node sekaligus, setiap baris satu fit.
+    Loop Python hanya sebanyak deg + 1 level; sumbu batch dan sampel divektorisasi.
+
+    Input:
+        X, F = array (batch, m), W opsional (batch, m)
+    Output:
+        basis="monomial"   : (coef (batch, deg+1), degenerate)
+        basis="orthogonal" : (coef, alpha, beta, degenerate) dengan coef di basis ortonormal
+    Baris degenerate (node berbobot positif yang berbeda kurang dari deg + 1) berisi NaN,
+    sama seperti baris duplikat pada solver Vandermonde batch.
+    """
+    X = np.array(X, dtype=float, ndmin=2)
+    F = np.array(F, dtype=float, ndmin=2)
+    if X.ndim != 2 or X.shape != F.shape:
+        raise ValueError("Batched inputs must be 2-D arrays of the same shape (batch, m).")
+    W = np.ones_like(X) if W is None else np.array(W, dtype=float, ndmin=2)
+    if W.shape != X.shape:
+        raise ValueError("Weights must have the same shape as the nodes.")
+    if np.any(W < 0):
+        raise ValueError("Weights must be non-negative.")
+    _check_degree(deg, X.shape[1])
+    alpha, beta, coef, _, degenerate = _stieltjes_batched(X, W, F[:, :, None], int(deg))
+    if basis == "orthogonal":
+        return coef[:, :, 0], alpha, beta, degenerate
+    if basis == "monomial":
+        return _orthogonal_to_monomial_batched(coef, alpha, beta)[:, :, 0], degenerate
+    raise ValueError(f"Unknown basis: {basis}")
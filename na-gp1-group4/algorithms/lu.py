@@ -1,5 +1,82 @@
 import numpy as np # Mengimpor library numpy untuk operasi numerik matriks dan vektor
 
+from utils import profiling  # Span/counter opsional per fase (no-op jika tidak aktif)
+
+BLOCK_SIZE = 64  # Lebar panel default untuk LU blok (kolom per panel)
+BATCH_CHUNK_BYTES = 1 << 21  # Ukuran potongan batch (byte) untuk LU batch agar tetap di cache
+
+
+def _lu_panel(A, k0, k1, piv):
+    """
+    Faktorisasi LU in-place untuk panel kolom A[k0:, k0:k1] (right-looking).
+    Setiap langkah k melakukan pivot parsial lalu update rank-1 pada seluruh
+    sisa panel sekaligus (tanpa loop per baris).
+    Penukaran baris diterapkan pada baris penuh A agar bagian L di kiri
+    dan bagian trailing di kanan panel tetap konsisten.
+    """
+    for k in range(k0, k1):
+        # Menentukan baris pivot dengan mencari nilai maksimum pada kolom k mulai dari baris k
+        with profiling.span("pivot_search"):
+            p = int(np.argmax(np.abs(A[k:, k]))) + k
+        # Jika elemen pivot bernilai nol, matriks singular (tidak bisa didekomposisi)
+        if A[p, k] == 0:
+            raise ValueError("Singular matrix in LU.")
+        # Tukar baris penuh (partial pivoting) dan catat di vektor pivot
+        if p != k:
+            with profiling.span("row_swap"):
+                A[[k, p], :] = A[[p, k], :]
+                piv[[k, p]] = piv[[p, k]]
+            profiling.count("row_swaps")
+        with profiling.span("eliminate"):
+            # Multiplier L disimpan langsung di bawah diagonal
+            A[k + 1:, k] /= A[k, k]
+            # Update rank-1 untuk seluruh sisa kolom panel sekaligus
+            A[k + 1:, k + 1:k1] -= np.outer(A[k + 1:, k], A[k, k + 1:k1])
+
+
+def lu_factor(A, block_size=BLOCK_SIZE, overwrite_a=False):
+    """
+    Dekomposisi LU dengan pivot parsial dalam bentuk packed (in-place).
+    Sehingga diperoleh A[piv] = L @ U, dengan:
+    - lu  = satu array n×n: bagian bawah diagonal berisi L (diagonal 1 tidak disimpan),
+            diagonal dan bagian atas berisi U
+    - piv = vektor integer permutasi baris (baris ke-i dari P @ A adalah A[piv[i]])
+
+    Untuk n > block_size dipakai LU blok: panel selebar block_size difaktorkan
+    dengan update rank-1, lalu sisa matriks (trailing) di-update dengan satu
+    perkalian matriks (GEMM) per panel sehingga pekerjaan O(n^3) berjalan di BLAS.
+    Memori yang dibutuhkan hanya n^2 elemen (ditambah n integer pivot).
+    """
+    A = np.asarray(A)
+    if A.ndim != 2 or A.shape[0] != A.shape[1]:
+        raise ValueError("LU requires a square matrix.")
+    dtype = A.dtype if np.issubdtype(A.dtype, np.floating) else np.float64
+    with profiling.span("lu_factor", n=A.shape[0]):
+        if overwrite_a and A.dtype == dtype and A.flags.c_contiguous:
+            lu = A                              # Faktorisasi langsung di atas A
+        else:
+            lu = np.array(A, dtype=dtype, order="C")  # Satu salinan saja (bukan P, L, U terpisah)
+            profiling.count("bytes_allocated", lu.nbytes)
+        n = lu.shape[0]
+        piv = np.arange(n)                      # Permutasi awal = identitas
+        nb = max(1, int(block_size))
+
+        # Loop utama per panel kolom [k0, k1)
+        for k0 in range(0, n, nb):
+            k1 = min(k0 + nb, n)
+            with profiling.span("panel"):
+                _lu_panel(lu, k0, k1, piv)      # Faktorisasi panel (sudah termasuk pivot)
+            if k1 < n:
+                # Hitung blok U12 = L11^{-1} A12 (substitusi maju per baris blok)
+                with profiling.span("u12_solve"):
+                    for i in range(k0 + 1, k1):
+                        lu[i, k1:] -= lu[i, k0:i] @ lu[k0:i, k1:]
+                # Update trailing submatrix: A22 -= L21 @ U12 (GEMM)
+                with profiling.span("trailing_update"):
+                    lu[k1:, k1:] -= lu[k1:, k0:k1] @ lu[k0:k1, k1:]
+    return lu, piv
+
+
 def lu_decompose(A):
     """
     Melakukan dekomposisi LU dengan pivot parsial (Doolittle Method)
@@ -7,74 +84,409 @@ def lu_decompose(A):
     - L = matriks lower triangular dengan diagonal utama bernilai 1
     - U = matriks upper triangular
     - P = matriks pivot (permutasi baris)
+
+    Fungsi ini hanya membongkar hasil packed dari lu_factor menjadi matriks
+    P, L, U yang padat; untuk perhitungan gunakan lu_factor secara langsung.
     """
-    A = A.copy().astype(float)      # Membuat salinan matriks A dan mengubah tipe datanya menjadi float
-    n = A.shape[0]                  # Menyimpan ukuran matriks (jumlah baris = kolom)
-    P = np.eye(n)                   # Membuat matriks identitas n×n untuk matriks pivot P
-    L = np.zeros_like(A)            # Inisialisasi matriks L berukuran sama dengan A berisi nol
-    U = A.copy()                    # Menyalin matriks A ke U (karena U akan dimodifikasi selama eliminasi)\
-    # Loop utama untuk setiap kolom k (proses eliminasi Gaussian)
-    for k in range(n):
-        # Menentukan baris pivot dengan mencari nilai maksimum pada kolom k mulai dari baris k
-        pivot = np.argmax(np.abs(U[k:, k])) + k
-        # Jika elemen pivot bernilai nol, matriks singular (tidak bisa didekomposisi)
-        if U[pivot, k] == 0:
-            raise ValueError("Singular matrix in LU.")
-        # Jika baris pivot bukan baris k, maka tukar baris (partial pivoting)
-        if pivot != k:
-            U[[k, pivot], :] = U[[pivot, k], :]
-            P[[k, pivot], :] = P[[pivot, k], :]
-            if k > 0:
-                # Jika sudah ada kolom sebelumnya di L, ikut ditukar juga bagian bawahnya
-                L[[k, pivot], :k] = L[[pivot, k], :k]
-        # Set diagonal utama L ke 1 (sesuai metode Doolittle)
-        L[k, k] = 1.0
-        # Proses eliminasi: membuat elemen di bawah pivot menjadi nol
-        for i in range(k+1, n):
-            L[i, k] = U[i, k] / U[k, k]
-            U[i, k:] -= L[i, k] * U[k, k:]
-            U[i, k] = 0.0
+    with profiling.span("lu_decompose"):
+        lu, piv = lu_factor(A)                  # Faktorisasi packed
+        n = lu.shape[0]
+        with profiling.span("unpack"):
+            P = np.eye(n)[piv]                  # Matriks permutasi dari vektor pivot
+            L = np.tril(lu, -1) + np.eye(n)     # Bagian bawah + diagonal satu
+            U = np.triu(lu)                     # Bagian atas termasuk diagonal
+            profiling.count("bytes_allocated", P.nbytes + L.nbytes + U.nbytes)
     # Mengembalikan matriks pivot (P), lower (L), dan upper (U)
     return P, L, U
 
-def forward_substitution(L, b):
+def _solve_dtype(M, b):
+    """Tipe hasil substitusi: ikut tipe float dari M dan b, default float64."""
+    dtype = np.result_type(M.dtype, b.dtype)
+    return dtype if np.issubdtype(dtype, np.floating) else np.float64
+
+
+def forward_substitution(L, b, unit_diagonal=True, block_size=BLOCK_SIZE):
     """
     Menyelesaikan sistem L*y = b
     dengan metode substitusi maju (forward substitution)
     L adalah matriks segitiga bawah (lower triangular)
+
+    - b boleh berupa vektor (n,) atau blok banyak ruas kanan (n, m);
+      setiap langkah memproses semua kolom sekaligus.
+    - unit_diagonal=True berarti diagonal L dianggap 1 (hanya bagian bawah
+      diagonal yang dibaca), sehingga array LU packed bisa dipakai langsung.
+    - Dikerjakan per blok baris: di dalam blok substitusi per baris, lalu sisa
+      baris di bawahnya di-update dengan satu perkalian matriks.
     """
+    L = np.asarray(L)
+    b = np.asarray(b)
     n = L.shape[0]               # Ukuran matriks (jumlah baris)
-    y = np.zeros(n)              # Inisialisasi vektor solusi y dengan nol
-    for i in range(n):           # Iterasi dari baris atas ke bawah
-        # Menghitung nilai y[i] berdasarkan nilai sebelumnya
-        y[i] = b[i] - np.dot(L[i, :i], y[:i])  # b[i] dikurangi hasil kali elemen-elemen L dengan y sebelumnya
-    return y                     # Mengembalikan hasil vektor y
+    with profiling.span("forward_substitution"):
+        y = np.array(b, dtype=_solve_dtype(L, b))  # Salinan b yang akan diubah menjadi y
+        profiling.count("bytes_allocated", y.nbytes)
+        nb = max(1, int(block_size))
+        for k0 in range(0, n, nb):  # Iterasi blok dari atas ke bawah
+            k1 = min(k0 + nb, n)
+            for i in range(k0, k1):
+                # y[i] = b[i] dikurangi hasil kali elemen-elemen L dengan y sebelumnya (di dalam blok)
+                y[i] -= L[i, k0:i] @ y[k0:i]
+                if not unit_diagonal:
+                    y[i] /= L[i, i]
+            if k1 < n:
+                y[k1:] -= L[k1:, k0:k1] @ y[k0:k1]  # Kontribusi blok ini ke baris di bawahnya
+    return y                     # Mengembalikan hasil y
+
 
-def back_substitution(U, y):
+def back_substitution(U, y, unit_diagonal=False, block_size=BLOCK_SIZE):
     """
     Menyelesaikan sistem U*x = y
     dengan metode substitusi mundur (back substitution)
     U adalah matriks segitiga atas (upper triangular)
+
+    Sama seperti forward_substitution: y boleh berupa (n,) atau (n, m) dan
+    dikerjakan per blok dari bawah ke atas. unit_diagonal=True dipakai untuk
+    L^T pada solve_transpose.
     """
+    U = np.asarray(U)
+    y = np.asarray(y)
     n = U.shape[0]               # Ukuran matriks (jumlah baris)
-    x = np.zeros(n)              # Inisialisasi vektor solusi x dengan nol
-    # Iterasi dari baris bawah ke atas
-    for i in range(n - 1, -1, -1):
-        # Menghitung jumlah elemen di kanan diagonal (dot product U[i, i+1:] dan x[i+1:])
-        s = y[i] - np.dot(U[i, i + 1:], x[i + 1:])
-        x[i] = s / U[i, i]       # Bagi dengan elemen diagonal untuk mendapatkan x[i]
-    return x                     # Mengembalikan hasil vektor x
+    with profiling.span("back_substitution"):
+        x = np.array(y, dtype=_solve_dtype(U, y))  # Salinan y yang akan diubah menjadi x
+        profiling.count("bytes_allocated", x.nbytes)
+        nb = max(1, int(block_size))
+        # Iterasi blok dari bawah ke atas
+        for k1 in range(n, 0, -nb):
+            k0 = max(k1 - nb, 0)
+            for i in range(k1 - 1, k0 - 1, -1):
+                # Kurangi kontribusi elemen di kanan diagonal (di dalam blok)
+                x[i] -= U[i, i + 1:k1] @ x[i + 1:k1]
+                if not unit_diagonal:
+                    x[i] /= U[i, i]  # Bagi dengan elemen diagonal untuk mendapatkan x[i]
+            if k0 > 0:
+                x[:k0] -= U[:k0, k0:k1] @ x[k0:k1]  # Kontribusi blok ini ke baris di atasnya
+    return x                     # Mengembalikan hasil x
+
+
+class LUFactorization:
+    """
+    Hasil faktorisasi LU (packed) yang bisa dipakai ulang untuk banyak ruas kanan.
+    Faktorisasi O(n^3) dilakukan sekali saat objek dibuat; setiap solve
+    selanjutnya hanya O(n^2) per kolom ruas kanan.
+
+    Cara pakai:
+        fact = LUFactorization(A)
+        x = fact.solve(b)              # A x = b, b berukuran (n,) atau (n, m)
+        z = fact.solve_transpose(c)    # A^T z = c
+    """
+
+    def __init__(self, A, block_size=BLOCK_SIZE, overwrite_a=False):
+        self.lu, self.piv = lu_factor(A, block_size=block_size, overwrite_a=overwrite_a)
+        self.block_size = block_size
+
+    @property
+    def n(self):
+        return self.lu.shape[0]  # Ukuran sistem
+
+    def _check_rhs(self, b):
+        b = np.asarray(b)
+        if b.ndim not in (1, 2) or b.shape[0] != self.n:
+            raise ValueError(f"Right-hand side must have shape ({self.n},) or ({self.n}, m).")
+        return b
+
+    def solve(self, b):
+        """
+        Menyelesaikan A*x = b.
+        Karena A[piv] = L @ U: permutasikan b dengan indeks (b[piv]),
+        lalu L*y = b[piv] dan U*x = y.
+        """
+        b = self._check_rhs(b)
+        with profiling.span("lu_solve"):
+            y = forward_substitution(self.lu, b[self.piv], block_size=self.block_size)
+            return back_substitution(self.lu, y, block_size=self.block_size)
+
+    def solve_transpose(self, b):
+        """
+        Menyelesaikan A^T*x = b.
+        Karena A^T = U^T L^T P: selesaikan U^T*w = b, L^T*z = w, lalu x[piv] = z.
+        """
+        b = self._check_rhs(b)
+        luT = self.lu.T                         # View transpos (tanpa salinan)
+        w = forward_substitution(luT, b, unit_diagonal=False, block_size=self.block_size)
+        z = back_substitution(luT, w, unit_diagonal=True, block_size=self.block_size)
+        x = np.empty_like(z)
+        x[self.piv] = z                         # Terapkan P^T dengan indeks
+        return x
+
+
+class MixedPrecisionLU:
+    """
+    LU presisi campuran: faktorisasi O(n^3) dikerjakan dalam float32 (separuh memori
+    dan bandwidth), lalu solusi diperbaiki dengan iterative refinement:
+        r = b - A x   (dihitung dalam residual_dtype: float64 atau longdouble)
+        A d = r       (memakai faktor float32, O(n^2))
+        x = x + d
+    Selama κ(A) * u32 < 1, setiap langkah mengecilkan error kira-kira sebesar
+    faktor κ(A) * u32 hingga akurasi float64 tercapai.
+
+    Penghentian adaptif berdasarkan estimasi κ₁(A) (Hager, memakai faktor float32):
+    - cond_lower * u32 >= 1 : fallback sudah pasti dari batas bawah murah (misalnya Gautschi
+                      dari node), faktorisasi float32 dan estimasi Hager dilewati
+    - κ * u32 >= 1  : refinement tidak akan konvergen, langsung pakai LU float64
+    - selain itu    : maksimal langkah ≈ log(u64) / log(κ * u32) (+1, dibatasi max_iter);
+                      berhenti lebih awal bila backward error sudah setingkat float64
+                      (||r|| <= sqrt(n) u64 ||A|| ||x||), bila koreksi sudah di bawah
+                      u64 * ||x||, atau bila koreksi tidak lagi mengecil (stagnasi)
+    Jika tetap tidak konvergen, solusi dihitung ulang dengan LU float64 (fallback).
+
+    Parameter:
+    - A              : matriks persegi float64 (difaktorkan sebagai salinan float32)
+    - matvec         : opsional, fungsi x -> A @ x untuk residual matrix-free
+                       (misalnya VandermondeOperator(x, dtype=...).matvec) sehingga
+                       residual tidak memakai perkalian matriks padat
+    - residual_dtype : np.float64 (default) atau np.longdouble untuk kasus sangat ill-conditioned
+    - cond_lower     : opsional, batas bawah κ₁(A) yang murah (misalnya
+                       utils.metrics.vandermonde_condition_bounds)
+
+    Setelah solve(), atribut iterations, converged, dan fallback berisi informasi
+    langkah terakhir; skipped = True jika faktorisasi float32 dilewati karena cond_lower.
+    """
+
+    def __init__(self, A, matvec=None, residual_dtype=np.float64, block_size=BLOCK_SIZE,
+                 max_iter=10, cond_lower=None):
+        A = np.asarray(A, dtype=np.float64)
+        self.residual_dtype = np.dtype(residual_dtype)
+        self.max_iter = max_iter
+        self.block_size = block_size
+        self.matvec = matvec
+        self.A = A                                # Referensi (bukan salinan) untuk residual / fallback
+        self._fallback = None
+        self.skipped = cond_lower is not None and cond_lower * float(np.finfo(np.float32).eps) >= 1.0
+        if self.skipped:
+            # Refinement pasti tidak konvergen: langsung faktorkan dalam float64
+            self.factor = None
+            self.cond = float(cond_lower)
+            self._fallback = LUFactorization(A, block_size=block_size)
+        else:
+            self.factor = LUFactorization(A.astype(np.float32), block_size=block_size,
+                                          overwrite_a=True)   # Satu salinan float32, difaktorkan in-place
+            self.cond = self._condition_estimate(A)
+            self._anorm = np.max(np.sum(np.abs(A), axis=1))  # ||A||_inf untuk kriteria backward error
+        self.iterations = 0
+        self.converged = False
+        self.fallback = False
+
+    @property
+    def n(self):
+        return self.A.shape[0]
+
+    def _condition_estimate(self, A):
+        from utils.metrics import hager_1norm_condest  # Import lokal (utils.metrics mengimpor modul ini)
+        cond, _ = hager_1norm_condest(A, self.factor)
+        return cond
+
+    def _residual(self, x, b):
+        """r = b - A x dalam residual_dtype (padat atau matrix-free)."""
+        rd = self.residual_dtype
+        xr = x.astype(rd)
+        if self.matvec is not None:
+            Ax = np.asarray(self.matvec(xr), dtype=rd)
+        else:
+            Ax = self.A.astype(rd, copy=False) @ xr   # Salinan sementara hanya untuk longdouble
+        return np.asarray(b, dtype=rd) - Ax
+
+    def _max_steps(self):
+        """Jumlah langkah refinement yang diharapkan dari laju konvergensi κ * u32."""
+        rate = self.cond * float(np.finfo(np.float32).eps)
+        if not np.isfinite(rate) or rate >= 1.0:
+            return 0                              # Tidak akan konvergen
+        if rate == 0.0:
+            return 1
+        steps = int(np.ceil(np.log(np.finfo(np.float64).eps) / np.log(rate))) + 1
+        return min(max(steps, 1), self.max_iter)
+
+    def _solve_float64(self, b):
+        if self._fallback is None:
+            self._fallback = LUFactorization(self.A, block_size=self.block_size)
+        return self._fallback.solve(b)
+
+    def solve(self, b):
+        """Menyelesaikan A*x = b (b berukuran (n,) atau (n, m)); hasil float64."""
+        self.iterations, self.converged, self.fallback = 0, False, False
+        steps = self._max_steps()
+        if steps == 0:
+            self.fallback = True
+            return self._solve_float64(b)
+        b = self.factor._check_rhs(b)
+
+        eps = np.finfo(np.float64).eps
+        extended = np.finfo(self.residual_dtype).eps < eps  # Residual lebih presisi dari float64
+        tol = np.sqrt(self.n) * eps * self._anorm            # Batas backward error (seperti LAPACK dsgesv)
+        x = self.factor.solve(b.astype(np.float32)).astype(np.float64)
+        prev = np.inf
+        for it in range(steps + 1):
+            r = self._residual(x, b)
+            # Dengan residual float64, backward error sekecil ini tidak bisa diperbaiki lagi;
+            # dengan residual extended, lanjutkan sampai koreksi (error maju) di bawah u64
+            if not extended and np.max(np.abs(r)) <= tol * np.max(np.abs(x)):
+                self.converged = True
+                break
+            if it == steps:
+                break
+            d = self.factor.solve(r.astype(np.float32)).astype(np.float64)
+            x += d
+            self.iterations += 1
+            d_norm = np.max(np.abs(d))
+            if d_norm <= eps * np.max(np.abs(x)):
+                self.converged = True             # Koreksi di bawah presisi float64
+                break
+            if not d_norm <= 0.5 * prev:
+                break                             # Stagnasi/divergensi: koreksi tidak lagi mengecil
+            prev = d_norm
+
+        if not self.converged:
+            self.fallback = True
+            return self._solve_float64(b)
+        return x
+
 
 def solve_lu(A, b):
     """
     Menyelesaikan sistem linear A*x = b menggunakan dekomposisi LU dengan pivot parsial
     Langkah:
-    1. Lakukan dekomposisi LU → P, L, U
-    2. Hitung pb = P @ b (karena P*A = L*U)
-    3. Selesaikan L*y = P*b dengan forward substitution
-    4. Selesaikan U*x = y dengan back substitution
-    """
-    P, L, U = lu_decompose(A)   # Langkah 1: dekomposisi LU dengan pivot parsial
-    pb = P @ b                  # Langkah 2: kalikan b dengan matriks pivot P
-    y = forward_substitution(L, pb)  # Langkah 3: cari y dari L*y = P*b
-    return back_substitution(U, y)   # Langkah 4: cari x dari U*x = y
\ No newline at end of file
+    1. Lakukan dekomposisi LU packed → lu, piv
+       (dilewati jika A sudah berupa LUFactorization)
+    2. Permutasikan b dengan indeks pivot: b[piv] (tanpa membentuk matriks P)
+    3. Selesaikan L*y = b[piv] dengan forward substitution (bagian bawah lu)
+    4. Selesaikan U*x = y dengan back substitution (bagian atas lu)
+    b boleh berupa vektor (n,) atau blok (n, m).
+    """
+    fact = A if isinstance(A, LUFactorization) else LUFactorization(A)  # Langkah 1
+    return fact.solve(b)                        # Langkah 2-4
+
+
+# --------------------------
+# Versi batch: banyak matriks kecil sekaligus
+# --------------------------
+# Fungsi di bawah menerima tumpukan matriks (batch, n, n). Loop Python hanya berjalan
+# sebanyak n langkah eliminasi / substitusi, sedangkan pencarian pivot, penukaran baris,
+# dan update rank-1 divektorisasi atas sumbu batch. Untuk banyak sistem kecil (n <= 64)
+# overhead Python per matriks inilah yang mendominasi biaya versi skalar.
+# Matriks singular tidak menimbulkan error, tetapi ditandai di mask `singular`
+# dan hasilnya diisi NaN (sama seperti baris duplikat pada solver Vandermonde batch).
+
+def _as_rhs_batch(b, batch, n):
+    """Ruas kanan (batch, n) atau (batch, n, m) → array 3-D (batch, n, m) dan flag vektor."""
+    b = np.asarray(b)
+    if b.ndim not in (2, 3) or b.shape[:2] != (batch, n):
+        raise ValueError(f"Right-hand side must have shape ({batch}, {n}) or ({batch}, {n}, m).")
+    return (b[:, :, None], True) if b.ndim == 2 else (b, False)
+
+
+def _lu_factor_chunk(lu, piv, singular):
+    """Faktorisasi in-place satu potongan batch (lihat lu_factor_batched)."""
+    batch, n, _ = lu.shape
+    rows = np.arange(batch)
+    for k in range(n):
+        # Pivot parsial per matriks, lalu tukar baris k dan p untuk semua matriks sekaligus
+        p = np.argmax(np.abs(lu[:, k:, k]), axis=1) + k
+        lu[rows, [k], :], lu[rows, p, :] = lu[rows, p, :], lu[rows, k, :].copy()
+        piv[rows, k], piv[rows, p] = piv[rows, p], piv[rows, k]
+        pivot = lu[:, k, k]
+        zero = pivot == 0
+        singular |= zero
+        # Multiplier L; matriks dengan pivot nol dilewati (multiplier 0) agar tidak menghasilkan inf
+        lu[:, k + 1:, k] /= np.where(zero, 1.0, pivot)[:, None]
+        lu[zero, k + 1:, k] = 0.0
+        # Update rank-1 pada seluruh sisa matriks untuk semua anggota batch
+        lu[:, k + 1:, k + 1:] -= lu[:, k + 1:, k, None] * lu[:, k, None, k + 1:]
+
+
+def lu_factor_batched(A, overwrite_a=False, chunk_bytes=BATCH_CHUNK_BYTES):
+    """
+    Versi batch dari lu_factor: A[r][piv[r]] = L_r @ U_r untuk setiap matriks r.
+
+    Input:
+        A = array (batch, n, n)
+    Output:
+        lu       = faktor packed (batch, n, n), matriks singular berisi NaN
+        piv      = vektor pivot (batch, n)
+        singular = mask (batch,) matriks dengan pivot nol
+
+    Eliminasi bersifat memory-bound (setiap langkah membaca dan menulis seluruh sisa
+    matriks), sehingga batch dikerjakan per potongan ~chunk_bytes agar tetap di cache.
+    """
+    A = np.asarray(A)
+    if A.ndim != 3 or A.shape[1] != A.shape[2]:
+        raise ValueError("Batched LU requires an array of square matrices (batch, n, n).")
+    dtype = A.dtype if np.issubdtype(A.dtype, np.floating) else np.float64
+    if overwrite_a and A.dtype == dtype and A.flags.c_contiguous:
+        lu = A
+    else:
+        lu = np.array(A, dtype=dtype, order="C")
+    batch, n, _ = lu.shape
+    piv = np.tile(np.arange(n), (batch, 1))     # Permutasi awal = identitas untuk setiap matriks
+    singular = np.zeros(batch, dtype=bool)
+    step = max(1, int(chunk_bytes) // max(1, n * n * lu.itemsize))
+    for start in range(0, batch, step):
+        stop = min(start + step, batch)
+        _lu_factor_chunk(lu[start:stop], piv[start:stop], singular[start:stop])  # View in-place
+    lu[singular] = np.nan
+    return lu, piv, singular
+
+
+def forward_substitution_batched(L, b, unit_diagonal=True):
+    """
+    Versi batch dari forward_substitution: L_r y_r = b_r untuk setiap r.
+    L berukuran (batch, n, n) (boleh packed LU), b berukuran (batch, n) atau (batch, n, m).
+    """
+    L = np.asarray(L)
+    batch, n, _ = L.shape
+    b3, vector = _as_rhs_batch(b, batch, n)
+    y = np.array(b3, dtype=_solve_dtype(L, b3))
+    for i in range(n):
+        y[:, i] -= np.matmul(L[:, i:i + 1, :i], y[:, :i])[:, 0]
+        if not unit_diagonal:
+            y[:, i] /= L[:, i, i, None]
+    return y[:, :, 0] if vector else y
+
+
+def back_substitution_batched(U, y, unit_diagonal=False):
+    """
+    Versi batch dari back_substitution: U_r x_r = y_r untuk setiap r.
+    U berukuran (batch, n, n), y berukuran (batch, n) atau (batch, n, m).
+    """
+    U = np.asarray(U)
+    batch, n, _ = U.shape
+    y3, vector = _as_rhs_batch(y, batch, n)
+    x = np.array(y3, dtype=_solve_dtype(U, y3))
+    for i in range(n - 1, -1, -1):
+        x[:, i] -= np.matmul(U[:, i:i + 1, i + 1:], x[:, i + 1:])[:, 0]
+        if not unit_diagonal:
+            x[:, i] /= U[:, i, i, None]
+    return x[:, :, 0] if vector else x
+
+
+def lu_solve_batched(lu, piv, b):
+    """
+    Menyelesaikan A_r x_r = b_r dari hasil lu_factor_batched:
+    permutasi b_r[piv_r], lalu substitusi maju dan mundur untuk semua matriks sekaligus.
+    Matriks singular (lu berisi NaN) menghasilkan NaN.
+    """
+    lu = np.asarray(lu)
+    batch, n, _ = lu.shape
+    b3, vector = _as_rhs_batch(b, batch, n)
+    pb = np.take_along_axis(b3, piv[:, :, None], axis=1)  # b_r[piv_r] untuk setiap r
+    x = back_substitution_batched(lu, forward_substitution_batched(lu, pb))
+    return x[:, :, 0] if vector else x
+
+
+def solve_lu_batched(A, b):
+    """
+    Versi batch dari solve_lu: menyelesaikan A_r x_r = b_r untuk setiap matriks r.
+
+    Output:
+        x        = solusi (batch, n) atau (batch, n, m), matriks singular berisi NaN
+        singular = mask (batch,) matriks singular
+    """
+    lu, piv, singular = lu_factor_batched(A)
+    return lu_solve_batched(lu, piv, b), singular
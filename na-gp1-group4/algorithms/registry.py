@@ -0,0 +1,199 @@
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import numpy as np
+
+from algorithms.barycentric import BarycentricInterpolant, barycentric_weights, chebyshev_weights
+from algorithms.chebyshev import ChebyshevInterpolant
+from algorithms.fastpoly import FAST_MIN_N, fast_interpolate
+from algorithms.lu import LUFactorization, MixedPrecisionLU
+from algorithms.vandermonde import (
+    VandermondeOperator, divided_differences, newton_poly_eval_coefs, solve_vandermonde_bjorck_pereyra,
+)
+from utils import complexity
+from utils.metrics import vandermonde_condition_bounds
+
+
+class InterpolationProblem:
+    """
+    Satu masalah interpolasi: node xs dan nilai b (V(xs) * c = b).
+    Objek ini diberikan ke setiap solver sehingga data turunan yang mahal
+    (matriks V padat, faktorisasi LU) bisa dipakai bersama dalam satu sel.
+    """
+
+    def __init__(self, xs, b, node_type=None):
+        self.xs = xs
+        self.b = b
+        self.node_type = node_type
+        self.n = len(xs)
+        self.operator = VandermondeOperator(xs, dtype=np.result_type(xs, np.float64))  # V matrix-free
+        self._V = None
+        self.lu = None                           # Diisi oleh solver LU (dipakai ulang untuk cond)
+        self.info = {}                           # Diagnostik solver terakhir (misalnya fell_back)
+
+    @property
+    def V(self):
+        """Matriks Vandermonde padat, dibentuk sekali saat pertama kali dibutuhkan."""
+        if self._V is None:
+            self._V = self.operator.toarray()
+        return self._V
+
+    def factorization(self):
+        """
+        Faktorisasi LU dari V: milik solver LU jika sudah dijalankan, jika belum dibuat
+        sekali di sini. Dipakai bersama (misalnya untuk estimasi kondisi) dalam satu sel.
+        """
+        if self.lu is None:
+            self.lu = LUFactorization(self.V)
+        return self.lu
+
+
+@dataclass(frozen=True)
+class SolverSpec:
+    """
+    Deklarasi satu solver: callable, model biaya, dan metadata tampilan.
+
+    - fit(problem)            : menjalankan solver, mengembalikan koefisien monomial
+                                (output="monomial") atau interpolant p(t) (output="interpolant")
+    - flops(n, nodes)         : model jumlah FLOPs
+    - memory_bytes(n, nodes)  : model memori dalam byte
+    - node_types              : jenis node yang didukung (None = semua)
+    - needs_matrix            : True jika solver membutuhkan V padat (dibentuk di luar pengukuran waktu)
+    - min_n                   : n terkecil yang berguna (None = tanpa batas), misalnya di bawah
+                                crossover solver cepat yang hanya mengulang solver lain
+    - max_n                   : n terbesar yang masih praktis (None = tanpa batas)
+    """
+    key: str
+    label: str
+    fit: Callable
+    flops: Callable
+    memory_bytes: Callable
+    output: str = "monomial"
+    style: str = "o-"
+    node_types: Optional[tuple] = None
+    needs_matrix: bool = False
+    min_n: Optional[int] = None
+    max_n: Optional[int] = None
+
+    def supports(self, node_type, n=None):
+        """Apakah solver ini berlaku untuk jenis node dan ukuran n tersebut."""
+        if self.node_types is not None and node_type not in self.node_types:
+            return False
+        if n is None:
+            return True
+        return (self.min_n is None or n >= self.min_n) and (self.max_n is None or n <= self.max_n)
+
+    def evaluate(self, result, t):
+        """Mengevaluasi hasil fit di titik t (Horner untuk koefisien monomial)."""
+        if self.output == "monomial":
+            dtype = np.result_type(t, result, np.float64)   # Node/koefisien kompleks tetap kompleks
+            return VandermondeOperator(t, ncols=len(result), dtype=dtype).matvec(result)
+        return result(t)
+
+
+SOLVERS = {}  # Registry terurut: key → SolverSpec (urutan = urutan baris CSV dan legenda plot)
+
+
+def register_solver(spec):
+    """Mendaftarkan solver baru; cukup satu pemanggilan ini untuk menambah solver ke eksperimen."""
+    SOLVERS[spec.key] = spec
+    return spec
+
+
+def get_solver(name):
+    """Mencari solver berdasarkan key atau label (tidak peka huruf besar/kecil)."""
+    name = name.lower()
+    for spec in SOLVERS.values():
+        if name in (spec.key, spec.label.lower()):
+            return spec
+    raise ValueError(f"Unknown solver: {name}")
+
+
+def solvers_for(node_type, n=None):
+    """Daftar solver terdaftar yang berlaku untuk jenis node (dan ukuran n)."""
+    return [spec for spec in SOLVERS.values() if spec.supports(node_type, n)]
+
+
+# --------------------------
+# Solver bawaan
+# --------------------------
+
+def _fit_lu(problem):
+    problem.lu = LUFactorization(problem.V)      # Faktorisasi disimpan untuk dipakai ulang
+    return problem.lu.solve(problem.b)
+
+
+def _fit_lu_mixed(problem):
+    # Faktor float32 + refinement dengan residual float64 matrix-free (Horner). Batas bawah
+    # Gautschi (O(n) untuk keluarga node bawaan) melewati faktor float32 jika fallback pasti.
+    cond_lower, _ = vandermonde_condition_bounds(problem.xs, problem.node_type)
+    solver = MixedPrecisionLU(problem.V, matvec=problem.operator.matvec, cond_lower=cond_lower)
+    x = solver.solve(problem.b)
+    problem.info = {"fell_back": solver.fallback, "refine_steps": solver.iterations}
+    return x
+
+
+def _fit_newton(problem):
+    return newton_poly_eval_coefs(problem.xs, divided_differences(problem.xs, problem.b))
+
+
+def _fit_bjorck_pereyra(problem):
+    return solve_vandermonde_bjorck_pereyra(problem.xs, problem.b)
+
+
+def _fit_subproduct_tree(problem):
+    return fast_interpolate(problem.xs, problem.b)
+
+
+# Keluarga node dengan bobot barycentric bentuk tertutup → argumen kind chebyshev_weights
+_CHEBYSHEV_WEIGHT_KIND = {"chebyshev": 1, "chebyshev-extrema": 2}
+
+
+def _fit_barycentric(problem):
+    kind = _CHEBYSHEV_WEIGHT_KIND.get(problem.node_type)
+    if kind is not None:
+        w = chebyshev_weights(problem.n, kind=kind)  # Bobot bentuk tertutup O(n)
+    else:
+        w = barycentric_weights(problem.xs)      # Bobot umum O(n^2)
+    return BarycentricInterpolant(problem.xs, problem.b, w)
+
+
+def _fit_chebyshev_dct(problem):
+    return ChebyshevInterpolant(problem.b)
+
+
+register_solver(SolverSpec(
+    key="lu", label="LU (ours, P A = L U)", fit=_fit_lu,
+    flops=complexity.flops_lu, memory_bytes=complexity.memory_lu,
+    style="o-", needs_matrix=True, max_n=1000,
+))
+register_solver(SolverSpec(
+    key="lu-mixed", label="LU mixed (fp32 + refinement)", fit=_fit_lu_mixed,
+    flops=complexity.flops_lu_mixed, memory_bytes=complexity.memory_lu_mixed,
+    style="v-", needs_matrix=True, max_n=1000,
+))
+register_solver(SolverSpec(
+    key="newton", label="Newton/DivDiff", fit=_fit_newton,
+    flops=complexity.flops_newton, memory_bytes=complexity.memory_newton,
+    style="x--", max_n=10**4,
+))
+register_solver(SolverSpec(
+    key="bjorck-pereyra", label="Bjorck-Pereyra", fit=_fit_bjorck_pereyra,
+    flops=complexity.flops_bjorck_pereyra, memory_bytes=complexity.memory_bjorck_pereyra,
+    style="^-", max_n=10**4,
+))
+register_solver(SolverSpec(
+    key="subproduct-tree", label="Subproduct tree (FFT)", fit=_fit_subproduct_tree,
+    flops=complexity.flops_subproduct_tree, memory_bytes=complexity.memory_subproduct_tree,
+    style="*-", node_types=("roots-of-unity",), min_n=FAST_MIN_N, max_n=10**6,
+))
+register_solver(SolverSpec(
+    key="barycentric", label="Barycentric", fit=_fit_barycentric,
+    flops=complexity.flops_barycentric, memory_bytes=complexity.memory_barycentric,
+    output="interpolant", style="s:",
+))
+register_solver(SolverSpec(
+    key="chebyshev-dct", label="Chebyshev/DCT", fit=_fit_chebyshev_dct,
+    flops=complexity.flops_chebyshev_dct, memory_bytes=complexity.memory_chebyshev_dct,
+    output="interpolant", style="d-.", node_types=("chebyshev",),
+))
@@ -1,5 +1,7 @@
 import numpy as np
 
+from utils import builders, profiling
+
 def build_vandermonde(x):
     """
     Membentuk matriks Vandermonde berdasarkan titik x.
@@ -11,13 +13,21 @@ def build_vandermonde(x):
     [[1, 1, 1],
      [1, 2, 4],
      [1, 3, 9]]
+
+    Memakai builder bersama di utils.builders (rekursi pangkat tervektorisasi).
     """
-    x = np.asarray(x, dtype=float)          # Pastikan x berupa array float (bukan list)
-    n = x.size                              # Banyaknya titik (jumlah kolom & baris)
-    V = np.ones((n, n), dtype=float)        # Inisialisasi matriks dengan semua elemen = 1
-    for j in range(1, n):                   # Iterasi dari kolom ke-2 sampai terakhir
-        V[:, j] = V[:, j - 1] * x           # Setiap kolom j = kolom sebelumnya dikali x (rekursif)
-    return V                                # Kembalikan matriks Vandermonde
+    return builders.build_vandermonde(np.asarray(x, dtype=float))
+
+def _check_distinct_nodes(x):
+    """
+    Cek duplikat node sekali di awal (O(n log n)).
+    Setelah diurutkan, cukup membandingkan node yang bersebelahan
+    dengan toleransi yang sama seperti np.isclose(selisih, 0).
+    """
+    gaps = np.diff(np.sort(x))
+    if np.any(np.isclose(gaps, 0)):         # Jika ada titik yang sama, hentikan (duplikat node)
+        raise ValueError("Duplicate nodes.")
+
 
 def solve_vandermonde_bjorck_pereyra(x, b):
     """
@@ -26,32 +36,168 @@ def solve_vandermonde_bjorck_pereyra(x, b):
     Hasilnya adalah koefisien c dari polinomial interpolasi.
 
     Metode ini lebih stabil dan cepat dibanding langsung melakukan LU pada Vandermonde.
+    b boleh berupa vektor (n,) atau blok ruas kanan (n, m); semua kolom
+    diselesaikan bersamaan dan setiap level sweep adalah satu operasi array.
     """
     x = np.asarray(x, dtype=float)          # Pastikan x berupa array float
-    b = np.asarray(b, dtype=float).copy()   # Salin b agar tidak mengubah array aslinya
+    c = np.array(b, dtype=float)            # Salin b agar tidak mengubah array aslinya
     n = x.size                              # Banyaknya titik data
+    with profiling.span("bjorck_pereyra", n=n):
+        profiling.count("bytes_allocated", c.nbytes)
+        with profiling.span("check_distinct"):
+            _check_distinct_nodes(x)        # Cek duplikat node sekali saja
 
-    # --------------------------
-    # Forward sweep (devided differences)
-    # --------------------------
-    for k in range(n - 1):                  # Iterasi dari k=0 hingga n-2
-        denom = x[k + 1:] - x[k]            # Selisih antar titik x
-        if np.any(np.isclose(denom, 0)):    # Jika ada titik yang sama, hentikan (duplikat node)
-            raise ValueError("Duplicate nodes.")
-        b[k + 1:] = (b[k + 1:] - b[k]) / denom  # Update b sesuai formula Björck–Pereyra
-
-    # --------------------------
-    # Backward sweep (rekonstruksi koefisien)
-    # --------------------------
-    c = np.zeros(n, dtype=float)            # Inisialisasi array hasil koefisien
-    c[-1] = b[-1]                           # Koefisien terakhir langsung diambil dari b
-    for k in range(n - 2, -1, -1):          # Iterasi mundur dari n-2 ke 0
-        c[k] = b[k] - x[k] * c[k + 1]       # Hitung c[k] berdasarkan x[k] dan c[k+1]
-        for j in range(k + 1, n - 1):       # Koreksi elemen di antara (loop dalam)
-            c[j] = c[j] - x[k] * c[j + 1]   # Update koefisien antar langkah
+        # --------------------------
+        # Forward sweep (devided differences)
+        # --------------------------
+        with profiling.span("forward_sweep"):
+            for k in range(n - 1):          # Iterasi dari k=0 hingga n-2
+                denom = x[k + 1:] - x[k]    # Selisih antar titik x
+                c[k + 1:] = (c[k + 1:] - c[k]) / _as_column(denom, c)  # Update b sesuai formula Björck–Pereyra
+
+        # --------------------------
+        # Backward sweep (rekonstruksi koefisien)
+        # --------------------------
+        # Pada level k: c[k] = b[k] - x[k]*c[k+1] dan c[j] -= x[k]*c[j+1] untuk j = k+1..n-2.
+        # Semua memakai nilai c[j+1] dari level sebelumnya, jadi satu operasi slice per level.
+        with profiling.span("backward_sweep"):
+            for k in range(n - 2, -1, -1):  # Iterasi mundur dari n-2 ke 0
+                c[k:n - 1] -= x[k] * c[k + 1:]
     return c                                # Kembalikan array koefisien hasil
 
 
+def _as_column(v, b):
+    """Ubah vektor v (n,) agar bisa di-broadcast terhadap b berukuran (n,) atau (n, m)."""
+    return v.reshape((-1,) + (1,) * (b.ndim - 1))
+
+
+def solve_vandermonde_transpose_bjorck_pereyra(x, b):
+    """
+    Menyelesaikan sistem transpos V(x)^T * z = b dengan algoritma Björck–Pereyra (dual), O(n^2).
+    Di sini (V^T z)_j = sum_i x_i^j * z_i.
+    b boleh berupa vektor (n,) atau blok ruas kanan (n, m).
+
+    Setiap level dikerjakan sebagai satu operasi array (tanpa loop dalam).
+    """
+    x = np.asarray(x, dtype=float)          # Pastikan x berupa array float
+    z = np.array(b, dtype=float)            # Salin b agar tidak mengubah array aslinya
+    n = x.size                              # Banyaknya titik data
+    _check_distinct_nodes(x)                # Cek duplikat node sekali saja
+
+    # Sweep pertama: z(i) -= x(k) * z(i-1) untuk i = n-1..k+1 (memakai nilai lama z(i-1))
+    for k in range(n - 1):
+        z[k + 1:] = z[k + 1:] - x[k] * z[k:-1]
+
+    # Sweep kedua: pembagian dengan selisih node lalu selisih berurutan
+    for k in range(n - 2, -1, -1):
+        denom = x[k + 1:] - x[:n - k - 1]   # x(i) - x(i-k-1) untuk i = k+1..n-1
+        z[k + 1:] /= _as_column(denom, z)
+        z[k:n - 1] = z[k:n - 1] - z[k + 1:]
+    return z
+
+
+class VandermondeSolver:
+    """
+    Solver terstruktur untuk V(x) dengan antarmuka yang sama seperti LUFactorization
+    (solve dan solve_transpose), sehingga bisa dipakai oleh estimator condition
+    number tanpa membentuk atau memfaktorkan V. Setiap solve hanya O(n^2).
+    """
+
+    def __init__(self, x):
+        self.x = np.asarray(x, dtype=float)
+
+    @property
+    def n(self):
+        return self.x.size                  # Ukuran sistem
+
+    def solve(self, b):
+        """Menyelesaikan V(x) * c = b."""
+        return solve_vandermonde_bjorck_pereyra(self.x, b)
+
+    def solve_transpose(self, b):
+        """Menyelesaikan V(x)^T * z = b."""
+        return solve_vandermonde_transpose_bjorck_pereyra(self.x, b)
+
+
+class VandermondeOperator:
+    """
+    Operator Vandermonde matrix-free: V[i, j] = x_i^j dengan i = 0..m-1, j = 0..k-1.
+    Matriks V tidak pernah dibentuk kecuali toarray() dipanggil, sehingga
+    memori yang dipakai hanya O(m) (ditambah satu chunk kerja).
+
+    - matvec(c)  : V @ c memakai Horner tervektorisasi atas semua node
+    - rmatvec(y) : V^T @ y memakai akumulasi power-sum sum_i y_i * x_i^j
+    - residual(c, b) : b - V @ c
+    - toarray()  : bentuk V padat (hanya jika benar-benar dibutuhkan)
+
+    c dan y boleh berupa vektor atau blok kolom (…, p). Node diproses per chunk
+    sebanyak chunk_size baris agar memori kerja tetap terbatas untuk m besar.
+    dtype menentukan presisi perhitungan (misalnya np.longdouble untuk residual
+    extended pada iterative refinement).
+    """
+
+    def __init__(self, x, ncols=None, chunk_size=1 << 16, dtype=np.float64):
+        self.dtype = np.dtype(dtype)
+        self.x = np.asarray(x, dtype=self.dtype).ravel()
+        self.ncols = self.x.size if ncols is None else int(ncols)  # Default: V persegi
+        self.chunk_size = max(1, int(chunk_size))
+
+    @property
+    def shape(self):
+        return (self.x.size, self.ncols)   # (jumlah node m, jumlah koefisien k)
+
+    def _chunks(self):
+        """Iterasi slice baris (node) per chunk."""
+        m = self.x.size
+        for start in range(0, m, self.chunk_size):
+            yield slice(start, min(start + self.chunk_size, m))
+
+    def matvec(self, c):
+        """
+        Menghitung V @ c tanpa membentuk V (Horner):
+            p(x) = c0 + x*(c1 + x*(c2 + ...))
+        """
+        c = np.asarray(c, dtype=self.dtype)
+        if c.shape[0] != self.ncols:
+            raise ValueError(f"Coefficient vector must have length {self.ncols}.")
+        out = np.zeros((self.x.size,) + c.shape[1:], dtype=self.dtype)
+        if self.ncols == 0:
+            return out
+        for rows in self._chunks():
+            xc = _as_column(self.x[rows], c)  # Node chunk ini (siap broadcast ke blok)
+            y = out[rows]                   # View ke output, diisi in-place
+            y[...] = c[-1]                  # Mulai dari koefisien tertinggi
+            for j in range(self.ncols - 2, -1, -1):
+                y *= xc                     # y = y * x + c_j
+                y += c[j]
+        return out
+
+    def rmatvec(self, y):
+        """
+        Menghitung V^T @ y tanpa membentuk V:
+            (V^T y)_j = sum_i y_i * x_i^j  (akumulasi power-sum per chunk)
+        """
+        y = np.asarray(y, dtype=self.dtype)
+        if y.shape[0] != self.x.size:
+            raise ValueError(f"Vector must have length {self.x.size}.")
+        out = np.zeros((self.ncols,) + y.shape[1:], dtype=self.dtype)
+        for rows in self._chunks():
+            xc = _as_column(self.x[rows], y)
+            p = y[rows].copy()              # p = y_i * x_i^0
+            for j in range(self.ncols):
+                out[j] += p.sum(axis=0)     # Tambahkan sum_i y_i * x_i^j
+                p *= xc                     # Naikkan pangkat: y_i * x_i^(j+1)
+        return out
+
+    def residual(self, c, b):
+        """Residual b - V @ c (matrix-free)."""
+        return np.asarray(b, dtype=self.dtype) - self.matvec(c)
+
+    def toarray(self):
+        """Membentuk matriks V padat berukuran (m, k) dengan rekursi kolom."""
+        return builders.build_vandermonde(self.x, ncols=self.ncols, dtype=self.dtype)
+
+
 def divided_differences(xs, ys):
     """
     Menghitung koefisien Newton (divided differences) untuk polinomial interpolasi
@@ -86,13 +232,317 @@ def newton_poly_eval_coefs(xs, coef):
         poly  = koefisien bentuk monomial [c0, c1, c2, ...]
     """
     n = len(xs)                             # Jumlah titik data
-    poly = np.array([coef[-1]], dtype=float)  # Mulai dari suku tertinggi (koefisien terakhir)
+    xs = np.asarray(xs, dtype=float)
+    # Koefisien disimpan terbalik (suku tertinggi di depan) dalam satu buffer berukuran n,
+    # sehingga perkalian dengan (x - x_k) cukup satu update slice tanpa alokasi ulang.
+    poly = np.zeros(n, dtype=float)
+    scratch = np.empty(n, dtype=float)      # Buffer kerja untuk x_k * poly
+    poly[0] = coef[-1]                      # Mulai dari suku tertinggi (koefisien terakhir)
 
     # Iterasi mundur dari koefisien ke-(n-2) hingga 0
-    for k in range(n - 2, -1, -1):
-        shifted = np.zeros(len(poly) + 1, dtype=float)  # Membuat ruang untuk menambah derajat polinomial
-        shifted[1:] = poly                              # Geser seluruh suku ke kanan (x * poly)
-        shifted[:-1] -= xs[k] * poly                    # Hitung (x - x_k) * poly
-        poly = shifted                                  # Update poly dengan hasil perkalian
-        poly[0] += coef[k]                              # Tambahkan koefisien Newton ke suku konstan
-    return poly                                         # Kembalikan koefisien monomial hasil konversi
\ No newline at end of file
+    for deg, k in enumerate(range(n - 2, -1, -1)):
+        np.multiply(poly[:deg + 1], xs[k], out=scratch[:deg + 1])
+        poly[1:deg + 2] -= scratch[:deg + 1]  # Hitung (x - x_k) * poly
+        poly[deg + 1] += coef[k]            # Tambahkan koefisien Newton ke suku konstan
+    poly = poly[::-1].copy()                # Kembalikan ke urutan [c0, c1, c2, ...]
+    return poly                                         # Kembalikan koefisien monomial hasil konversi
+
+
+class NewtonInterpolant:
+    """
+    Polinomial interpolasi dalam bentuk Newton yang dievaluasi langsung
+    (tanpa konversi ke basis monomial):
+        P(t) = c0 + (t - x0)*(c1 + (t - x1)*(c2 + ...))
+    Bentuk bersarang ini O(n) per titik dan lebih stabil daripada
+    mengevaluasi koefisien monomial hasil newton_poly_eval_coefs.
+
+    Cara pakai:
+        p = NewtonInterpolant.from_data(xs, ys)   # atau NewtonInterpolant(xs, divided_differences(xs, ys))
+        y = p(t)                                  # t berukuran bebas
+        p(t, out=buffer)                          # tulis ke buffer milik pemanggil
+        for y_chunk in p.evaluate_chunks(chunks): # stream chunk demi chunk
+            ...
+
+    Titik evaluasi diproses per chunk sebanyak chunk_size sehingga memori
+    kerja tambahan hanya satu buffer berukuran chunk_size.
+    """
+
+    def __init__(self, xs, coef, chunk_size=1 << 16):
+        self.xs = np.asarray(xs, dtype=float).ravel()      # Pusat bentuk Newton (node)
+        self.coef = np.asarray(coef, dtype=float).ravel()  # Koefisien divided differences
+        if self.coef.size == 0 or self.coef.size != self.xs.size:
+            raise ValueError("Newton form needs one coefficient per node.")
+        self.chunk_size = max(1, int(chunk_size))
+
+    @classmethod
+    def from_data(cls, xs, ys, **kwargs):
+        """Membangun interpolant langsung dari titik data (xs, ys)."""
+        return cls(xs, divided_differences(xs, ys), **kwargs)
+
+    @property
+    def degree(self):
+        return self.coef.size - 1           # Derajat polinomial
+
+    def _eval_into(self, t, y, scratch):
+        """Skema bersarang Newton untuk satu chunk 1-D: hasil ditulis ke y."""
+        y.fill(self.coef[-1])
+        for k in range(self.coef.size - 2, -1, -1):
+            np.subtract(t, self.xs[k], out=scratch)  # (t - x_k)
+            y *= scratch
+            y += self.coef[k]
+
+    def __call__(self, t, out=None):
+        """
+        Evaluasi P(t). Jika `out` diberikan (array float berukuran sama dengan t),
+        hasil ditulis ke sana tanpa alokasi array hasil baru.
+        """
+        t = np.asarray(t, dtype=float)
+        if out is None:
+            out = np.empty(t.shape, dtype=float)
+        elif out.shape != t.shape or out.dtype != np.float64:
+            raise ValueError("Output buffer must be a float64 array with the same shape as t.")
+        t_flat = t.reshape(-1)
+        out_flat = out.reshape(-1)          # View jika out kontigu
+        scratch = np.empty(min(self.chunk_size, t_flat.size), dtype=float)
+        for start in range(0, t_flat.size, self.chunk_size):
+            stop = min(start + self.chunk_size, t_flat.size)
+            self._eval_into(t_flat[start:stop], out_flat[start:stop], scratch[:stop - start])
+        if not np.shares_memory(out_flat, out):
+            out[...] = out_flat.reshape(out.shape)  # out tidak kontigu: salin balik
+        return out
+
+    def evaluate_chunks(self, chunks, out=None):
+        """
+        Evaluasi streaming untuk iterable/generator berisi chunk titik t.
+        Menghasilkan (yield) nilai P untuk setiap chunk, sehingga memori
+        tetap terbatas walau total titik sangat banyak.
+        Jika `out` diberikan, hasil setiap chunk ditulis berurutan ke `out`
+        dan yang di-yield adalah view ke bagian `out` tersebut.
+        """
+        pos = 0
+        for chunk in chunks:
+            chunk = np.asarray(chunk, dtype=float).ravel()
+            if out is None:
+                yield self(chunk)
+            else:
+                target = out[pos:pos + chunk.size]
+                if target.size != chunk.size:
+                    raise ValueError("Output buffer is too small for the streamed chunks.")
+                yield self(chunk, out=target)
+                pos += chunk.size
+
+    def to_monomial(self):
+        """Konversi ke koefisien monomial (hanya untuk perbandingan)."""
+        return newton_poly_eval_coefs(self.xs, self.coef)
+
+
+class IncrementalNewtonInterpolant:
+    """
+    Interpolant Newton yang dibangun bertahap (online): node datang satu per satu.
+
+    Selain koefisien c_k = f[x_0..x_k], disimpan juga diagonal terakhir tabel
+    divided differences, d_i = f[x_i..x_{n-1}]. Menambah node (x, y) cukup
+    memperbarui diagonal itu dari belakang:
+        d'_n = y,   d'_i = (d'_{i+1} - d_i) / (x - x_i),   c_n = d'_0
+    sehingga biayanya O(n) per node (bukan O(n^2) untuk fit ulang).
+
+    Dengan max_nodes, interpolant menjadi jendela geser: saat penuh, node tertua
+    dibuang lebih dulu memakai identitas
+        c'_k = c_k + (x_{k+1} - x_0) c_{k+1}
+    (juga O(n)); diagonal d cukup digeser satu posisi.
+
+    Cara pakai:
+        p = IncrementalNewtonInterpolant(max_nodes=64)
+        for x, y in stream:
+            p.append(x, y)
+            y_hat = p(t)
+    """
+
+    def __init__(self, max_nodes=None, chunk_size=1 << 16):
+        if max_nodes is not None and max_nodes < 1:
+            raise ValueError("max_nodes must be positive.")
+        self.max_nodes = max_nodes
+        self.chunk_size = chunk_size
+        capacity = max_nodes if max_nodes is not None else 16
+        self._xs = np.empty(capacity)       # Node (hanya n elemen pertama yang terpakai)
+        self._ys = np.empty(capacity)       # Nilai data (untuk refit)
+        self._coef = np.empty(capacity)     # c_k = f[x_0..x_k]
+        self._diag = np.empty(capacity)     # d_i = f[x_i..x_{n-1}]
+        self._n = 0
+
+    @property
+    def n(self):
+        return self._n                      # Banyaknya node saat ini
+
+    @property
+    def degree(self):
+        return self._n - 1
+
+    @property
+    def xs(self):
+        return self._xs[:self._n]
+
+    @property
+    def ys(self):
+        return self._ys[:self._n]
+
+    @property
+    def coef(self):
+        return self._coef[:self._n]
+
+    def _reserve(self, size):
+        """Memperbesar buffer (kapasitas dua kali lipat) bila belum cukup."""
+        if size <= self._xs.size:
+            return
+        capacity = max(size, 2 * self._xs.size)
+        for name in ("_xs", "_ys", "_coef", "_diag"):
+            buf = np.empty(capacity)
+            buf[:self._n] = getattr(self, name)[:self._n]
+            setattr(self, name, buf)
+
+    def append(self, x, y):
+        """Menambah satu node (x, y) dalam O(n); node tertua dibuang jika jendela penuh."""
+        x, y = float(x), float(y)
+        full = self.max_nodes is not None and self._n == self.max_nodes
+        if np.any(np.isclose(self._xs[int(full):self._n] - x, 0)):  # Node yang tetap tinggal
+            raise ValueError("Duplicate nodes.")
+        if full:
+            self.drop_oldest()
+        n = self._n
+        self._reserve(n + 1)
+        xs, d = self._xs[:n].tolist(), self._diag[:n].tolist()  # Float Python: loop skalar lebih cepat
+        new = d + [y]                       # d'_n = y
+        for i in range(n - 1, -1, -1):
+            new[i] = (new[i + 1] - d[i]) / (x - xs[i])
+        self._diag[:n + 1] = new
+        self._xs[n] = x
+        self._ys[n] = y
+        self._coef[n] = new[0]              # f[x_0..x_n]
+        self._n = n + 1
+        return self
+
+    def extend(self, xs, ys):
+        """Menambah banyak node berurutan (setara append satu per satu)."""
+        for x, y in zip(np.ravel(xs), np.ravel(ys)):
+            self.append(x, y)
+        return self
+
+    def drop_oldest(self):
+        """Membuang node tertua x_0 dalam O(n); bentuk Newton berpusat ulang di x_1..x_{n-1}."""
+        n = self._n
+        if n == 0:
+            raise ValueError("No nodes to drop.")
+        xs, c = self._xs, self._coef
+        c[:n - 1] += (xs[1:n] - xs[0]) * c[1:n]   # c'_k = c_k + (x_{k+1} - x_0) c_{k+1}
+        for buf in (xs, self._ys, self._diag):
+            buf[:n - 1] = buf[1:n]
+        self._n = n - 1
+        return self
+
+    def refit(self):
+        """
+        Menghitung ulang c dan d dari node dan nilai yang tersimpan (O(n^2)).
+        Berguna untuk menghapus akumulasi pembulatan setelah banyak pergeseran jendela.
+        """
+        n = self._n
+        if n:
+            self._coef[:n] = divided_differences(self.xs, self.ys)
+            self._diag[:n] = divided_differences(self.xs[::-1], self.ys[::-1])[::-1]
+        return self
+
+    def to_interpolant(self):
+        """Salinan bentuk Newton saat ini sebagai NewtonInterpolant (tidak ikut berubah)."""
+        return NewtonInterpolant(self.xs.copy(), self.coef.copy(), chunk_size=self.chunk_size)
+
+    def __call__(self, t, out=None):
+        """Evaluasi P(t) dengan skema bersarang Newton (lihat NewtonInterpolant)."""
+        return NewtonInterpolant(self.xs, self.coef, chunk_size=self.chunk_size)(t, out=out)
+
+    def to_monomial(self):
+        """Konversi ke koefisien monomial (hanya untuk perbandingan)."""
+        return newton_poly_eval_coefs(self.xs, self.coef)
+
+# --------------------------
+# Versi batch: banyak himpunan node sekaligus
+# --------------------------
+# Semua fungsi di bawah menerima array bertumpuk (batch, n): setiap baris adalah
+# satu himpunan node / nilai yang independen. Loop Python hanya berjalan sebanyak
+# n level, sedangkan sumbu batch divektorisasi. Baris dengan node duplikat tidak
+# menimbulkan error, tetapi ditandai di mask `duplicate` dan hasilnya diisi NaN.
+
+def _as_batch(X, Y):
+    """Validasi dan salin input batch menjadi array float (batch, n)."""
+    X = np.array(X, dtype=float, ndmin=2)
+    Y = np.array(Y, dtype=float, ndmin=2)
+    if X.ndim != 2 or X.shape != Y.shape:
+        raise ValueError("Batched inputs must be 2-D arrays of the same shape (batch, n).")
+    return X, Y
+
+
+def duplicate_node_mask(X):
+    """
+    Mengembalikan mask boolean (batch,): True jika baris X memiliki node duplikat
+    (toleransi sama seperti pengecekan pada versi skalar).
+    """
+    X = np.array(X, dtype=float, ndmin=2)
+    gaps = np.diff(np.sort(X, axis=1), axis=1)
+    return np.any(np.isclose(gaps, 0), axis=1)
+
+
+def divided_differences_batched(X, Y):
+    """
+    Versi batch dari divided_differences.
+
+    Input:
+        X, Y = array (batch, n), setiap baris satu himpunan titik (xs, ys)
+    Output:
+        coef      = koefisien Newton (batch, n), baris duplikat berisi NaN
+        duplicate = mask (batch,) baris yang memiliki node duplikat
+    """
+    X, coef = _as_batch(X, Y)               # coef dimulai dari salinan Y
+    n = X.shape[1]
+    duplicate = duplicate_node_mask(X)
+    with np.errstate(divide="ignore", invalid="ignore"):  # Baris duplikat ditangani lewat mask
+        for j in range(1, n):
+            coef[:, j:] = (coef[:, j:] - coef[:, j - 1:n - 1]) / (X[:, j:] - X[:, :n - j])
+    coef[duplicate] = np.nan
+    return coef, duplicate
+
+
+def newton_poly_eval_coefs_batched(X, coef):
+    """
+    Versi batch dari newton_poly_eval_coefs: mengubah koefisien Newton
+    (batch, n) menjadi koefisien monomial (batch, n) untuk setiap baris.
+    """
+    X, coef = _as_batch(X, coef)
+    batch, n = X.shape
+    poly = np.zeros((batch, n), dtype=float)  # Dialokasikan sekali untuk derajat penuh
+    poly[:, 0] = coef[:, -1]                # Mulai dari suku tertinggi (koefisien terakhir)
+    for deg, k in enumerate(range(n - 2, -1, -1)):
+        prev = poly[:, :deg + 1].copy()     # Koefisien polinomial derajat `deg`
+        poly[:, 1:deg + 2] = prev           # x * poly
+        poly[:, 0] = 0.0
+        poly[:, :deg + 1] -= X[:, k:k + 1] * prev  # (x - x_k) * poly
+        poly[:, 0] += coef[:, k]            # Tambahkan koefisien Newton ke suku konstan
+    return poly
+
+
+def solve_vandermonde_bjorck_pereyra_batched(X, B):
+    """
+    Versi batch dari solve_vandermonde_bjorck_pereyra: menyelesaikan
+    V(X[r]) * c[r] = B[r] untuk setiap baris r.
+
+    Output:
+        c         = koefisien monomial (batch, n), baris duplikat berisi NaN
+        duplicate = mask (batch,) baris yang memiliki node duplikat
+    """
+    X, c = _as_batch(X, B)                  # c dimulai dari salinan B
+    n = X.shape[1]
+    duplicate = duplicate_node_mask(X)
+    with np.errstate(divide="ignore", invalid="ignore"):  # Baris duplikat ditangani lewat mask
+        for k in range(n - 1):              # Forward sweep
+            c[:, k + 1:] = (c[:, k + 1:] - c[:, k:k + 1]) / (X[:, k + 1:] - X[:, k:k + 1])
+        for k in range(n - 2, -1, -1):      # Backward sweep
+            c[:, k:n - 1] -= X[:, k:k + 1] * c[:, k + 1:]
+    c[duplicate] = np.nan
+    return c, duplicate
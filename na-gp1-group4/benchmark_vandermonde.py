@@ -0,0 +1,78 @@
+import argparse
+import os
+import sys
+from functools import partial
+
+import numpy as np
+
+# Impor fungsi dan modul yang sudah dibuat dalam folder proyek
+from algorithms.registry import InterpolationProblem, solvers_for
+from algorithms.vandermonde import VandermondeOperator
+from utils.benchmark import compare_to_baseline, load_results, run_meta, run_suite, write_results
+from utils.builders import NODE_FAMILIES, make_nodes
+
+# KONFIGURASI BENCHMARK
+DEFAULT_SIZES = [5, 10, 25, 50, 100, 500, 1000]
+DEFAULT_OUTPUT = "outputs/benchmarks/vandermonde.json"
+
+
+def build_cases(node_type, sizes, seed=42):
+    """
+    Menyiapkan kasus (solver, n, func) untuk setiap solver terdaftar dan ukuran n.
+    Data (node, nilai b, dan V padat jika dibutuhkan) dibuat sekali di luar
+    fungsi yang diukur, sehingga yang diukur hanya pekerjaan solver.
+    """
+    cases = []
+    for n in sizes:
+        xs = make_nodes(node_type, n)
+        coef = np.random.default_rng(seed).uniform(-1, 1, size=n)
+        problem = InterpolationProblem(xs, VandermondeOperator(xs).matvec(coef), node_type)
+        for spec in solvers_for(node_type, n):
+            if spec.needs_matrix:
+                problem.V                           # Bentuk V padat di luar pengukuran waktu
+            cases.append((spec.label, n, partial(spec.fit, problem)))
+    return cases
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark statistik untuk solver Vandermonde.")
+    parser.add_argument("--nodes", choices=list(NODE_FAMILIES), default="chebyshev")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--repeats", type=int, default=7, help="Jumlah sampel per kasus")
+    parser.add_argument("--warmup", type=int, default=1, help="Jumlah pemanggilan pemanasan yang dibuang")
+    parser.add_argument("--min-sample-time", type=float, default=0.02, help="Durasi minimum per sampel (detik)")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="File JSON hasil benchmark")
+    parser.add_argument("--baseline", help="File JSON baseline untuk dibandingkan")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Batas regresi relatif (0.10 = 10%%)")
+    args = parser.parse_args(argv)
+
+    cases = build_cases(args.nodes, args.sizes)
+    with np.errstate(all="ignore"):             # Overflow pada n besar tidak relevan untuk pengukuran waktu
+        results = run_suite(cases, warmup=args.warmup, repeats=args.repeats,
+                            min_sample_time=args.min_sample_time)
+
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    write_results(results, args.output, nodes=args.nodes)
+    print(f"\n Benchmark results saved to {args.output}")
+
+    if args.baseline:
+        baseline, baseline_meta = load_results(args.baseline, with_meta=True)
+        try:
+            report = compare_to_baseline(results, baseline, threshold=args.threshold,
+                                         meta=run_meta(nodes=args.nodes), baseline_meta=baseline_meta)
+        except ValueError as exc:
+            print(f"\n {exc}")
+            return 2
+        regressions = [r for r in report if r["regression"]]
+        for r in report:
+            flag = "REGRESSION" if r["regression"] else "ok"
+            print(f"{r['solver']:<24} n={r['n']:<7} {r['baseline_ms']:.4f} -> {r['current_ms']:.4f} ms "
+                  f"(x{r['ratio']:.2f}) {flag}")
+        if regressions:
+            print(f"\n {len(regressions)} regression(s) above {args.threshold:.0%}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
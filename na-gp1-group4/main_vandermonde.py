@@ -1,135 +1,277 @@
+import argparse
 import csv
-import numpy as np
-import pandas as pd
+import os
+import statistics
+import sys
 import time
-import matplotlib.pyplot as plt
+from contextlib import nullcontext
+
+from utils.parallel import cell_rng, map_cells, set_blas_threads
+
+# --blas-threads berlaku untuk mode serial maupun paralel. BLAS membaca jumlah thread saat
+# numpy pertama kali dimuat, jadi saat dijalankan sebagai skrip batasnya dipasang di sini,
+# sebelum import numpy (jika modul ini di-import, map_cells memakai threadpoolctl).
+if __name__ == "__main__":
+    _early_parser = argparse.ArgumentParser(add_help=False)
+    _early_parser.add_argument("--blas-threads", type=int, default=1)   # = BLAS_THREADS
+    set_blas_threads(_early_parser.parse_known_args()[0].blas_threads)
+
+import numpy as np
 
 # Impor fungsi dan modul yang sudah dibuat dalam folder proyek
-from algorithms.lu import lu_decompose, solve_lu
-from algorithms.vandermonde import divided_differences, newton_poly_eval_coefs
-from utils.builders import build_vandermonde
-from utils.metrics import compute_condition_number, relative_error
-from utils.complexity import estimate_flops, estimate_memory_bytes
-
-# KONFIGURASI EKSPERIMEN
-OUTPUT_PATH = "outputs/vandermonde/results_with_chebyshev.csv"  # Lokasi file hasil eksperimen
+# (pandas dan matplotlib hanya di-import saat plotting, lihat plot_results)
+from algorithms.registry import InterpolationProblem, get_solver, solvers_for
+from algorithms.vandermonde import VandermondeOperator
+from utils.builders import NODE_FAMILIES, chebyshev_nodes, make_nodes, roots_of_unity_nodes
+from utils.cache import ResultCache, result_key
+from utils.metrics import compute_condition_number, relative_error, vandermonde_condition_bounds
+from utils.complexity import achieved_gflops, fit_scaling_exponent
+from utils.memory import measure_peak_memory
+from utils import profiling
+
+# KONFIGURASI EKSPERIMEN (nilai default; bisa diganti lewat argumen command line)
+OUTPUT_DIR = "outputs/vandermonde"          # Folder semua hasil (CSV, cache, gambar)
+RESULTS_FILE = "results_with_chebyshev.csv" # Nama file hasil eksperimen utama
 N_VALUES = [5, 10, 25, 50, 100, 500, 1000]  # Ukuran matriks yang diuji
 NODE_TYPES = ["equispaced", "chebyshev"]    # Jenis distribusi titik (node)
+SEED = 42                                   # Seed dasar (diturunkan per sel)
+REPEATS = 1                                 # Pengukuran waktu per solver (median yang dilaporkan)
+WORKERS = 1                                 # Jumlah proses paralel (1 = serial)
+BLAS_THREADS = 1                            # Thread BLAS per proses (serial maupun per worker)
+CACHE_SUBDIR = "cache"                      # Cache hasil per (node, n, solver, seed, versi kode)
+COND_EST_MAX_N = 1000                       # Di atas n ini cond1_est hanya dihitung jika LU sudah ada
+
+# KONFIGURASI UJI SKALA (hanya solver cepat, node Chebyshev)
+LARGE_RESULTS_FILE = "results_chebyshev_large_n.csv"
+LARGE_N_VALUES = [10**3, 10**4, 10**5, 10**6]  # Ukuran n untuk uji skala (dibatasi max_n tiap solver)
+N_CHECK_POINTS = 1000                          # Banyaknya titik uji untuk error relatif
+
+# KONFIGURASI UJI SKALA AKAR SATUAN (solver cepat basis monomial, node kompleks terkondisi baik)
+UNITY_RESULTS_FILE = "results_roots_of_unity.csv"
+UNITY_N_VALUES = [2**12, 2**14, 10**5, 10**6]  # Dibatasi min_n/max_n tiap solver
+
+# KONFIGURASI FIT SKALA EMPIRIS (waktu ≈ C * n^p)
+SCALING_FIT_FILE = "scaling_fits.csv"
+FIT_MIN_N = 100             # Titik dengan n lebih kecil didominasi overhead, tidak ikut di-fit
+EXPONENT_TOLERANCE = 0.5    # Selisih eksponen empiris vs model yang dianggap mencurigakan
+
+RESULT_HEADER = [
+    "nodes", "n", "solver", "time_ms", "rel_err",
+    "cond1_est", "cond1_bound", "flops_model", "mem_model_bytes",
+    "mem_peak_bytes", "mem_ratio", "gflops", "fell_back", "refine_steps"
+]
 
 # FUNGSI BANTU: Pengukur waktu eksekusi
-def measure_time(func, *args, **kwargs):
+def measure_time(func, *args, repeats=1, **kwargs):
     """
     Mengukur lama waktu eksekusi sebuah fungsi (dalam milidetik).
     Digunakan untuk mencatat performa setiap solver.
+    Dengan repeats > 1 fungsi dijalankan berulang dan median waktunya yang dilaporkan.
     """
-    start = time.perf_counter()               # Waktu mulai (presisi tinggi)
-    result = func(*args, **kwargs)            # Jalankan fungsi yang diukur
-    end = time.perf_counter()                 # Waktu akhir
-    return result, (end - start) * 1000.0     # Kembalikan hasil dan waktu dalam milidetik
+    times = []
+    for _ in range(max(1, int(repeats))):
+        start = time.perf_counter()           # Waktu mulai (presisi tinggi)
+        result = func(*args, **kwargs)        # Jalankan fungsi yang diukur
+        end = time.perf_counter()             # Waktu akhir
+        times.append((end - start) * 1000.0)
+    return result, statistics.median(times)   # Kembalikan hasil dan waktu dalam milidetik
 
-# MAIN EXPERIMENT
-def run_vandermonde_experiment():
-    rows = [] # Menyimpan hasil seluruh eksperimen dalam bentuk list baris
-    header = [
-        "nodes", "n", "solver", "time_ms", "rel_err",
-        "cond1_est", "flops_model", "mem_model_bytes"
-    ]
+# FUNGSI BANTU: Memori dan laju FLOP terukur
+def measured_columns(pipeline, flops_model, mem_model, time_ms):
+    """
+    Menjalankan ulang pipeline solver (tanpa argumen) di bawah tracemalloc untuk
+    mengukur puncak alokasi memori, lalu menghitung rasio terhadap model memori
+    dan laju GFLOP/s yang dicapai dari waktu terukur.
+    Return: [mem_peak_bytes, mem_ratio, gflops]
+    """
+    _, peak = measure_peak_memory(pipeline)   # Panggilan terpisah (tidak ikut diukur waktunya)
+    ratio = peak / mem_model if mem_model else float("nan")
+    return [peak, ratio, achieved_gflops(flops_model, time_ms)]
 
-    # Loop melalui setiap jenis node dan setiap ukuran n
-    for node_type in NODE_TYPES:
-        for n in N_VALUES:
-            print(f"Running experiment for {node_type} nodes, n={n} ...")
+# FUNGSI BANTU: Pilihan solver
+def selected_solvers(node_type, solver_keys=None, n=None):
+    """Solver terdaftar untuk jenis node (dan n), dibatasi ke solver_keys jika diberikan."""
+    return [spec for spec in solvers_for(node_type, n) if solver_keys is None or spec.key in solver_keys]
 
-            # Bangun titik-titik node (equispaced atau Chebyshev)
-            if node_type == "equispaced":
-                xs = np.linspace(-1, 1, n) # Titik berjarak sama
-            elif node_type == "chebyshev":
-                # Titik Chebyshev tersebar lebih rapat di tepi interval
-                xs = np.cos(np.pi * (2 * np.arange(1, n + 1) - 1) / (2 * n))
+# SATU SEL EKSPERIMEN: (jenis node, n)
+def run_cell(node_type, n, seed=SEED, cache_dir=None, force=False, solver_keys=None, repeats=REPEATS):
+    """
+    Menjalankan solver terpilih untuk satu sel (node_type, n) dan mengembalikan
+    baris-baris CSV-nya. Sel-sel saling independen sehingga bisa dijalankan
+    paralel; fungsi ini berada di tingkat modul agar bisa dikirim ke worker.
+
+    Setiap baris disimpan di cache disk dengan kunci (node_type, n, solver, seed, repeats, versi kode).
+    Solver yang hasilnya sudah ada di cache dilewati (kecuali force=True);
+    cache_dir=None mematikan cache.
+    """
+    cache = ResultCache(cache_dir) if cache_dir else None
+    specs = selected_solvers(node_type, solver_keys, n)     # Menghormati min_n/max_n tiap solver
+    keys = {spec.key: result_key(node_type, n, spec.key, seed, repeats=repeats) for spec in specs}
+    cached = {}
+    if cache is not None and not force:
+        cached = {k: row for k, key in keys.items() if (row := cache.get(key)) is not None}
+    pending = [spec for spec in specs if spec.key not in cached]
+    if not pending:
+        print(f"Cached: {node_type} nodes, n={n}")
+        return [cached[spec.key] for spec in specs]
+
+    print(f"Running experiment for {node_type} nodes, n={n} ...")
+
+    with profiling.span("cell", nodes=node_type, n=n):
+        with profiling.span("build_problem"):
+            # Bangun titik-titik node (equispaced, Chebyshev, ekstrem Chebyshev, atau urutan Leja)
+            xs = make_nodes(node_type, n)
 
             # Bangun sistem Vandermonde V * coef = b
-            true_coef = np.random.default_rng(42).uniform(-1, 1, size=n)  # Koefisien acak untuk polinomial
-            V = build_vandermonde(xs)                                     # Matriks Vandermonde
-            b = V @ true_coef                                             # Hitung nilai f(x) = V*c
-            cond_est = compute_condition_number(V)                        # Hitung condition number (κ₁(V))
-
-            # Solver 1: LU Decomposition
-            (L, U, P), time_lu_ms = measure_time(lu_decompose, V)         # Dekomposisi LU
-            x_lu, time_solve_ms = measure_time(solve_lu, V, b)            # Penyelesaian sistem LU
-            total_time_lu = time_lu_ms + time_solve_ms                    # Total waktu = faktorisasi + solusi
-
-            err_rel_lu = relative_error(V @ x_lu, b)                      # Error relatif hasil LU
-            flops_lu = estimate_flops("lu", n)                            # Estimasi FLOPs
-            mem_lu = estimate_memory_bytes("lu", n)                       # Estimasi memori
-
-            rows.append([
-                node_type, n, "LU (ours, P A = L U)",
-                total_time_lu, err_rel_lu, cond_est, flops_lu, mem_lu
-            ])
-
-            # Solver 2: Newton / Divided Differences
-            coef_newton, time_newton_ms = measure_time(divided_differences, xs, b)
-            poly_coef, time_poly_ms = measure_time(newton_poly_eval_coefs, xs, coef_newton)
-            total_time_newton = time_newton_ms + time_poly_ms
-
-            err_rel_newton = relative_error(V @ poly_coef, b)             # Error relatif Newton
-            flops_newton = estimate_flops("newton", n)                    # Estimasi FLOPs
-            mem_newton = estimate_memory_bytes("newton", n)               # Estimasi memori
-
-            rows.append([
-                node_type, n, "Newton/DivDiff",
-                total_time_newton, err_rel_newton, cond_est, flops_newton, mem_newton
-            ])
-
-    # Simpan hasil ke file CSV
-    with open(OUTPUT_PATH, "w", newline="") as f:
+            true_coef = cell_rng(seed, node_type, n).uniform(-1, 1, size=n)  # Koefisien acak (seed per sel)
+            V_op = VandermondeOperator(xs)                        # Operator V matrix-free (tanpa matriks padat)
+            b = V_op.matvec(true_coef)                            # Hitung nilai f(x) = V*c (Horner)
+            problem = InterpolationProblem(xs, b, node_type)      # Data bersama untuk semua solver
+
+            # Residual di node selalu nol untuk interpolant (barycentric, Chebyshev), jadi untuk solver
+            # tersebut error diukur di titik tengah antar node terhadap polinomial sebenarnya (Horner)
+            xs_sorted = np.sort(xs)
+            t_check = 0.5 * (xs_sorted[1:] + xs_sorted[:-1])
+            p_true = VandermondeOperator(t_check, ncols=n).matvec(true_coef)
+
+        # Jalankan setiap solver yang belum ada di cache
+        results = []
+        for spec in pending:
+            if spec.needs_matrix:
+                with profiling.span("build_matrix"):
+                    problem.V                                     # Bentuk V padat di luar pengukuran waktu
+            problem.info = {}                                     # Diagnostik solver ini (jika ada)
+            with profiling.span(f"solve[{spec.key}]"):
+                result, time_ms = measure_time(spec.fit, problem, repeats=repeats)
+            info = problem.info
+            with profiling.span("residual"):
+                if spec.output == "monomial":
+                    err_rel = relative_error(V_op.matvec(result), b)  # Residual relatif di node
+                else:
+                    err_rel = relative_error(result(t_check), p_true)  # Error relatif di titik tengah
+            results.append((spec, time_ms, err_rel, info))
+
+        # Batas atas Gautschi untuk κ₁(V) dari node saja: O(n) untuk keluarga node yang dikenal
+        with profiling.span("cond_bound"):
+            _, cond_bound = vandermonde_condition_bounds(xs, node_type)
+        # Estimasi κ₁(V) memakai V dan faktorisasi LU bersama (milik solver LU bila sudah dijalankan);
+        # untuk n besar tanpa LU, faktorisasi O(n^3) khusus estimasi ini dilewati
+        with profiling.span("cond_estimate"):
+            if problem.lu is not None or n <= COND_EST_MAX_N:
+                cond_est = compute_condition_number(problem.V, factorization=problem.factorization())
+            else:
+                cond_est = float("nan")
+
+        for spec, time_ms, err_rel, info in results:
+            flops = spec.flops(n, node_type)                      # Estimasi FLOPs (model registry)
+            mem = spec.memory_bytes(n, node_type)                 # Estimasi memori (model registry)
+            with profiling.span(f"memory_measure[{spec.key}]"):
+                row = [
+                    node_type, n, spec.label, time_ms, err_rel, cond_est, cond_bound, flops, mem,
+                    *measured_columns(lambda: spec.fit(problem), flops, mem, time_ms),
+                    info.get("fell_back", ""), info.get("refine_steps", ""),  # Kosong: bukan LU campuran
+                ]
+            row = [v.item() if isinstance(v, np.generic) else v for v in row]  # Skalar numpy → Python (JSON)
+            if cache is not None:
+                cache.put(keys[spec.key], row)
+            cached[spec.key] = row
+
+    return [cached[spec.key] for spec in specs]
+
+# MAIN EXPERIMENT
+def run_vandermonde_experiment(n_values=N_VALUES, node_types=NODE_TYPES, solver_keys=None,
+                               repeats=REPEATS, seed=SEED, output_dir=OUTPUT_DIR,
+                               workers=WORKERS, blas_threads=BLAS_THREADS, force=False,
+                               plot=True, show=False):
+    """
+    Menjalankan seluruh grid node_types × n_values.
+    workers=1 menjalankan sel satu per satu di proses ini, workers>1 mengirim sel ke pool
+    proses; keduanya memakai blas_threads thread BLAS per proses.
+    Urutan baris CSV selalu sama dengan urutan grid.
+
+    Baris ditulis ke CSV begitu satu sel selesai, dan hasil yang sudah ada di cache
+    (<output_dir>/cache) tidak dihitung ulang kecuali force=True. Jika proses terhenti,
+    menjalankan ulang hanya menghitung sel yang belum selesai.
+    plot=False melewati plotting (tanpa import pandas/matplotlib); show=True membuka
+    jendela plot setelah gambar disimpan.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    output_path = os.path.join(output_dir, RESULTS_FILE)
+    cache_dir = os.path.join(output_dir, CACHE_SUBDIR)
+    cells = [(node_type, n, seed, cache_dir, force, solver_keys, repeats)
+             for node_type in node_types for n in n_values]
+    rows = [] # Menyimpan hasil seluruh eksperimen dalam bentuk list baris
+
+    # Simpan hasil ke file CSV secara bertahap (satu sel sekali tulis)
+    with open(output_path, "w", newline="") as f:
         writer = csv.writer(f)
-        writer.writerow(header)       # Tulis header kolom
-        writer.writerows(rows)        # Tulis semua baris hasil
+        writer.writerow(RESULT_HEADER)  # Tulis header kolom
+        for cell_rows in map_cells(run_cell, cells, workers=workers, blas_threads=blas_threads):
+            writer.writerows(cell_rows)
+            f.flush()                 # Baris sel ini sudah aman di disk
+            rows.extend(cell_rows)
 
-    print(f"\n Results saved to {OUTPUT_PATH}")
+    print(f"\n Results saved to {output_path}")
 
-    # Konversi hasil ke DataFrame untuk analisis dan plotting
-    df = pd.DataFrame(rows, columns=header)
-
-    # Plot: Runtime vs n (skala log)
-    plt.figure(figsize=(8, 5))
-    for node_type in NODE_TYPES:
-        for solver, style in zip(["LU (ours, P A = L U)", "Newton/DivDiff"], ["o-", "x--"]):
-            subset = df[(df["nodes"] == node_type) & (df["solver"] == solver)]
-            plt.plot(subset["n"], subset["time_ms"], style, label=f"{solver} - {node_type}")
-
-    plt.xscale("log")                               # Sumbu X dalam log-scale
-    plt.yscale("log")                               # Sumbu Y dalam log-scale
-    plt.xlabel("Matrix size n (log scale)")         # Label sumbu X
-    plt.ylabel("Runtime (ms, log scale)")           # Label sumbu Y
-    plt.title("Runtime Comparison (LU vs Newton, Equispaced vs Chebyshev)")
-    plt.legend()
-    plt.grid(True)
-    plt.tight_layout()
-    plt.savefig("outputs/vandermonde/runtime_comparison.png")  # Simpan ke file
-    plt.show()
-
-    # Plot: Relative Error vs n (skala log)
-    plt.figure(figsize=(8, 5))
-    for node_type in NODE_TYPES:
-        for solver, style in zip(["LU (ours, P A = L U)", "Newton/DivDiff"], ["o-", "x--"]):
-            subset = df[(df["nodes"] == node_type) & (df["solver"] == solver)]
-            plt.plot(subset["n"], subset["rel_err"], style, label=f"{solver} - {node_type}")
-
-    plt.xscale("log")
-    plt.yscale("log")
-    plt.xlabel("Matrix size n (log scale)")
-    plt.ylabel("Relative Error (log scale)")
-    plt.title("Relative Error Comparison (LU vs Newton, Equispaced vs Chebyshev)")
-    plt.legend()
-    plt.grid(True)
-    plt.tight_layout()
-    plt.savefig("outputs/vandermonde/error_comparison.png")
-    plt.show()
+    # Fit eksponen skala empiris per solver dan bandingkan dengan model
+    with profiling.span("scaling_fits"):
+        report_scaling_fits(rows, node_types, solver_keys, output_dir)
+
+    if plot:
+        with profiling.span("plot"):
+            plot_results(rows, node_types, solver_keys, output_dir, show=show)
 
     # INTERPRETASI NUMERIK
-    print("""
+    print(INTERPRETATION)
+    return rows
+
+# PLOT: runtime dan error relatif vs n
+def plot_results(rows, node_types=NODE_TYPES, solver_keys=None, output_dir=OUTPUT_DIR, show=False):
+    """
+    Membuat dua plot (runtime dan error relatif vs n, skala log) dan menyimpannya ke output_dir.
+    pandas dan matplotlib baru di-import di sini sehingga run tanpa plot tetap cepat dimulai.
+    Tanpa show, backend Agg dipakai (aman di node batch tanpa display) dan tidak ada
+    pemanggilan plt.show() yang memblokir.
+    """
+    import matplotlib
+    if not show:
+        matplotlib.use("Agg")                       # Render ke file saja
+    import matplotlib.pyplot as plt
+    import pandas as pd
+
+    # Konversi hasil ke DataFrame untuk analisis dan plotting
+    df = pd.DataFrame(rows, columns=RESULT_HEADER)
+    panels = [
+        ("time_ms", "Runtime (ms, log scale)", "Runtime Comparison (Equispaced vs Chebyshev)",
+         "runtime_comparison.png"),
+        ("rel_err", "Relative Error (log scale)", "Relative Error Comparison (Equispaced vs Chebyshev)",
+         "error_comparison.png"),
+    ]
+    for column, ylabel, title, filename in panels:
+        fig = plt.figure(figsize=(8, 5))
+        for node_type in node_types:
+            for spec in selected_solvers(node_type, solver_keys):
+                solver, style = spec.label, spec.style
+                subset = df[(df["nodes"] == node_type) & (df["solver"] == solver)]
+                plt.plot(subset["n"], subset[column], style, label=f"{solver} - {node_type}")
+
+        plt.xscale("log")                           # Sumbu X dalam log-scale
+        plt.yscale("log")                           # Sumbu Y dalam log-scale
+        plt.xlabel("Matrix size n (log scale)")     # Label sumbu X
+        plt.ylabel(ylabel)                          # Label sumbu Y
+        plt.title(title)
+        plt.legend()
+        plt.grid(True)
+        plt.tight_layout()
+        plt.savefig(os.path.join(output_dir, filename))  # Simpan ke file
+        if not show:
+            plt.close(fig)
+
+    if show:
+        plt.show()                                  # Satu kali, setelah semua gambar tersimpan
+
+# INTERPRETASI NUMERIK (dicetak setelah eksperimen)
+INTERPRETATION = """
  Interpretasi Numerik: Mengapa Vandermonde Ill-Conditioned
 
 1️ Matriks Vandermonde memiliki elemen V[i,j] = x_i^(j-1).
@@ -149,8 +291,173 @@ Kesimpulan:
 - LU decomposition: stabil tapi lambat (O(n³))
 - Newton/DivDiff: cepat (O(n²)) tapi lebih rentan terhadap ill-conditioning
 - Chebyshev nodes: meningkatkan kestabilan numerik secara signifikan tanpa mengorbankan efisiensi.
-""")
+"""
+
+# FIT SKALA: eksponen empiris waktu vs n dibandingkan dengan model FLOPs
+def report_scaling_fits(rows, node_types=NODE_TYPES, solver_keys=None, output_dir=OUTPUT_DIR):
+    """
+    Untuk setiap (jenis node, solver), mencocokkan time_ms ≈ C * n^p pada titik n >= FIT_MIN_N
+    dan membandingkannya dengan eksponen model FLOPs registry pada n yang sama.
+    Selisih lebih dari EXPONENT_TOLERANCE ditandai sebagai mismatch
+    (klaim kompleksitas yang salah, atau overhead yang masih mendominasi).
+    """
+    header = ["nodes", "solver", "n_min", "n_max", "fitted_exponent", "model_exponent", "mismatch"]
+    fits = []
+    for node_type in node_types:
+        for spec in selected_solvers(node_type, solver_keys):
+            points = [(r[1], r[3]) for r in rows
+                      if r[0] == node_type and r[2] == spec.label and r[1] >= FIT_MIN_N]
+            if len(points) < 2:
+                continue
+            ns = [p[0] for p in points]
+            fitted = fit_scaling_exponent(ns, [p[1] for p in points])
+            model = fit_scaling_exponent(ns, [spec.flops(n, node_type) for n in ns])
+            mismatch = bool(abs(fitted - model) > EXPONENT_TOLERANCE)
+            fits.append([node_type, spec.label, min(ns), max(ns), fitted, model, mismatch])
+            flag = "  <-- MISMATCH" if mismatch else ""
+            print(f"{node_type:<11} {spec.label:<22} fitted n^{fitted:.2f}  model n^{model:.2f}{flag}")
+
+    path = os.path.join(output_dir, SCALING_FIT_FILE)
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(fits)
+    print(f"\n Scaling fits saved to {path}")
+    return fits
+
+# UJI SKALA: solver cepat pada node Chebyshev hingga n = 10^6
+def run_chebyshev_scaling_experiment(n_values=LARGE_N_VALUES, solver_keys=None, repeats=REPEATS,
+                                     output_dir=OUTPUT_DIR):
+    """
+    Membandingkan solver pada node Chebyshev untuk n sangat besar.
+    Data berasal dari fungsi mulus f(x) = exp(x) cos(4x) sehingga nilai
+    sebenarnya di titik uji diketahui tanpa membentuk V.
+    Setiap solver hanya dijalankan sampai batas max_n di registry
+    (misalnya LU sampai 10^3, solver O(n^2) sampai 10^4).
+    """
+    header = ["nodes", "n", "solver", "time_ms", "rel_err"]
+    rows = []
+    t_check = np.random.default_rng(0).uniform(-1, 1, size=N_CHECK_POINTS)  # Titik uji acak tetap
+    f_true = np.exp(t_check) * np.cos(4 * t_check)
+
+    os.makedirs(output_dir, exist_ok=True)
+    path = os.path.join(output_dir, LARGE_RESULTS_FILE)
+    with open(path, "w", newline="") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(header)
+        for n in n_values:
+            print(f"Running scaling experiment for chebyshev nodes, n={n} ...")
+            xs = chebyshev_nodes(n)
+            problem = InterpolationProblem(xs, np.exp(xs) * np.cos(4 * xs), "chebyshev")
+
+            for spec in selected_solvers("chebyshev", solver_keys, n):
+                if spec.needs_matrix:
+                    problem.V                       # Bentuk V padat di luar pengukuran waktu
+                with np.errstate(all="ignore"), profiling.span(f"solve[{spec.key}]", n=n):
+                    result, t_ms = measure_time(spec.fit, problem, repeats=repeats)  # Overflow monomial diperkirakan
+                    err_rel = relative_error(spec.evaluate(result, t_check), f_true)
+                row = ["chebyshev", n, spec.label, t_ms, err_rel]
+                writer.writerow(row)
+                fh.flush()
+                rows.append(row)
+    print(f"\n Scaling results saved to {path}")
+    return rows
+
+# UJI SKALA: solver cepat basis monomial pada akar satuan (node kompleks)
+def run_roots_of_unity_scaling_experiment(n_values=UNITY_N_VALUES, solver_keys=None, repeats=REPEATS,
+                                          output_dir=OUTPUT_DIR):
+    """
+    Membandingkan solver yang mendeklarasikan node "roots-of-unity" (misalnya subproduct
+    tree) untuk n besar. V pada akar satuan terkondisi sempurna, jadi error yang terukur
+    berasal dari algoritmanya sendiri, bukan dari kondisi basis monomial. Data
+    f(z) = exp(z) cos(4z) dicek di titik acak pada lingkaran satuan.
+    Solver tanpa node_types (yang hanya menerima node real) tidak dijalankan di sini.
+    """
+    header = ["nodes", "n", "solver", "time_ms", "rel_err"]
+    rows = []
+    z_check = np.exp(2j * np.pi * np.random.default_rng(0).uniform(0, 1, size=N_CHECK_POINTS))
+    f_true = np.exp(z_check) * np.cos(4 * z_check)
+
+    os.makedirs(output_dir, exist_ok=True)
+    path = os.path.join(output_dir, UNITY_RESULTS_FILE)
+    with open(path, "w", newline="") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(header)
+        for n in n_values:
+            specs = [spec for spec in selected_solvers("roots-of-unity", solver_keys, n)
+                     if spec.node_types is not None]
+            if not specs:
+                continue
+            print(f"Running scaling experiment for roots-of-unity nodes, n={n} ...")
+            zs = roots_of_unity_nodes(n)
+            problem = InterpolationProblem(zs, np.exp(zs) * np.cos(4 * zs), "roots-of-unity")
+
+            for spec in specs:
+                with profiling.span(f"solve[{spec.key}]", n=n):
+                    result, t_ms = measure_time(spec.fit, problem, repeats=repeats)
+                    err_rel = relative_error(spec.evaluate(result, z_check), f_true)
+                row = ["roots-of-unity", n, spec.label, t_ms, err_rel]
+                writer.writerow(row)
+                fh.flush()
+                rows.append(row)
+    print(f"\n Scaling results saved to {path}")
+    return rows
+
+# COMMAND LINE
+def parse_solvers(names):
+    """Mengubah nama/label solver dari command line menjadi himpunan key registry (None = semua)."""
+    if not names:
+        return None
+    return {get_solver(name).key for name in names}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Eksperimen solver Vandermonde (equispaced vs Chebyshev).")
+    parser.add_argument("--sizes", type=int, nargs="+", default=N_VALUES, help="Ukuran n yang diuji")
+    parser.add_argument("--nodes", choices=list(NODE_FAMILIES), nargs="+", default=NODE_TYPES,
+                        help="Jenis node")
+    parser.add_argument("--solvers", nargs="+", help="Key atau label solver (default: semua yang terdaftar)")
+    parser.add_argument("--repeats", type=int, default=REPEATS, help="Pengukuran waktu per solver (median)")
+    parser.add_argument("--seed", type=int, default=SEED, help="Seed dasar")
+    parser.add_argument("--output-dir", default=OUTPUT_DIR, help="Folder hasil (CSV, cache, gambar)")
+    parser.add_argument("--workers", type=int, default=WORKERS, help="Jumlah proses paralel")
+    parser.add_argument("--blas-threads", type=int, default=BLAS_THREADS,
+                        help="Thread BLAS per proses (mode serial dan setiap worker)")
+    parser.add_argument("--large-sizes", type=int, nargs="*", default=LARGE_N_VALUES,
+                        help="Ukuran n uji skala Chebyshev (kosongkan untuk melewati)")
+    parser.add_argument("--unity-sizes", type=int, nargs="*", default=UNITY_N_VALUES,
+                        help="Ukuran n uji skala akar satuan (kosongkan untuk melewati)")
+    parser.add_argument("--force", action="store_true", help="Abaikan cache dan hitung ulang semua sel")
+    parser.add_argument("--no-plot", action="store_true", help="Mode headless: tanpa plot (tanpa pandas/matplotlib)")
+    parser.add_argument("--show", action="store_true", help="Tampilkan jendela plot setelah disimpan")
+    parser.add_argument("--profile", metavar="PATH",
+                        help="Rekam span per fase ke PATH (*.json = Chrome trace, lainnya = stack terlipat "
+                             "untuk flame graph); hanya proses utama, jadi membutuhkan --workers 1")
+    args = parser.parse_args(argv)
+
+    try:
+        solver_keys = parse_solvers(args.solvers)
+    except ValueError as exc:
+        parser.error(str(exc))
+    if args.profile and args.workers != 1:
+        parser.error("--profile requires --workers 1 (spans are recorded in the main process only)")
+
+    with profiling.profile(args.profile) if args.profile else nullcontext() as prof:
+        run_vandermonde_experiment(
+            n_values=args.sizes, node_types=args.nodes, solver_keys=solver_keys,
+            repeats=args.repeats, seed=args.seed, output_dir=args.output_dir,
+            workers=args.workers, blas_threads=args.blas_threads, force=args.force,
+            plot=not args.no_plot, show=args.show,
+        )
+        if args.large_sizes:
+            run_chebyshev_scaling_experiment(args.large_sizes, solver_keys, args.repeats, args.output_dir)
+        if args.unity_sizes:
+            run_roots_of_unity_scaling_experiment(args.unity_sizes, solver_keys, args.repeats, args.output_dir)
+    if prof is not None:
+        print(prof.format_summary())
+        print(f"\n Profile saved to {args.profile}")
+    return 0
+
 
-# MAIN
 if __name__ == "__main__":
-    run_vandermonde_experiment()
+    sys.exit(main())
@@ -0,0 +1,6 @@
+import os
+import sys
+
+# Modul proyek di-import seperti pada skrip (from algorithms... / from utils...),
+# jadi folder proyek (induk tests/) ditaruh di sys.path.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
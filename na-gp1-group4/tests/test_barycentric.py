@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+
+from algorithms.barycentric import barycentric_weights, chebyshev_weights
+from algorithms.registry import InterpolationProblem, get_solver
+from utils.builders import make_nodes
+
+
+@pytest.mark.parametrize("family, kind", [("chebyshev", 1), ("chebyshev-extrema", 2)])
+def test_closed_form_weights_match_generic(family, kind):
+    x = make_nodes(family, 17)
+    w = chebyshev_weights(x.size, kind=kind)
+    generic = barycentric_weights(x)
+    np.testing.assert_allclose(w / w[0], generic / generic[0], rtol=1e-10)
+
+
+@pytest.mark.parametrize("family", ["chebyshev", "chebyshev-extrema"])
+def test_barycentric_fit_uses_closed_form_weights(family, monkeypatch):
+    import algorithms.registry as registry
+
+    def no_generic(x):
+        raise AssertionError("generic O(n^2) weights used")
+
+    monkeypatch.setattr(registry, "barycentric_weights", no_generic)
+    x = make_nodes(family, 40)
+    p = get_solver("barycentric").fit(InterpolationProblem(x, np.exp(x), family))
+    t = np.linspace(-1, 1, 101)
+    np.testing.assert_allclose(p(t), np.exp(t), atol=1e-13)
@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+
+from algorithms.vandermonde import (
+    IncrementalNewtonInterpolant, divided_differences, divided_differences_batched,
+    newton_poly_eval_coefs, newton_poly_eval_coefs_batched, solve_vandermonde_bjorck_pereyra,
+    solve_vandermonde_bjorck_pereyra_batched,
+)
+from utils.builders import chebyshev_nodes, equispaced_nodes, random_distinct_nodes
+
+N = 12
+
+
+def node_sets():
+    """Himpunan node tetap berukuran N (satu baris per himpunan)."""
+    return np.stack([
+        chebyshev_nodes(N),
+        equispaced_nodes(N),
+        random_distinct_nodes(N, seed=3),
+        np.linspace(0.1, 2.0, N),
+    ])
+
+
+def data(X):
+    return np.exp(X) * np.cos(3 * X)
+
+
+# --------------------------
+# Versi batch vs versi satu sistem
+# --------------------------
+
+def test_divided_differences_batched_matches_single():
+    X = node_sets()
+    coef, duplicate = divided_differences_batched(X, data(X))
+    assert not duplicate.any()
+    for r in range(X.shape[0]):
+        np.testing.assert_allclose(coef[r], divided_differences(X[r], data(X[r])), rtol=1e-12, atol=1e-14)
+
+
+def test_newton_poly_eval_coefs_batched_matches_single():
+    X = node_sets()
+    coef, _ = divided_differences_batched(X, data(X))
+    poly = newton_poly_eval_coefs_batched(X, coef)
+    for r in range(X.shape[0]):
+        np.testing.assert_allclose(poly[r], newton_poly_eval_coefs(X[r], coef[r]), rtol=1e-12, atol=1e-12)
+
+
+def test_bjorck_pereyra_batched_matches_single():
+    X = node_sets()
+    c, duplicate = solve_vandermonde_bjorck_pereyra_batched(X, data(X))
+    assert not duplicate.any()
+    for r in range(X.shape[0]):
+        np.testing.assert_allclose(c[r], solve_vandermonde_bjorck_pereyra(X[r], data(X[r])),
+                                   rtol=1e-12, atol=1e-12)
+
+
+@pytest.mark.parametrize("batched", [divided_differences_batched, solve_vandermonde_bjorck_pereyra_batched])
+def test_batched_duplicate_rows_are_masked(batched):
+    X = node_sets()
+    X[1, 4] = X[1, 5]                       # Baris 1 punya node duplikat
+    out, duplicate = batched(X, data(X))
+    np.testing.assert_array_equal(duplicate, [False, True, False, False])
+    assert np.isnan(out[1]).all()
+    assert np.isfinite(out[[0, 2, 3]]).all()
+    with pytest.raises(ValueError, match="Duplicate nodes"):
+        solve_vandermonde_bjorck_pereyra(X[1], data(X[1]))
+
+
+# --------------------------
+# Newton inkremental vs divided differences penuh
+# --------------------------
+
+def test_incremental_append_matches_full_newton():
+    x = random_distinct_nodes(N, seed=7)
+    p = IncrementalNewtonInterpolant()
+    for k in range(N):
+        p.append(x[k], data(x[k]))
+        np.testing.assert_allclose(p.coef, divided_differences(x[:k + 1], data(x[:k + 1])),
+                                   rtol=1e-10, atol=1e-12)
+
+
+def test_incremental_extend_matches_full_newton():
+    x = chebyshev_nodes(N)
+    p = IncrementalNewtonInterpolant().extend(x, data(x))
+    np.testing.assert_allclose(p.coef, divided_differences(x, data(x)), rtol=1e-10, atol=1e-12)
+    np.testing.assert_allclose(p.to_monomial(), solve_vandermonde_bjorck_pereyra(x, data(x)),
+                               rtol=1e-8, atol=1e-10)
+
+
+def test_incremental_drop_oldest_matches_full_newton():
+    x = equispaced_nodes(N)
+    p = IncrementalNewtonInterpolant().extend(x, data(x))
+    for k in range(1, 4):
+        p.drop_oldest()
+        np.testing.assert_array_equal(p.xs, x[k:])
+        np.testing.assert_allclose(p.coef, divided_differences(x[k:], data(x[k:])), rtol=1e-10, atol=1e-12)
+
+
+def test_incremental_sliding_window_matches_full_newton():
+    window = 5
+    x = random_distinct_nodes(N, seed=11)
+    p = IncrementalNewtonInterpolant(max_nodes=window).extend(x, data(x))
+    assert p.n == window
+    np.testing.assert_array_equal(p.xs, x[-window:])
+    np.testing.assert_allclose(p.coef, divided_differences(x[-window:], data(x[-window:])),
+                               rtol=1e-10, atol=1e-12)
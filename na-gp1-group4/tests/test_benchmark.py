@@ -0,0 +1,27 @@
+import pytest
+
+from utils.benchmark import compare_to_baseline, run_meta
+
+
+def rows(median_ms):
+    return [{"solver": "LU", "n": 50, "median_ms": median_ms, "min_ms": median_ms}]
+
+
+def test_compare_to_baseline_same_settings():
+    meta = run_meta(nodes="chebyshev")
+    report = compare_to_baseline(rows(2.0), rows(1.0), meta=meta, baseline_meta=dict(meta))
+    assert report[0]["regression"] and report[0]["ratio"] == 2.0
+
+
+@pytest.mark.parametrize("key, value", [("nodes", "equispaced"), ("dtype", "float32"), ("blas_threads", "8")])
+def test_compare_to_baseline_rejects_other_settings(key, value):
+    meta = run_meta(nodes="chebyshev")
+    with pytest.raises(ValueError, match=key):
+        compare_to_baseline(rows(1.0), rows(1.0), meta=meta, baseline_meta={**meta, key: value})
+
+
+def test_compare_to_baseline_rejects_missing_node_family():
+    meta = run_meta(nodes="chebyshev")
+    baseline_meta = {k: v for k, v in meta.items() if k != "nodes"}
+    with pytest.raises(ValueError, match="nodes"):
+        compare_to_baseline(rows(1.0), rows(1.0), meta=meta, baseline_meta=baseline_meta)
@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+
+from utils.builders import build_vandermonde, roots_of_unity_nodes
+
+
+def test_build_vandermonde_complex_nodes_stay_complex():
+    z = roots_of_unity_nodes(8)
+    V = build_vandermonde(z)
+    assert V.dtype == np.complex128
+    np.testing.assert_allclose(V, np.vander(z, increasing=True), atol=1e-14)
+    np.testing.assert_allclose(V.conj().T @ V / 8, np.eye(8), atol=1e-14)   # V / sqrt(n) uniter
+    assert build_vandermonde(z.astype(np.complex64), dtype=np.float32).dtype == np.complex64
+
+
+def test_build_vandermonde_complex_nodes_reject_real_buffer():
+    z = roots_of_unity_nodes(4)
+    with pytest.raises(ValueError, match="complex output buffer"):
+        build_vandermonde(z, out=np.empty((4, 4)))
+    out = np.empty((4, 4), dtype=complex)
+    assert build_vandermonde(z, out=out) is out
+
+
+def test_build_vandermonde_real_nodes_keep_requested_dtype():
+    x = np.linspace(-1, 1, 5)
+    assert build_vandermonde(x).dtype == np.float64
+    assert build_vandermonde(x, dtype=np.float32).dtype == np.float32
+    np.testing.assert_allclose(build_vandermonde(x, transpose=True), np.vander(x, increasing=True).T)
@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from algorithms import dispatch
+from utils.builders import equispaced_nodes
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    dispatch.clear_dispatch_cache()
+    yield
+    dispatch.clear_dispatch_cache()
+
+
+def test_fallback_does_not_change_cached_paths(monkeypatch):
+    x = equispaced_nodes(8)
+    easy, hard = np.exp(x), np.exp(x) + 1.0
+    run_path = dispatch._run_path
+
+    def failing_first_path(path, x_, f, decision):
+        if np.array_equal(f, hard) and path == decision.paths[0]:
+            raise ValueError("forced failure")
+        return run_path(path, x_, f, decision)
+
+    monkeypatch.setattr(dispatch, "_run_path", failing_first_path)
+    _, first = dispatch.interpolate(x, hard)
+    assert first.attempts[0][1] == np.inf and first.met_tol
+    _, second = dispatch.interpolate(x, easy)
+    assert second.cached
+    assert second.attempts[0][0] == first.attempts[0][0]    # f lain mulai lagi dari jalur termurah
+    assert second.path == first.attempts[0][0]
+
+
+def test_empty_input_raises():
+    with pytest.raises(ValueError, match="at least one node"):
+        dispatch.interpolate([], [])
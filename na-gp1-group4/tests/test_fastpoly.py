@@ -0,0 +1,78 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from algorithms.fastpoly import FAST_MIN_N, fast_interpolate, multipoint_eval
+from algorithms.vandermonde import VandermondeOperator, solve_vandermonde_bjorck_pereyra
+from utils.builders import chebyshev_nodes, roots_of_unity_nodes
+
+
+# --------------------------
+# Node real: selalu jalur O(n^2), tanpa NaN
+# --------------------------
+
+@pytest.mark.parametrize("n", [130, FAST_MIN_N, 3000])
+def test_multipoint_eval_real_nodes_falls_back_to_horner(n):
+    x = chebyshev_nodes(n)
+    c = np.random.default_rng(0).uniform(-1, 1, size=n)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")      # Jalur pohon memicu overflow RuntimeWarning
+        y = multipoint_eval(c, x, min_n=0)
+    np.testing.assert_array_equal(y, VandermondeOperator(x, ncols=n).matvec(c))
+
+
+@pytest.mark.parametrize("n", [130, 3000])
+def test_fast_interpolate_real_nodes_falls_back_to_bjorck_pereyra(n):
+    x = chebyshev_nodes(n)
+    f = np.exp(x)
+    with np.errstate(all="ignore"):
+        c = fast_interpolate(x, f, min_n=0)
+        expected = solve_vandermonde_bjorck_pereyra(x, f)
+    np.testing.assert_array_equal(c, expected)
+
+
+def test_fast_interpolate_real_nodes_complex_data():
+    x = chebyshev_nodes(20)
+    f = np.exp(1j * x)
+    c = fast_interpolate(x.astype(complex), f)   # Imajiner nol → diperlakukan sebagai node real
+    np.testing.assert_allclose(np.polynomial.polynomial.polyval(x, c), f, atol=1e-12)
+
+
+# --------------------------
+# Akar satuan: jalur pohon, akurat
+# --------------------------
+
+@pytest.mark.parametrize("n", [FAST_MIN_N, 5000])
+def test_roots_of_unity_interpolate_and_evaluate(n):
+    z = roots_of_unity_nodes(n)
+    f = np.exp(z) * np.cos(4 * z)
+    c = fast_interpolate(z, f)
+    # Untuk akar satuan V(z) = n * ifft, jadi koefisien referensinya V(z)^{-1} f = fft(f) / n
+    np.testing.assert_allclose(c, np.fft.fft(f) / n, atol=1e-12)
+    np.testing.assert_allclose(multipoint_eval(c, z), f, atol=1e-11)
+
+    # Titik evaluasi lain yang tersebar di lingkaran satuan (akar satuan yang digeser acak)
+    m = 2 * n
+    w = np.exp(2j * np.pi * (np.arange(m) + np.random.default_rng(1).uniform(0, 0.5, size=m)) / m)
+    np.testing.assert_allclose(multipoint_eval(c, w), np.polynomial.polynomial.polyval(w, c), atol=1e-11)
+
+
+def test_random_points_on_unit_circle_fall_back_to_horner():
+    n = FAST_MIN_N
+    c = np.fft.fft(np.exp(roots_of_unity_nodes(n))) / n
+    w = np.exp(2j * np.pi * np.random.default_rng(2).uniform(0, 1, size=n))  # Berkelompok acak
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        y = multipoint_eval(c, w)
+    np.testing.assert_allclose(y, np.polynomial.polynomial.polyval(w, c), atol=1e-12)
+
+
+def test_fast_interpolate_clustered_complex_nodes():
+    rng = np.random.default_rng(3)
+    z = 0.5 * np.exp(2j * np.pi * rng.uniform(0, 1, size=30))
+    c = fast_interpolate(z, np.exp(z))      # n kecil: solve padat
+    np.testing.assert_allclose(np.polynomial.polynomial.polyval(z, c), np.exp(z), atol=1e-10)
+    z = np.exp(2j * np.pi * rng.uniform(0, 1, size=FAST_MIN_N))
+    with pytest.raises(ValueError, match="unit circle"):
+        fast_interpolate(z, np.exp(z))
@@ -0,0 +1,150 @@
+import numpy as np
+import pytest
+
+from algorithms.lu import (
+    BLOCK_SIZE, LUFactorization, lu_factor, lu_factor_batched, lu_solve_batched, solve_lu,
+    solve_lu_batched,
+)
+
+
+def random_matrix(n, seed=0):
+    return np.random.default_rng(seed).standard_normal((n, n))
+
+
+def unpack(lu):
+    n = lu.shape[0]
+    return np.tril(lu, -1) + np.eye(n), np.triu(lu)
+
+
+# --------------------------
+# LU blok (lu_factor)
+# --------------------------
+
+@pytest.mark.parametrize("n, block_size", [(65, BLOCK_SIZE), (130, BLOCK_SIZE), (200, BLOCK_SIZE), (50, 7)])
+def test_blocked_lu_reconstructs_permuted_matrix(n, block_size):
+    assert n % block_size != 0                  # Panel terakhir lebih sempit dari block_size
+    A = random_matrix(n)
+    lu, piv = lu_factor(A, block_size=block_size)
+    L, U = unpack(lu)
+    np.testing.assert_allclose(L @ U, A[piv], atol=1e-12 * n)
+    assert np.max(np.abs(np.tril(lu, -1))) <= 1.0   # Pivot parsial: |multiplier| <= 1
+
+
+@pytest.mark.parametrize("n", [65, 130])
+def test_blocked_lu_matches_unblocked_pivoting_across_panels(n):
+    A = random_matrix(n, seed=1)
+    lu, piv = lu_factor(A, block_size=BLOCK_SIZE)
+    lu_ref, piv_ref = lu_factor(A, block_size=n)  # Satu panel = LU tanpa blok
+    np.testing.assert_array_equal(piv, piv_ref)
+    assert np.any(piv[BLOCK_SIZE:] != np.arange(BLOCK_SIZE, n))  # Ada pertukaran di panel berikutnya
+    np.testing.assert_allclose(lu, lu_ref, atol=1e-10)
+
+
+def test_pivot_found_in_later_panel():
+    # Baris dengan pivot terbesar untuk kolom di panel kedua berada jauh di bawah
+    n = 100
+    A = np.eye(n) + 1e-3 * random_matrix(n, seed=2)
+    A[[70, 90]] = A[[90, 70]]
+    lu, piv = lu_factor(A)
+    assert piv[70] == 90
+    L, U = unpack(lu)
+    np.testing.assert_allclose(L @ U, A[piv], atol=1e-12)
+
+
+def test_overwrite_a():
+    A = random_matrix(80, seed=3)
+    original = A.copy()
+    lu, _ = lu_factor(A, overwrite_a=False)
+    np.testing.assert_array_equal(A, original)  # Input tidak berubah
+    lu_in_place, _ = lu_factor(A, overwrite_a=True)
+    assert lu_in_place is A                     # Difaktorkan langsung di atas A
+    np.testing.assert_allclose(lu_in_place, lu)
+
+    F = np.asfortranarray(original)             # Bukan C-contiguous: tetap disalin
+    lu_f, _ = lu_factor(F, overwrite_a=True)
+    assert lu_f is not F
+    np.testing.assert_array_equal(F, original)
+
+
+@pytest.mark.parametrize("n", [10, 65, 150])
+def test_solve_and_solve_transpose_match_numpy(n):
+    A = random_matrix(n, seed=4)
+    rng = np.random.default_rng(5)
+    b, B = rng.standard_normal(n), rng.standard_normal((n, 3))
+    fact = LUFactorization(A)
+    np.testing.assert_allclose(fact.solve(b), np.linalg.solve(A, b), rtol=1e-9, atol=1e-11)
+    np.testing.assert_allclose(fact.solve(B), np.linalg.solve(A, B), rtol=1e-9, atol=1e-11)
+    np.testing.assert_allclose(fact.solve_transpose(b), np.linalg.solve(A.T, b), rtol=1e-9, atol=1e-11)
+    np.testing.assert_allclose(fact.solve_transpose(B), np.linalg.solve(A.T, B), rtol=1e-9, atol=1e-11)
+    np.testing.assert_allclose(solve_lu(A, b), np.linalg.solve(A, b), rtol=1e-9, atol=1e-11)
+
+
+def test_singular_and_non_square_raise():
+    A = random_matrix(70, seed=6)
+    A[:, 66] = 0.0                              # Kolom nol di panel kedua
+    with pytest.raises(ValueError, match="Singular"):
+        lu_factor(A)
+    with pytest.raises(ValueError, match="square"):
+        lu_factor(np.ones((3, 4)))
+
+
+# --------------------------
+# LU batch
+# --------------------------
+
+def random_batch(batch, n, seed=0):
+    return np.random.default_rng(seed).standard_normal((batch, n, n))
+
+
+@pytest.mark.parametrize("chunk_bytes", [1 << 21, 1])  # 1 byte: setiap matriks satu potongan
+def test_lu_factor_batched_matches_single(chunk_bytes):
+    A = random_batch(7, 12, seed=7)
+    lu, piv, singular = lu_factor_batched(A, chunk_bytes=chunk_bytes)
+    assert not singular.any()
+    for r in range(A.shape[0]):
+        lu_r, piv_r = lu_factor(A[r])
+        np.testing.assert_array_equal(piv[r], piv_r)
+        np.testing.assert_allclose(lu[r], lu_r, atol=1e-12)
+
+
+@pytest.mark.parametrize("m", [None, 3])
+def test_solve_lu_batched_matches_single(m):
+    A = random_batch(6, 15, seed=8)
+    rng = np.random.default_rng(9)
+    b = rng.standard_normal((6, 15) if m is None else (6, 15, m))
+    x, singular = solve_lu_batched(A, b)
+    assert x.shape == b.shape and not singular.any()
+    for r in range(A.shape[0]):
+        np.testing.assert_allclose(x[r], solve_lu(A[r], b[r]), rtol=1e-10, atol=1e-12)
+        np.testing.assert_allclose(x[r], np.linalg.solve(A[r], b[r]), rtol=1e-9, atol=1e-11)
+
+
+def test_batched_singular_member_is_masked():
+    A = random_batch(5, 10, seed=10)
+    A[2, 4] = A[2, 1]                           # Baris duplikat → singular
+    A[2, :, 7] = 0.0                            # Kolom nol: pivot persis nol
+    b = np.random.default_rng(11).standard_normal((5, 10))
+    with pytest.raises(ValueError, match="Singular"):
+        lu_factor(A[2])
+    lu, piv, singular = lu_factor_batched(A, chunk_bytes=1)
+    np.testing.assert_array_equal(singular, [False, False, True, False, False])
+    assert np.isnan(lu[2]).all()
+    x = lu_solve_batched(lu, piv, b)
+    assert np.isnan(x[2]).all()
+    for r in (0, 1, 3, 4):                      # Anggota lain tidak terpengaruh
+        np.testing.assert_allclose(x[r], np.linalg.solve(A[r], b[r]), rtol=1e-9, atol=1e-11)
+    x2, singular2 = solve_lu_batched(A, b)
+    np.testing.assert_array_equal(singular2, singular)
+    np.testing.assert_array_equal(np.isnan(x2).all(axis=1), singular)
+
+
+def test_batched_overwrite_a_and_shape_errors():
+    A = random_batch(3, 8, seed=12)
+    lu, _, _ = lu_factor_batched(A.copy())
+    lu_in_place, _, _ = lu_factor_batched(A, overwrite_a=True)
+    assert lu_in_place is A
+    np.testing.assert_allclose(lu_in_place, lu)
+    with pytest.raises(ValueError, match="square"):
+        lu_factor_batched(np.ones((2, 3, 4)))
+    with pytest.raises(ValueError, match="Right-hand side"):
+        solve_lu_batched(random_batch(3, 8), np.ones((3, 7)))
@@ -0,0 +1,135 @@
+import json                            # Format hasil yang bisa dibaca mesin
+import os
+import platform                        # Metadata mesin untuk hasil benchmark
+from functools import partial
+
+import numpy as np
+
+from utils.parallel import BLAS_THREAD_VARS
+from utils.timing import autorange, sample_times
+
+# Metadata yang harus sama antara hasil baru dan baseline agar waktunya sebanding
+COMPARABLE_META = ("nodes", "dtype", "blas_threads", "machine")
+
+
+def summarize(samples):
+    """
+    Ringkasan statistik dari sampel waktu (detik) dalam milidetik:
+    median, IQR (kuartil 3 - kuartil 1), minimum, dan rata-rata.
+    Median dan IQR tahan terhadap outlier (misalnya gangguan OS sesaat).
+    """
+    ms = np.asarray(samples, dtype=float) * 1000.0
+    q1, median, q3 = np.percentile(ms, [25, 50, 75])
+    return {
+        "median_ms": float(median),
+        "iqr_ms": float(q3 - q1),
+        "min_ms": float(ms.min()),
+        "mean_ms": float(ms.mean()),
+    }
+
+
+def benchmark(func, *args, warmup=1, repeats=7, min_sample_time=0.02, **kwargs):
+    """
+    Mengukur waktu func(*args, **kwargs) secara statistik:
+    1. warmup pemanggilan awal dibuang (cache, alokasi pertama, lazy import)
+    2. jumlah loops per sampel dikalibrasi otomatis (autorange)
+    3. repeats sampel diambil, lalu diringkas dengan summarize
+
+    Return: dict berisi median_ms, iqr_ms, min_ms, mean_ms, loops, repeats.
+    """
+    call = partial(func, *args, **kwargs)
+    for _ in range(warmup):                     # Pemanasan (hasil dibuang)
+        call()
+    loops = autorange(call, min_time=min_sample_time)
+    stats = summarize(sample_times(call, loops, repeats))
+    stats.update(loops=loops, repeats=repeats)
+    return stats
+
+
+def run_suite(cases, **bench_kwargs):
+    """
+    Menjalankan daftar kasus benchmark.
+    cases : iterable berisi (solver, n, func) dengan func tanpa argumen.
+    Return: list dict hasil, satu per kasus, dengan kunci solver dan n.
+    """
+    results = []
+    for solver, n, func in cases:
+        stats = benchmark(func, **bench_kwargs)
+        results.append({"solver": solver, "n": int(n), **stats})
+        print(f"{solver:<24} n={n:<7} median={stats['median_ms']:.4f} ms "
+              f"iqr={stats['iqr_ms']:.4f} ms min={stats['min_ms']:.4f} ms")
+    return results
+
+
+def run_meta(**metadata):
+    """
+    Metadata satu run benchmark: mesin, versi, dtype, dan jumlah thread BLAS (dari
+    variabel lingkungan BLAS_THREAD_VARS; "default" jika tidak diatur).
+    """
+    threads = next((os.environ[name] for name in BLAS_THREAD_VARS if os.environ.get(name)), "default")
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "dtype": "float64",
+        "blas_threads": threads,
+        **metadata,
+    }
+
+
+def write_results(results, path, **metadata):
+    """Menyimpan hasil benchmark ke file JSON beserta metadata run (lihat run_meta)."""
+    payload = {"meta": run_meta(**metadata), "results": results}
+    with open(path, "w") as f:
+        json.dump(payload, f, indent=2)
+
+
+def load_results(path, with_meta=False):
+    """Membaca hasil benchmark (list dict) dari file JSON; with_meta=True → (hasil, meta)."""
+    with open(path) as f:
+        payload = json.load(f)
+    if with_meta:
+        return payload["results"], payload.get("meta", {})
+    return payload["results"]
+
+
+def check_comparable(meta, baseline_meta, keys=COMPARABLE_META):
+    """
+    ValueError jika metadata baseline berbeda dari run sekarang pada salah satu keys
+    (misalnya jenis node, dtype, atau thread BLAS); kunci yang hilang dianggap berbeda.
+    """
+    mismatches = [f"{key}: baseline {baseline_meta.get(key)!r}, current {meta.get(key)!r}"
+                  for key in keys if baseline_meta.get(key) != meta.get(key)]
+    if mismatches:
+        raise ValueError("Baseline is not comparable (" + "; ".join(mismatches) + ").")
+
+
+def compare_to_baseline(results, baseline, threshold=0.10, meta=None, baseline_meta=None):
+    """
+    Membandingkan median hasil baru dengan baseline untuk setiap (solver, n) yang sama.
+    Sebuah kasus ditandai regresi jika median baru > (1 + threshold) × median baseline
+    dan waktu minimum baru juga lebih lambat dari median baseline (agar noise sesaat
+    pada satu pengukuran tidak langsung dianggap regresi).
+    Jika meta dan baseline_meta diberikan, keduanya harus sebanding (check_comparable).
+
+    Return: list dict perbandingan (solver, n, baseline_ms, current_ms, ratio, regression).
+    """
+    if meta is not None and baseline_meta is not None:
+        check_comparable(meta, baseline_meta)
+    base = {(r["solver"], r["n"]): r for r in baseline}
+    report = []
+    for r in results:
+        old = base.get((r["solver"], r["n"]))
+        if old is None:
+            continue                            # Kasus baru, tidak ada pembanding
+        ratio = r["median_ms"] / old["median_ms"] if old["median_ms"] > 0 else float("inf")
+        report.append({
+            "solver": r["solver"],
+            "n": r["n"],
+            "baseline_ms": old["median_ms"],
+            "current_ms": r["median_ms"],
+            "ratio": ratio,
+            "regression": ratio > 1.0 + threshold and r["min_ms"] > old["median_ms"],
+        })
+    return report
@@ -1,24 +1,115 @@
 import numpy as np
 
-def random_distinct_nodes(n, seed=0):
+# --------------------------
+# Keluarga node di [-1, 1]
+# --------------------------
+
+def random_distinct_nodes(n, seed=0, min_gap=1e-3):
     """
     Membuat himpunan titik x (nodes) acak yang berbeda (distinct) di interval [-1, 1].
     Digunakan untuk eksperimen interpolasi agar titik-titik tidak saling berdekatan atau duplikat.
+
+    Tanpa loop koreksi: n titik acak terurut diambil dari interval yang dipendekkan
+    sepanjang (n-1)*min_gap, lalu titik ke-i digeser sejauh i*min_gap. Hasilnya
+    terurut, setiap jarak antar tetangga >= min_gap, dan semua titik tetap di [-1, 1].
     """
+    span = 2.0 - (n - 1) * min_gap           # Panjang interval yang tersisa setelah jarak minimum
+    if n > 1 and span < 0:
+        raise ValueError("Too many nodes for the requested minimum gap.")
+    rng = np.random.default_rng(seed)        # Generator bilangan acak (reproducible dengan seed)
+    u = np.sort(rng.uniform(0.0, max(span, 0.0), size=n))
+    return -1.0 + u + min_gap * np.arange(n) # Titik ke-i bergeser i*min_gap → jarak >= min_gap
+
+
+def equispaced_nodes(n):
+    """Node berjarak sama x_i = -1 + 2i/(n-1), i = 0..n-1 (urutan naik)."""
+    return np.linspace(-1.0, 1.0, n)
 
-    rng = np.random.default_rng(seed)        # Membuat generator bilangan acak (reproducible dengan seed)
-    x = rng.uniform(-1, 1, size=n)           # Mengambil n angka acak dari interval [-1, 1]
-    x.sort()                                 # Urutkan titik-titik agar berurutan dari kecil ke besar
 
-    # Koreksi titik-titik yang terlalu berdekatan (jarak < 1e-3)
-    for i in range(1, n):
-        if abs(x[i] - x[i - 1]) < 1e-3:      # Jika dua titik hampir sama
-            x[i] += (i + 1) * 1e-3           # Geser titik ke kanan sedikit agar berbeda
+def chebyshev_nodes(n):
+    """
+    Membuat node Chebyshev jenis pertama di interval [-1, 1]:
+        x_i = cos((2i - 1)π / (2n)),  i = 1..n
+    Titik tersebar lebih rapat di tepi interval (urutan menurun dari ~1 ke ~-1).
+    """
+    return np.cos(np.pi * (2 * np.arange(1, n + 1) - 1) / (2 * n))
+
 
-    return x                                 # Kembalikan array nodes yang sudah unik dan terurut
+def chebyshev_extrema_nodes(n):
+    """
+    Titik ekstrem Chebyshev (Chebyshev–Lobatto, jenis kedua) di [-1, 1]:
+        x_j = cos(jπ / (n - 1)),  j = 0..n-1
+    Termasuk kedua ujung interval (urutan menurun dari 1 ke -1).
+    """
+    if n == 1:
+        return np.zeros(1)
+    return np.cos(np.pi * np.arange(n) / (n - 1))
 
 
-def build_vandermonde(xs):
+def leja_order(x, return_index=False):
+    """
+    Mengurutkan ulang node dalam urutan Leja:
+        x_0 = argmax |x|,   x_k = argmax_i  prod_{j<k} |x_i - x_j|
+    Urutan ini membuat faktor-faktor (x_k - x_j) pada bentuk Newton dan
+    Björck–Pereyra tumbuh secara seimbang, sehingga jauh lebih stabil daripada
+    urutan terurut. Produk disimpan dalam bentuk jumlah logaritma (tanpa overflow);
+    setiap langkah satu operasi vektor O(n), total O(n^2).
+    return_index=True mengembalikan indeks urutan (x[idx] = node dalam urutan Leja).
+    """
+    x = np.asarray(x, dtype=float).ravel()
+    n = x.size
+    order = np.empty(n, dtype=np.intp)
+    if n == 0:
+        return order if return_index else x.copy()
+    log_prod = np.zeros(n)                   # sum_j log|x_i - x_j| untuk node terpilih j
+    available = np.ones(n, dtype=bool)
+    k = int(np.argmax(np.abs(x)))
+    for step in range(n):
+        order[step] = k
+        available[k] = False
+        if step == n - 1:
+            break
+        with np.errstate(divide="ignore"):   # log(0) = -inf untuk node yang sudah terpilih
+            log_prod += np.log(np.abs(x - x[k]))
+        k = int(np.argmax(np.where(available, log_prod, -np.inf)))
+    return order if return_index else x[order]
+
+
+NODE_FAMILIES = {
+    "equispaced": equispaced_nodes,
+    "chebyshev": chebyshev_nodes,
+    "chebyshev-extrema": chebyshev_extrema_nodes,
+    "leja": lambda n: leja_order(chebyshev_nodes(n)),   # Node Chebyshev dalam urutan Leja
+}
+
+
+def make_nodes(kind, n):
+    """Membuat n node dari keluarga `kind` (lihat NODE_FAMILIES)."""
+    try:
+        family = NODE_FAMILIES[kind]
+    except KeyError:
+        raise ValueError(f"Unknown node family: {kind}") from None
+    return family(n)
+
+
+# --------------------------
+# Node kompleks
+# --------------------------
+
+def roots_of_unity_nodes(n):
+    """
+    Akar satuan ke-n z_k = exp(2πik / n), k = 0..n-1 (bilangan kompleks pada lingkaran satuan).
+    V(z) / sqrt(n) uniter (V = matriks DFT), jadi κ₂(V) = 1: basis monomial terkondisi
+    sempurna. Tidak termasuk NODE_FAMILIES karena solver umum hanya menerima node real.
+    """
+    return np.exp(2j * np.pi * np.arange(n) / n)
+
+
+# --------------------------
+# Matriks Vandermonde
+# --------------------------
+
+def build_vandermonde(xs, ncols=None, out=None, dtype=np.float64, order="C", transpose=False):
     """
     Membangun matriks Vandermonde dengan basis monomial standar.
     Matriks ini digunakan untuk sistem interpolasi polinomial:
@@ -26,23 +117,44 @@ def build_vandermonde(xs):
     di mana:
         V[i, j] = (x_i)^j
     dengan:
-        - x_i adalah titik data (node)
-        - j adalah pangkat polinomial (0 sampai n-1)
-    
+        - x_i adalah titik data (node), i = 0..m-1
+        - j adalah pangkat polinomial (0 sampai ncols-1; default ncols = m, matriks persegi)
+
     Contoh:
     Jika xs = [1, 2, 3], maka:
         V =
         [[1, 1, 1],
          [1, 2, 4],
          [1, 3, 9]]
-    """
-
-    xs = np.array(xs, dtype=float)           # Pastikan xs berupa array float (bukan list)
-    n = len(xs)                              # Jumlah titik data (node)
-    V = np.zeros((n, n), dtype=float)        # Inisialisasi matriks V berukuran n×n dengan nol
 
-    # Isi setiap elemen matriks V[i, j] = x_i^j
-    for i in range(n):                       # Iterasi untuk setiap baris (setiap node)
-        for j in range(n):                   # Iterasi untuk setiap kolom (setiap pangkat)
-            V[i, j] = xs[i] ** j             # Hitung nilai pangkat dan simpan di V
-    return V                                 # Kembalikan matriks Vandermonde hasil konstruksi
\ No newline at end of file
+    Dibangun dengan rekursi pangkat (satu perkalian vektor per kolom, tanpa pow
+    per elemen). Pilihan tata letak:
+    - order="C" / "F"  : V (m×k) dalam tata letak baris (C) atau kolom (Fortran);
+                         "F" membuat setiap kolom pangkat kontigu (rekursi paling cepat)
+    - transpose=True   : mengembalikan V^T (k×m), misalnya untuk sistem transpos
+    - out              : buffer milik pemanggil (bentuk (m, k), atau (k, m) jika transpose)
+                         yang diisi di tempat; dtype dan order diabaikan
+    Node kompleks (misalnya roots_of_unity_nodes) menghasilkan V kompleks: dtype real
+    dinaikkan ke pasangan kompleksnya, dan buffer out real ditolak (ValueError).
+    """
+    xs = np.asarray(xs).ravel()
+    m = xs.size
+    k = m if ncols is None else int(ncols)
+    shape = (k, m) if transpose else (m, k)
+    complex_nodes = np.iscomplexobj(xs)
+    if out is None:
+        if complex_nodes:
+            dtype = np.result_type(dtype, xs.dtype)  # float64 → complex128, dst.
+        out = np.empty(shape, dtype=dtype, order=order)
+    elif out.shape != shape:
+        raise ValueError(f"Output buffer must have shape {shape}.")
+    elif complex_nodes and not np.iscomplexobj(out):
+        raise ValueError("Complex nodes need a complex output buffer.")
+    P = out if transpose else out.T          # View (pangkat, node): baris j = x^j
+    if k == 0:
+        return out
+    x = xs.astype(out.dtype, copy=False)
+    P[0] = 1.0
+    for j in range(1, k):
+        np.multiply(P[j - 1], x, out=P[j])   # x^j = x^(j-1) * x
+    return out
@@ -0,0 +1,93 @@
+import hashlib                         # Hash konten untuk kunci cache
+import json                            # Format entri cache (satu file per entri)
+import os
+from functools import lru_cache
+
+import numpy as np
+
+# Folder dan file sumber yang ikut menentukan versi kode (perubahan di sini membatalkan cache).
+# main_vandermonde.py ikut karena mendefinisikan isi baris yang di-cache
+# (RESULT_HEADER, metrik error, measured_columns).
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE_DIRS = ("algorithms", "utils")
+SOURCE_FILES = ("main_vandermonde.py",)
+
+
+@lru_cache(maxsize=None)
+def code_version(root=_PROJECT_ROOT, source_dirs=SOURCE_DIRS, source_files=SOURCE_FILES):
+    """
+    Hash SHA-256 dari seluruh file .py di source_dirs dan file source_files (beserta versi numpy).
+    Mengubah satu baris kode solver, metrik, builder, atau format baris hasil menghasilkan
+    versi baru, sehingga hasil lama di cache otomatis tidak dipakai lagi.
+    """
+    h = hashlib.sha256(np.__version__.encode())
+    for name in source_files:
+        path = os.path.join(root, name)
+        if os.path.exists(path):
+            h.update(name.encode())
+            with open(path, "rb") as f:
+                h.update(f.read())
+    for sub in source_dirs:
+        base = os.path.join(root, sub)
+        for dirpath, dirnames, filenames in os.walk(base):
+            dirnames.sort()                                 # Urutan jalan direktori deterministik
+            for name in sorted(filenames):
+                if not name.endswith(".py"):
+                    continue
+                path = os.path.join(dirpath, name)
+                h.update(os.path.relpath(path, root).encode())
+                with open(path, "rb") as f:
+                    h.update(f.read())
+    return h.hexdigest()
+
+
+def result_key(node_type, n, solver, seed, version=None, **params):
+    """
+    Kunci cache (hex SHA-256) untuk satu hasil (node_type, n, solver, seed, versi kode).
+    Parameter tambahan yang memengaruhi hasil (misalnya repeats) ikut masuk kunci lewat params.
+    """
+    fields = {
+        "nodes": node_type,
+        "n": int(n),
+        "solver": solver,
+        "seed": int(seed),
+        "version": version if version is not None else code_version(),
+        **params,
+    }
+    return hashlib.sha256(json.dumps(fields, sort_keys=True).encode()).hexdigest()
+
+
+class ResultCache:
+    """
+    Cache hasil di disk yang dialamatkan oleh konten (content-addressed).
+
+    Setiap entri disimpan sebagai <directory>/<2 karakter pertama kunci>/<kunci>.json
+    dan ditulis secara atomik (file sementara lalu os.replace), sehingga aman
+    dipakai beberapa proses worker sekaligus dan tidak rusak bila proses terhenti.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key + ".json")
+
+    def __contains__(self, key):
+        return os.path.exists(self._path(key))
+
+    def get(self, key, default=None):
+        """Membaca entri; default jika tidak ada atau file tidak terbaca."""
+        try:
+            with open(self._path(key)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return default
+
+    def put(self, key, value):
+        """Menyimpan entri (harus bisa di-serialisasi JSON) secara atomik."""
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(value, f)
+        os.replace(tmp, path)
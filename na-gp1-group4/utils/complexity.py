@@ -1,4 +1,16 @@
-def flops_lu(n):
+import numpy as np
+
+BYTES_PER_FLOAT = 8  # float64 = 8 byte per elemen
+BYTES_PER_FLOAT32 = 4  # float32 (faktor LU presisi campuran)
+BYTES_PER_INDEX = 8  # int64 untuk vektor pivot / indeks
+
+# Semua model di bawah memakai satuan yang sama:
+# - flops_*(n)  → jumlah operasi floating-point
+# - memory_*(n) → byte (bukan jumlah elemen) yang dipakai solver selain input x dan b
+# Model dideklarasikan sekali per solver di algorithms/registry.py.
+
+
+def flops_lu(n, nodes=None):
     """
     Menghitung perkiraan jumlah operasi floating-point (FLOPs)
     untuk metode LU decomposition dengan penyelesaian sistem segitiga.
@@ -10,87 +22,212 @@ def flops_lu(n):
     return (2.0 / 3.0) * n**3 + 2.0 * n**2
 
 
-def memory_lu(n):
+def memory_lu(n, nodes=None):
     """
-    Menghitung estimasi jumlah elemen memori yang digunakan (dalam satuan 'jumlah elemen'),
-    bukan byte, oleh metode LU.
+    Menghitung estimasi penggunaan memori (byte) oleh metode LU.
 
     Perkiraan:
-        ~ 3 * n^2 elemen (karena menyimpan matriks A, L, dan U yang semuanya berukuran n×n)
+        ~ n^2 elemen untuk array LU packed (L dan U disimpan dalam satu matriks n×n)
+        + n indeks untuk vektor pivot
+        + n elemen untuk vektor solusi
     """
-    return 3 * n * n
+    return (n * n + n) * BYTES_PER_FLOAT + n * BYTES_PER_INDEX
+
 
+REFINEMENT_STEPS = 3  # Langkah iterative refinement tipikal untuk LU presisi campuran
 
-def flops_bjorck_pereyra(n):
+
+def flops_lu_mixed(n, nodes=None):
+    """
+    Estimasi FLOPs LU presisi campuran: faktorisasi (2/3)*n^3 dalam float32
+    ditambah setiap langkah refinement (residual ~ 2*n^2 dan dua triangular
+    solve ~ 2*n^2). Jika refinement tidak konvergen, solver jatuh ke LU
+    float64 sehingga biaya sebenarnya mendekati flops_lu dua kali; jika batas
+    Gautschi sudah memastikan fallback, faktorisasi float32 dilewati (≈ flops_lu).
+    """
+    return flops_lu(n) + REFINEMENT_STEPS * 4.0 * n**2
+
+
+def memory_lu_mixed(n, nodes=None):
+    """
+    Estimasi memori (byte) LU presisi campuran: faktor packed n×n dalam float32
+    (separuh LU float64), vektor pivot, serta vektor solusi, residual, dan koreksi.
+    """
+    return n * n * BYTES_PER_FLOAT32 + 3 * n * BYTES_PER_FLOAT + n * BYTES_PER_INDEX
+
+
+def flops_newton(n, nodes=None):
+    """
+    Menghitung estimasi FLOPs untuk divided differences + konversi ke monomial.
+
+    - Divided differences: 3 operasi (dua pengurangan, satu pembagian) untuk
+      setiap pasangan (j, i > j) → ~ 1.5*n^2
+    - Konversi Newton → monomial: kali dan kurang per suku → ~ n^2
+    """
+    return 2.5 * n**2
+
+
+def memory_newton(n, nodes=None):
+    """
+    Menghitung estimasi penggunaan memori (byte) untuk Newton/DivDiff.
+
+    Vektor koefisien Newton, buffer polinomial, dan satu buffer kerja
+    (masing-masing n elemen).
+    """
+    return 3 * n * BYTES_PER_FLOAT
+
+
+def flops_bjorck_pereyra(n, nodes=None):
     """
     Menghitung estimasi jumlah operasi FLOPs untuk algoritma Björck–Pereyra.
 
-    Kompleksitas algoritma ini adalah O(n^2), karena melibatkan
-    forward dan backward sweeps (dua loop bersarang sederhana).
+    Kompleksitas algoritma ini adalah O(n^2):
+    - forward sweep: dua pengurangan dan satu pembagian per elemen → ~ 1.5*n^2
+    - backward sweep: satu perkalian dan satu pengurangan per elemen → ~ n^2
+    """
+    return 2.5 * n**2
+
+
+def memory_bjorck_pereyra(n, nodes=None):
+    """
+    Menghitung estimasi penggunaan memori (byte) untuk algoritma Björck–Pereyra.
+
+    Hanya membutuhkan vektor koefisien c (salinan b) dan satu vektor
+    sementara per level, masing-masing berukuran n elemen.
+    """
+    return 2 * n * BYTES_PER_FLOAT
+
+
+def flops_barycentric(n, nodes=None):
+    """
+    Menghitung estimasi FLOPs untuk interpolasi barycentric (pembentukan bobot).
+
+    - Node Chebyshev (jenis pertama atau titik ekstrem): bobot bentuk tertutup, ~ 4*n operasi
+    - Node sembarang: selisih, log|.|, dan penjumlahan untuk setiap pasangan → ~ 3*n^2
+    Evaluasi sesudahnya hanya ~ 4*n operasi per titik.
     """
-    return 2.0 * n**2
+    if nodes in ("chebyshev", "chebyshev-extrema"):
+        return 4.0 * n
+    return 3.0 * n**2
 
 
-def memory_bjorck_pereyra(n):
+def memory_barycentric(n, nodes=None):
     """
-    Menghitung estimasi penggunaan memori untuk algoritma Björck–Pereyra.
+    Menghitung estimasi penggunaan memori (byte) untuk interpolasi barycentric.
 
-    Hanya membutuhkan tiga vektor utama:
-        x (nodes), b (values), dan c (koefisien hasil),
-    masing-masing berukuran n elemen.
+    Vektor bobot w dan salinan nilai f (n elemen masing-masing); untuk node
+    sembarang ditambah satu blok selisih berukuran chunk (1024 baris) × n.
     """
-    return 3 * n
+    base = 2 * n * BYTES_PER_FLOAT
+    if nodes in ("chebyshev", "chebyshev-extrema"):
+        return base
+    return base + min(n, 1024) * n * BYTES_PER_FLOAT
+
 
+def flops_chebyshev_dct(n, nodes=None):
+    """
+    Menghitung estimasi FLOPs untuk koefisien Chebyshev via DCT.
 
-def estimate_flops(model: str, n: int) -> int:
+    Satu FFT kompleks berukuran n: ~ 5 * n * log2(n) operasi.
+    """
+    return 5.0 * n * max(1.0, np.log2(n))
+
+
+def memory_chebyshev_dct(n, nodes=None):
+    """
+    Menghitung estimasi penggunaan memori (byte) untuk DCT.
+
+    Vektor urutan ulang, buffer FFT kompleks (2 elemen per entri),
+    faktor fase kompleks, dan koefisien c.
+    """
+    return 7 * n * BYTES_PER_FLOAT
+
+
+def flops_subproduct_tree(n, nodes=None):
+    """
+    Menghitung estimasi FLOPs untuk interpolasi cepat lewat subproduct tree.
+
+    Di bawah FAST_MIN_N dipakai Björck–Pereyra. Di atasnya ada log2(n / LEAF_SIZE)
+    level pohon; setiap level berisi perkalian polinomial FFT dengan total panjang
+    ~2n (~3 FFT × 5 * 2n * log2(2n)), dijalankan untuk pembangunan pohon,
+    remainder tree M'(x_i) (beserta kebalikan deret), dan penggabungan Lagrange
+    (~4 lintasan). Daun dikerjakan kuadratik: ~4 * n * LEAF_SIZE.
+    """
+    from algorithms.fastpoly import FAST_MIN_N, LEAF_SIZE
+    if n < FAST_MIN_N:
+        return flops_bjorck_pereyra(n, nodes)
+    levels = max(1.0, np.log2(n / LEAF_SIZE))
+    return 4 * levels * 30.0 * n * np.log2(2 * n) + 4.0 * n * LEAF_SIZE
+
+
+def memory_subproduct_tree(n, nodes=None):
+    """
+    Menghitung estimasi penggunaan memori (byte) untuk subproduct tree.
+
+    Polinomial M di setiap level (total ~n koefisien per level) ditambah cache
+    kebalikan deret per simpul (ukuran serupa), buffer FFT, serta tabel
+    pembagian sintetis daun (n × LEAF_SIZE).
+    """
+    from algorithms.fastpoly import FAST_MIN_N, LEAF_SIZE
+    if n < FAST_MIN_N:
+        return memory_bjorck_pereyra(n, nodes)
+    levels = max(1.0, np.log2(n / LEAF_SIZE))
+    return (2 * levels * n + 4 * n + n * LEAF_SIZE) * BYTES_PER_FLOAT
+
+
+def estimate_flops(model: str, n: int, nodes=None) -> float:
     """
     Mengestimasi jumlah operasi floating-point (FLOPs) berdasarkan model solver yang digunakan.
 
     Parameter:
     - model : str
-        Nama metode (misalnya 'LU', 'newton', 'vandermonde')
+        Kunci atau label solver yang terdaftar di algorithms/registry.py
+        (misalnya 'lu', 'newton', 'Barycentric')
     - n : int
         Ukuran matriks atau banyaknya titik (nodes)
 
     Return:
-    - int : estimasi jumlah operasi
+    - float : estimasi jumlah operasi
 
-    Logika:
-    - Jika model dimulai dengan 'lu' → gunakan rumus O(n^3)
-    - Jika mengandung kata 'newton' → gunakan O(n^2)
-    - Jika bukan keduanya → asumsi umum O(n^3)
+    Nama solver yang tidak terdaftar menghasilkan ValueError (tidak ada
+    asumsi O(n^3) diam-diam untuk solver yang tidak dikenal).
     """
-    if model.lower().startswith("lu"):
-        return (2 / 3) * n**3
-    elif "newton" in model.lower():
-        return n**2
-    else:
-        return n**3
+    from algorithms.registry import get_solver  # Import lokal: registry memakai modul ini
+    return get_solver(model).flops(n, nodes)
 
 
-def estimate_memory_bytes(model: str, n: int) -> int:
+def estimate_memory_bytes(model: str, n: int, nodes=None) -> float:
     """
     Mengestimasi jumlah penggunaan memori (dalam satuan byte)
-    berdasarkan model solver yang digunakan.
+    berdasarkan model solver yang terdaftar di algorithms/registry.py.
+    Nama solver yang tidak terdaftar menghasilkan ValueError.
+    """
+    from algorithms.registry import get_solver
+    return get_solver(model).memory_bytes(n, nodes)
 
-    Parameter:
-    - model : str
-        Nama metode (misalnya 'LU', 'newton', dll)
-    - n : int
-        Ukuran matriks atau banyaknya titik
 
-    Return:
-    - int : estimasi penggunaan memori dalam byte
-
-    Asumsi:
-    - Tipe data float64 → 8 byte per elemen
-    - LU membutuhkan n^2 elemen
-    - Newton hanya butuh vektor ukuran n
-    - Model lain dianggap seperti LU (n^2)
-    """
-    if model.lower().startswith("lu"):
-        return n**2 * 8  # float64 = 8 byte per elemen
-    elif "newton" in model.lower():
-        return n * 8     # hanya vektor, bukan matriks penuh
-    else:
-        return n**2 * 8  # asumsi umum untuk metode berbasis matriks
+def achieved_gflops(flops, time_ms):
+    """
+    Menghitung laju FLOP yang dicapai (GFLOP/s) dari jumlah operasi model
+    dan waktu terukur (milidetik). Dipakai untuk membandingkan model
+    kompleksitas dengan kinerja nyata.
+    """
+    if time_ms <= 0:
+        return float("nan")
+    return flops / (time_ms * 1e-3) / 1e9
+
+
+def fit_scaling_exponent(ns, values):
+    """
+    Mencocokkan hukum pangkat values ≈ C * n^p dengan regresi linear pada skala log-log.
+    Dipakai untuk waktu terukur (eksponen empiris) maupun model FLOPs (eksponen model).
+
+    Return: eksponen p (NaN jika kurang dari dua titik positif).
+    """
+    ns = np.asarray(ns, dtype=float)
+    values = np.asarray(values, dtype=float)
+    ok = (ns > 0) & (values > 0) & np.isfinite(values)
+    if np.unique(ns[ok]).size < 2:
+        return float("nan")
+    slope, _ = np.polyfit(np.log(ns[ok]), np.log(values[ok]), 1)
+    return float(slope)
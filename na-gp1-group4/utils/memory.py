@@ -0,0 +1,27 @@
+import tracemalloc                     # Pelacak alokasi memori Python (numpy ikut melaporkan alokasinya)
+
+
+def measure_peak_memory(func, *args, **kwargs):
+    """
+    Mengukur puncak alokasi memori (byte) selama func(*args, **kwargs) berjalan.
+
+    Memakai tracemalloc: numpy melaporkan buffer array ke tracemalloc, sehingga
+    matriks sementara (misalnya P, L, U padat atau array baru di setiap iterasi)
+    ikut terhitung. Yang dilaporkan adalah puncak di atas pemakaian sebelum
+    pemanggilan. Tracemalloc memperlambat eksekusi, jadi jangan dipakai
+    bersamaan dengan pengukuran waktu.
+
+    Return: (hasil func, peak_bytes)
+    """
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()  # Pemakaian sebelum pemanggilan
+    try:
+        result = func(*args, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    return result, max(0, peak - baseline)
@@ -1,5 +1,8 @@
 import numpy as np  # Mengimpor numpy untuk operasi numerik matriks dan vektor
 
+from algorithms.lu import LUFactorization  # Faktorisasi LU packed yang bisa dipakai ulang
+from utils.builders import build_vandermonde
+
 def norm1(A):
     """
     Menghitung norma-1 dari matriks atau vektor A.
@@ -24,6 +27,19 @@ def norm_inf(A):
     return np.max(np.sum(np.abs(A), axis=1))     # Jika matriks: maksimum dari jumlah per baris
 
 
+def _solvers_for(A, solve):
+    """
+    Menyiapkan dua fungsi solve(b) untuk A dan A^T.
+    - Jika `solve` adalah objek faktorisasi (punya .solve dan .solve_transpose),
+      misalnya LUFactorization atau VandermondeSolver, faktorisasi itu dipakai
+      ulang untuk kedua sistem tanpa faktorisasi ulang.
+    - Jika `solve` adalah callable solve(M, b), perilaku lama dipertahankan.
+    """
+    if hasattr(solve, "solve") and hasattr(solve, "solve_transpose"):
+        return solve.solve, solve.solve_transpose
+    return (lambda b: solve(A, b)), (lambda b: solve(A.T, b))
+
+
 def hager_1norm_condest(A, solve):
     """
     Mengestimasi condition number 1-norm (cond_1(A)) dengan algoritma iteratif mirip Hager (1984).
@@ -35,14 +51,17 @@ def hager_1norm_condest(A, solve):
     Parameter:
     - A : ndarray
         Matriks persegi yang ingin dihitung kondisi numeriknya.
-    - solve : callable
-        Fungsi pemecah sistem linear (custom solver) yang bisa menyelesaikan A x = b.
-        Misalnya, solve = lambda A, b: np.linalg.solve(A, b)
+    - solve : objek faktorisasi atau callable
+        Sebaiknya faktorisasi yang sudah ada (LUFactorization / VandermondeSolver),
+        sehingga setiap iterasi hanya O(n^2).
+        Bisa juga fungsi pemecah sistem linear yang menyelesaikan A x = b,
+        misalnya solve = lambda A, b: np.linalg.solve(A, b)
 
     Return:
     - cond_est : perkiraan condition number berdasarkan norma-1.
     - ainv_norm_est : perkiraan norma-1 dari A^{-1}.
     """
+    solve_a, solve_at = _solvers_for(A, solve)   # Solver untuk A dan A^T
     n = A.shape[0]                               # Ukuran matriks (jumlah baris)
     x = np.ones(n) / n                           # Inisialisasi vektor awal x = [1/n, 1/n, ..., 1/n]
     est_old = 0.0                                # Nilai estimasi sebelumnya (untuk konvergensi)
@@ -53,7 +72,7 @@ def hager_1norm_condest(A, solve):
         s[s == 0] = 1.0                          # Jika ada nilai nol, ubah menjadi +1
 
         # Selesaikan sistem A^T * y = s
-        y = solve(A.T, s)
+        y = solve_at(s)
 
         # Pilih indeks j di mana |y_j| maksimum
         j = int(np.argmax(np.abs(y)))
@@ -63,7 +82,7 @@ def hager_1norm_condest(A, solve):
         e[j] = 1.0
 
         # Selesaikan sistem A * z = e_j → z ≈ kolom j dari A^{-1}
-        z = solve(A, e)
+        z = solve_a(e)
 
         # Estimasi norma 1 dari A^{-1} sebagai jumlah nilai absolut dari z
         est = np.sum(np.abs(z))
@@ -81,6 +100,104 @@ def hager_1norm_condest(A, solve):
     return a1 * est_old, est_old                 # Kembalikan (cond_1(A) ~ ||A||_1 * ||A^{-1}||_1, ||A^{-1}||_1)
 
 
+def _parallel_columns(S, T):
+    """Untuk tiap kolom S (vektor ±1), cek apakah sejajar dengan salah satu kolom T."""
+    if T.shape[1] == 0:
+        return np.zeros(S.shape[1], dtype=bool)
+    return np.any(np.abs(T.T @ S) == S.shape[0], axis=0)
+
+
+def higham_tisseur_condest(A, solve, t=2, itmax=5, seed=0):
+    """
+    Estimasi blok condition number 1-norm (Higham & Tisseur, 2000).
+
+    Versi blok dari estimator Hager: setiap iterasi bekerja dengan t vektor
+    sekaligus (solve multi-ruas-kanan), sehingga estimasi lebih tajam dan
+    lebih jarang terjebak di maksimum lokal. Biaya per iterasi adalah dua
+    solve blok berukuran (n, t) memakai faktorisasi yang sama.
+
+    Parameter:
+    - A : ndarray
+        Matriks persegi (hanya dipakai untuk ||A||_1).
+    - solve : objek faktorisasi atau callable, sama seperti hager_1norm_condest.
+    - t : int
+        Banyaknya kolom blok (t=1 setara dengan Hager).
+    - itmax : int
+        Batas jumlah iterasi.
+    - seed : int
+        Seed untuk kolom awal acak ±1 (hasil reproducible).
+
+    Return:
+    - cond_est : perkiraan condition number berdasarkan norma-1.
+    - ainv_norm_est : perkiraan norma-1 dari A^{-1}.
+    """
+    solve_a, solve_at = _solvers_for(A, solve)   # Solver untuk A dan A^T
+    n = A.shape[0]
+    t = max(1, min(int(t), n))
+    a1 = norm1(A)                                # Hitung norma-1 dari A
+    if 2.0 ** (n - 1) <= 2 * t:
+        # Matriks sangat kecil: vektor ±1 yang tidak sejajar tidak cukup,
+        # jadi ||A^{-1}||_1 dihitung langsung dari A^{-1} I
+        ainv = norm1(solve_a(np.eye(n)))
+        return a1 * ainv, ainv
+    rng = np.random.default_rng(seed)
+
+    # Blok awal: kolom pertama semua 1, sisanya acak ±1 yang tidak saling sejajar
+    X = np.ones((n, t))
+    for j in range(1, t):
+        X[:, j] = rng.choice([-1.0, 1.0], size=n)
+        while _parallel_columns(X[:, j:j + 1], X[:, :j])[0]:
+            X[:, j] = rng.choice([-1.0, 1.0], size=n)
+    X /= n
+
+    visited = np.zeros(n, dtype=bool)            # Indeks e_j yang sudah pernah dipakai
+    ind = np.zeros(t, dtype=int)
+    ind_best = 0
+    est_old = 0.0
+    S = np.zeros((n, 0))
+    for k in range(1, itmax + 1):
+        Y = solve_a(X).reshape(n, t)             # Y = A^{-1} X (satu solve blok)
+        col_norms = np.sum(np.abs(Y), axis=0)
+        j = int(np.argmax(col_norms))
+        est = col_norms[j]
+        if est > est_old or k == 2:
+            ind_best = ind[j]
+        if k >= 2 and est <= est_old:            # Tidak ada peningkatan → selesai
+            est = est_old
+            break
+        est_old = est
+        if k == itmax:
+            break
+
+        S_old = S
+        S = np.sign(Y)
+        S[S == 0] = 1.0
+        if np.all(_parallel_columns(S, S_old)):  # Semua arah tanda sudah pernah dicoba
+            break
+        # Kolom S yang sejajar dengan kolom lain diganti vektor ±1 acak
+        for j in range(t):
+            while t > 1 and (_parallel_columns(S[:, j:j + 1], S[:, :j])[0]
+                             or _parallel_columns(S[:, j:j + 1], S_old)[0]):
+                S[:, j] = rng.choice([-1.0, 1.0], size=n)
+
+        Z = solve_at(S).reshape(n, t)            # Z = A^{-T} S (satu solve blok)
+        h = np.max(np.abs(Z), axis=1)
+        if k >= 2 and h.max() == h[ind_best]:    # Gradien tidak menunjuk indeks baru
+            break
+        order = np.argsort(-h, kind="stable")
+        if t > 1:
+            if np.all(visited[order[:t]]):
+                break
+            # Prioritaskan indeks yang belum pernah dipakai
+            order = np.concatenate([order[~visited[order]], order[visited[order]]])
+        ind = order[:t]
+        X = np.zeros((n, t))
+        X[ind, np.arange(t)] = 1.0               # Blok berikutnya: vektor satuan e_ind
+        visited[ind] = True
+
+    return a1 * est_old, est_old
+
+
 def relative_error(pred, true):
     """
     Menghitung error relatif antara dua vektor atau hasil prediksi.
@@ -92,14 +209,125 @@ def relative_error(pred, true):
     return np.linalg.norm(pred - true) / np.linalg.norm(true)
 
 
-def compute_condition_number(A):
+def compute_condition_number(A, factorization=None, method="hager", t=2):
     """
-    Menghitung condition number (κ) dari matriks A dengan menggunakan norma-1.
+    Menghitung (estimasi) condition number (κ) dari matriks A dengan menggunakan norma-1.
 
     Secara matematis:
         κ₁(A) = ||A||₁ * ||A⁻¹||₁
 
-    Fungsi ini menggunakan implementasi built-in NumPy (np.linalg.cond)
-    yang secara default menghitung nilai singular terbesar / terkecil dari A.
+    ||A⁻¹||₁ diestimasi tanpa membentuk invers secara eksplisit:
+    - factorization : LUFactorization / VandermondeSolver yang sudah ada.
+      Jika diberikan, estimasi hanya menambah biaya O(n^2) per iterasi.
+      Jika None, A difaktorkan sekali dengan LUFactorization.
+    - method : "hager" (satu vektor per iterasi) atau
+      "higham-tisseur" (versi blok dengan t kolom, estimasi lebih tajam).
+    """
+    if factorization is None:
+        factorization = LUFactorization(A)       # Faktorisasi sekali (bukan invers penuh)
+    if method == "hager":
+        cond, _ = hager_1norm_condest(A, factorization)
+    elif method == "higham-tisseur":
+        cond, _ = higham_tisseur_condest(A, factorization, t=t)
+    else:
+        raise ValueError(f"Unknown condition estimator: {method}")
+    return cond
+
+
+# --------------------------
+# Batas kondisi Vandermonde (Gautschi)
+# --------------------------
+# Untuk V[i, j] = x_i^j, kolom ke-i dari V⁻¹ berisi koefisien polinomial Lagrange ℓ_i, sehingga
+#     max_i prod_{j≠i} max(1, |x_j|) / |x_i - x_j|  <=  ||V⁻¹||₁  <=  max_i prod_{j≠i} (1 + |x_j|) / |x_i - x_j|
+# (Gautschi 1962, 1990). Pembilang cukup satu jumlah log O(n); penyebut
+# prod_{j≠i} |x_i - x_j| = 1 / |w_i| (bobot barycentric) O(n^2) untuk node umum,
+# atau O(n) dari bentuk tertutup untuk keluarga node yang dikenal. Semua dihitung
+# dalam bentuk logaritma agar tidak overflow; hasil yang melampaui float64 menjadi inf.
+
+def _log_node_separation_generic(x, chunk_size=1024):
+    """log prod_{j≠i} |x_i - x_j| untuk setiap i, O(n^2) waktu dan O(n * chunk_size) memori."""
+    n = x.size
+    out = np.empty(n)
+    with np.errstate(divide="ignore"):          # Node duplikat → log 0 = -inf (batas tak hingga)
+        for start in range(0, n, chunk_size):
+            stop = min(start + chunk_size, n)
+            D = np.abs(x[start:stop, None] - x[None, :])
+            D[np.arange(stop - start), np.arange(start, stop)] = 1.0  # Lewati j = i
+            out[start:stop] = np.log(D).sum(axis=1)
+    return out
+
+
+def _log_node_separation_family(node_type, n):
+    """
+    Bentuk tertutup O(n) untuk log prod_{j≠i} |x_i - x_j| pada keluarga node utils/builders.py,
+    atau None jika keluarga tidak dikenal. Rumus simetris terhadap pembalikan urutan dan
+    dipasangkan dengan node terurut; batas tidak bergantung pada urutan node (maksimum atas i),
+    sehingga "leja" memakai rumus Chebyshev.
+    """
+    if n == 1:
+        return np.zeros(1)
+    if node_type in ("chebyshev", "leja"):
+        # x_i = cos θ_i: prod_{j≠i} |x_i - x_j| = |T_n'(x_i)| / 2^{n-1} = n / (2^{n-1} sin θ_i)
+        theta = np.pi * (2 * np.arange(1, n + 1) - 1) / (2 * n)
+        return np.log(n) - (n - 1) * np.log(2.0) - np.log(np.sin(theta))
+    if node_type == "chebyshev-extrema":
+        # Ekstrem Chebyshev (N = n - 1): prod = N / (2^{N-1} δ_i), δ = 1/2 di ujung, 1 di dalam
+        N = n - 1
+        delta = np.ones(n)
+        delta[[0, -1]] = 0.5
+        return np.log(N) - (N - 1) * np.log(2.0) - np.log(delta)
+    if node_type == "equispaced":
+        # x_i = -1 + i h, h = 2/(n-1): prod = h^{n-1} i! (n-1-i)!
+        log_fact = np.concatenate([[0.0], np.cumsum(np.log(np.arange(1, n)))])  # log k!, k = 0..n-1
+        return (n - 1) * np.log(2.0 / (n - 1)) + log_fact + log_fact[::-1]
+    return None
+
+
+def vandermonde_norm1(x):
+    """||V||₁ = max_j sum_i |x_i|^j = max(n, sum_i |x_i|^{n-1}) (jumlah eksponensial konveks di j), O(n)."""
+    x = np.abs(np.asarray(x, dtype=float).ravel())
+    return max(float(x.size), float(np.sum(x ** (x.size - 1))))
+
+
+def vandermonde_inverse_bounds(x, node_type=None):
+    """
+    Batas bawah dan atas Gautschi untuk ||V⁻¹||₁ dengan V[i, j] = x_i^j, tanpa membentuk V.
+
+    - node_type=None   : node umum, O(n^2) tervektorisasi
+    - node_type dikenal: ("chebyshev", "chebyshev-extrema", "equispaced", "leja")
+                         bentuk tertutup O(n); x harus node keluarga tersebut (make_nodes)
+    Return: (lower, upper)
+    """
+    x = np.asarray(x, dtype=float).ravel()
+    log_sep = _log_node_separation_family(node_type, x.size) if node_type is not None else None
+    if log_sep is not None:
+        x = np.sort(x)                          # Rumus tertutup simetris: berlaku untuk urutan naik
+    else:
+        log_sep = _log_node_separation_generic(x)
+    ax = np.abs(x)
+    log_up = np.log1p(ax)                       # log(1 + |x_j|)
+    log_lo = np.log(np.maximum(1.0, ax))        # log max(1, |x_j|)
+    # prod_{j≠i} a_j = exp(sum_j log a_j - log a_i): satu jumlah untuk semua i
+    with np.errstate(over="ignore"):
+        lower = np.exp(np.max(log_lo.sum() - log_lo - log_sep))
+        upper = np.exp(np.max(log_up.sum() - log_up - log_sep))
+    return float(lower), float(upper)
+
+
+def vandermonde_condition_bounds(x, node_type=None, estimate=False, factorization=None, method="hager"):
+    """
+    Batas murah untuk κ₁(V) = ||V||₁ ||V⁻¹||₁ dari node saja: O(n^2) untuk node umum,
+    O(n) untuk keluarga node yang dikenal, tanpa faktorisasi. Cocok sebagai pemeriksaan
+    awal sebelum memilih solver.
+
+    Return: (cond_lower, cond_upper), atau dengan estimate=True
+            (cond_lower, cond_upper, cond_est) dengan cond_est dari compute_condition_number
+            (membentuk V dan memakai factorization jika diberikan, selain itu LU baru O(n^3)).
     """
-    return np.linalg.cond(A, 1)                  # Menggunakan norma-1 untuk menghitung condition number
+    anorm = vandermonde_norm1(x)
+    lower, upper = vandermonde_inverse_bounds(x, node_type)
+    bounds = (anorm * lower, anorm * upper)
+    if not estimate:
+        return bounds
+    V = build_vandermonde(np.asarray(x, dtype=float))  # ||A||₁ pada estimator membutuhkan V padat
+    return bounds + (compute_condition_number(V, factorization=factorization, method=method),)
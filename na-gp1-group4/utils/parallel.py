@@ -0,0 +1,99 @@
+import multiprocessing as mp                          # Konteks proses (spawn) untuk worker
+import os                                             # Variabel lingkungan untuk jumlah thread BLAS
+import sys                                            # Cek apakah numpy sudah di-import
+import warnings
+import zlib                                           # Hash stabil untuk nama jenis node
+from concurrent.futures import ProcessPoolExecutor    # Pool proses untuk sel-sel eksperimen
+from contextlib import contextmanager
+
+# numpy sengaja tidak di-import di tingkat modul: set_blas_threads() harus bisa dipanggil
+# sebelum numpy dimuat (lihat main_vandermonde.py).
+
+# Variabel lingkungan yang dibaca oleh pustaka BLAS/OpenMP umum saat numpy di-import
+BLAS_THREAD_VARS = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+)
+
+
+def cell_rng(seed, node_type, n):
+    """
+    Membuat generator acak untuk satu sel (node_type, n) eksperimen.
+    Seed diturunkan dari (seed, n, node_type) lewat SeedSequence sehingga setiap
+    sel punya aliran acak sendiri yang sama persis di mode serial maupun paralel,
+    tidak bergantung pada worker mana atau urutan sel dijalankan.
+    """
+    import numpy as np
+    ss = np.random.SeedSequence([int(seed), int(n), zlib.crc32(node_type.encode())])
+    return np.random.default_rng(ss)
+
+
+def set_blas_threads(n_threads):
+    """
+    Membatasi jumlah thread BLAS di proses ini (juga untuk mode serial).
+    Sebelum numpy di-import cukup lewat variabel lingkungan BLAS_THREAD_VARS; setelahnya
+    batas dipasang lewat threadpoolctl jika terpasang (opsional). Jika keduanya tidak
+    mungkin, batas dianggap berlaku bila variabel lingkungan sudah bernilai n_threads.
+    Return: True jika batas berlaku.
+    """
+    value = str(int(n_threads))
+    if "numpy" not in sys.modules:
+        for name in BLAS_THREAD_VARS:
+            os.environ[name] = value
+        return True
+    try:
+        from threadpoolctl import threadpool_limits
+    except ImportError:
+        return all(os.environ.get(name) == value for name in BLAS_THREAD_VARS)
+    threadpool_limits(limits=int(n_threads), user_api="blas")
+    return True
+
+
+@contextmanager
+def blas_thread_env(n_threads):
+    """
+    Context manager yang sementara mengatur jumlah thread BLAS lewat variabel lingkungan.
+    Hanya berpengaruh pada proses yang dibuat (dan meng-import numpy) di dalam blok ini,
+    karena pustaka BLAS membaca nilainya saat inisialisasi.
+    """
+    saved = {name: os.environ.get(name) for name in BLAS_THREAD_VARS}
+    for name in BLAS_THREAD_VARS:
+        os.environ[name] = str(int(n_threads))
+    try:
+        yield
+    finally:
+        for name, value in saved.items():   # Kembalikan nilai semula
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+def map_cells(func, tasks, workers=1, blas_threads=1):
+    """
+    Menjalankan func(*task) untuk setiap task dan menghasilkan (yield) hasilnya
+    dalam urutan yang sama dengan `tasks` (urutan CSV deterministik).
+
+    - workers <= 1 : mode serial di proses ini (untuk pengukuran waktu satu core yang bersih);
+                     batas blas_threads dipasang lewat set_blas_threads
+    - workers > 1  : pool proses dengan konteks "spawn"; setiap worker memulai
+                     numpy baru dengan blas_threads thread sehingga tidak terjadi
+                     oversubscription (workers × thread BLAS melebihi jumlah core).
+    func harus fungsi tingkat modul agar bisa dikirim ke worker.
+    """
+    tasks = list(tasks)
+    if workers <= 1 or len(tasks) <= 1:
+        if not set_blas_threads(blas_threads):
+            warnings.warn(f"Cannot limit BLAS to {blas_threads} thread(s) after numpy was imported; "
+                          "install threadpoolctl or set OMP_NUM_THREADS/OPENBLAS_NUM_THREADS.",
+                          RuntimeWarning, stacklevel=2)
+        for task in tasks:
+            yield func(*task)
+        return
+    with blas_thread_env(blas_threads):
+        ctx = mp.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+            yield from pool.map(func, *zip(*tasks))
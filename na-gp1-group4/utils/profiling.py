@@ -0,0 +1,189 @@
+import json                            # Ekspor Chrome trace (format JSON)
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# Instrumentasi opsional per fase solver: span bernama (bersarang) dengan timer nanodetik
+# dan counter (misalnya row_swaps, bytes_allocated).
+#
+# Cara pakai:
+#     with profiling.profile("trace.json") as prof:   # Aktif hanya di dalam blok ini
+#         solve_lu(A, b)
+#     print(prof.format_summary())
+#
+# Di dalam kode solver:
+#     with profiling.span("pivot_search"):
+#         ...
+#     profiling.count("row_swaps")
+#
+# Saat tidak aktif, span() mengembalikan satu objek no-op bersama dan count() langsung
+# kembali: biayanya satu pemanggilan fungsi dan satu pengecekan atribut, tanpa alokasi.
+# Profiler aktif disimpan per thread (threading.local): profile() hanya mencatat thread
+# yang mengaktifkannya, dan thread lain (misalnya solver yang berjalan paralel) tidak
+# menulis ke stack span-nya. Proses worker juga tidak ikut tercatat.
+
+_state = threading.local()              # _state.active: profiler aktif thread ini (None = mati)
+
+
+class _NullSpan:
+    """Span no-op yang dipakai saat profiling mati."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def count(self, name, value=1):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("profiler", "name", "args", "counters", "path", "start")
+
+    def __init__(self, profiler, name, args):
+        self.profiler = profiler
+        self.name = name
+        self.args = args
+        self.counters = {}
+
+    def __enter__(self):
+        stack = self.profiler._stack
+        self.path = (stack[-1].path if stack else ()) + (self.name,)
+        stack.append(self)
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter_ns()
+        self.profiler._stack.pop()
+        self.profiler.events.append((self.path, self.start, end - self.start, self.args, self.counters))
+        return False
+
+    def count(self, name, value=1):
+        self.counters[name] = self.counters.get(name, 0) + value
+
+
+class Profiler:
+    """
+    Pengumpul span dan counter.
+
+    - events : daftar (path, start_ns, dur_ns, args, counters) untuk setiap span yang selesai,
+               path = tuple nama span dari luar ke dalam
+    - summary()           : agregasi per path (jumlah panggilan, waktu total, waktu sendiri, counter)
+    - write_chrome_trace  : JSON untuk chrome://tracing / Perfetto / speedscope
+    - write_folded        : stack terlipat "a;b;c <ns>" untuk flamegraph.pl / speedscope
+    """
+
+    def __init__(self):
+        self.events = []
+        self.counters = {}              # Counter di luar span mana pun
+        self._stack = []
+        self.origin = time.perf_counter_ns()
+
+    def _count(self, name, value):
+        target = self._stack[-1].counters if self._stack else self.counters
+        target[name] = target.get(name, 0) + value
+
+    def summary(self):
+        """
+        Agregasi per path span, terurut menurut waktu total (terbesar dulu).
+        Waktu sendiri (self_ns) = waktu total dikurangi waktu span anak langsung.
+        """
+        rows = {}
+        for path, _, dur, _, counters in self.events:
+            row = rows.setdefault(path, {"path": path, "calls": 0, "total_ns": 0, "self_ns": 0, "counters": {}})
+            row["calls"] += 1
+            row["total_ns"] += dur
+            row["self_ns"] += dur
+            for name, value in counters.items():
+                row["counters"][name] = row["counters"].get(name, 0) + value
+        for path, _, dur, _, _ in self.events:
+            if len(path) > 1 and path[:-1] in rows:
+                rows[path[:-1]]["self_ns"] -= dur
+        return sorted(rows.values(), key=lambda row: -row["total_ns"])
+
+    def format_summary(self, limit=20):
+        """Tabel teks ringkasan (limit baris teratas)."""
+        lines = [f"{'span':<60} {'calls':>8} {'total_ms':>10} {'self_ms':>10}  counters"]
+        for row in self.summary()[:limit]:
+            counters = ", ".join(f"{k}={v}" for k, v in sorted(row["counters"].items()))
+            lines.append(f"{';'.join(row['path']):<60} {row['calls']:>8} "
+                         f"{row['total_ns'] / 1e6:>10.3f} {row['self_ns'] / 1e6:>10.3f}  {counters}")
+        return "\n".join(lines)
+
+    def write_chrome_trace(self, path):
+        """Menulis Chrome trace JSON (event 'X' lengkap, waktu dalam mikrodetik)."""
+        pid = os.getpid()
+        trace = [
+            {
+                "name": span_path[-1], "cat": "solver", "ph": "X", "pid": pid, "tid": 0,
+                "ts": (start - self.origin) / 1e3, "dur": dur / 1e3,
+                "args": {**{k: _jsonable(v) for k, v in args.items()}, **counters},
+            }
+            for span_path, start, dur, args, counters in self.events
+        ]
+        with open(path, "w") as f:
+            json.dump({"traceEvents": trace, "displayTimeUnit": "ns", "otherData": {"counters": self.counters}}, f)
+
+    def write_folded(self, path):
+        """Menulis stack terlipat: satu baris 'a;b;c <waktu sendiri ns>' per path."""
+        with open(path, "w") as f:
+            for row in sorted(self.summary(), key=lambda row: row["path"]):
+                if row["self_ns"] > 0:
+                    f.write(f"{';'.join(row['path'])} {row['self_ns']}\n")
+
+    def save(self, path):
+        """Menyimpan hasil: Chrome trace untuk *.json, stack terlipat untuk ekstensi lain."""
+        if path.endswith(".json"):
+            self.write_chrome_trace(path)
+        else:
+            self.write_folded(path)
+
+
+def _jsonable(value):
+    return value if isinstance(value, (str, int, float, bool)) or value is None else str(value)
+
+
+def enabled():
+    """True jika ada profiler aktif di thread ini."""
+    return getattr(_state, "active", None) is not None
+
+
+def span(name, **args):
+    """Span bernama (context manager); no-op bersama jika profiling mati."""
+    prof = getattr(_state, "active", None)
+    if prof is None:
+        return _NULL_SPAN
+    return _Span(prof, name, args)
+
+
+def count(name, value=1):
+    """Menambah counter pada span terdalam yang sedang terbuka (no-op jika profiling mati)."""
+    prof = getattr(_state, "active", None)
+    if prof is None:
+        return
+    prof._count(name, value)
+
+
+@contextmanager
+def profile(path=None):
+    """
+    Mengaktifkan profiling di dalam blok with; menghasilkan objek Profiler.
+    Jika path diberikan, hasil disimpan saat blok selesai (lihat Profiler.save).
+    Profiler sebelumnya (jika bersarang) dipulihkan setelah blok. Hanya thread pemanggil
+    yang dicatat.
+    """
+    previous, prof = getattr(_state, "active", None), Profiler()
+    _state.active = prof
+    try:
+        yield prof
+    finally:
+        _state.active = previous
+        if path is not None:
+            prof.save(path)
@@ -20,3 +20,38 @@ def timer():
     yield lambda: time.perf_counter() - start  
     # 'yield' mengembalikan fungsi lambda yang jika dipanggil akan menghitung selisih waktu saat ini - waktu awal.
     # Jadi, saat blok 'with' selesai, kita bisa memanggil t() untuk mengetahui berapa lama waktu yang berlalu.
+
+
+def autorange(func, min_time=0.02, max_loops=1 << 20):
+    """
+    Mengkalibrasi jumlah pemanggilan (loops) per sampel secara otomatis.
+    Jumlah loop digandakan sampai satu sampel (loops kali func()) berlangsung
+    minimal min_time detik, sehingga fungsi yang sangat cepat (misalnya n=5)
+    tidak didominasi resolusi timer dan noise.
+
+    Return: jumlah loops per sampel.
+    """
+    loops = 1
+    while True:
+        with timer() as t:
+            for _ in range(loops):
+                func()
+        elapsed = t()
+        if elapsed >= min_time or loops >= max_loops:
+            return loops
+        # Perkiraan loops yang dibutuhkan, minimal digandakan
+        loops = min(max_loops, max(2 * loops, int(loops * min_time / max(elapsed, 1e-9))))
+
+
+def sample_times(func, loops, repeats):
+    """
+    Mengambil `repeats` sampel waktu; setiap sampel menjalankan func() sebanyak
+    `loops` kali. Return: list waktu per pemanggilan (detik) untuk setiap sampel.
+    """
+    samples = []
+    for _ in range(repeats):
+        with timer() as t:
+            for _ in range(loops):
+                func()
+        samples.append(t() / loops)
+    return samples